@@ -0,0 +1,96 @@
+"""Compares solving an abstracted game to solving the unabstracted game."""
+
+import dataclasses
+import time
+from typing import Callable, Optional
+
+from dd_cfr.algorithms import cfr, exploitability, policy
+from dd_cfr.games import abstraction, base_game
+
+
+@dataclasses.dataclass
+class SolveStatistics:
+    """Table size, speed, and quality of a single solve."""
+
+    #: Number of (possibly abstract) states in the tables.
+    states: int
+    #: Number of state/action entries in the tables.
+    entries: int
+    #: Wall-clock time per iteration.
+    seconds_per_iteration: float
+    #: Exploitability of the computed policy in the unabstracted game.
+    exploitability: float
+
+
+@dataclasses.dataclass
+class AbstractionReport:
+    """Statistics of an abstracted solve relative to the unabstracted baseline."""
+
+    baseline: SolveStatistics
+    abstracted: SolveStatistics
+
+    def get_memory_ratio(self) -> float:
+        """Return how many times fewer table entries the abstracted solve needs.
+
+        :return: Baseline entries divided by abstracted entries.
+        """
+        return self.baseline.entries / self.abstracted.entries
+
+    def get_speedup(self) -> float:
+        """Return how many times faster an abstracted iteration is.
+
+        :return: Baseline time divided by abstracted time per iteration.
+        """
+        return (
+            self.baseline.seconds_per_iteration / self.abstracted.seconds_per_iteration
+        )
+
+    def get_exploitability_loss(self) -> float:
+        """Return the exploitability added by the abstraction.
+
+        :return: Abstracted minus baseline exploitability.
+        """
+        return self.abstracted.exploitability - self.baseline.exploitability
+
+
+def _solve(
+    game: Callable[[], base_game.Game],
+    iterations: int,
+    state_abstraction: Optional[abstraction.StateAbstraction],
+) -> SolveStatistics:
+    solver = cfr.CFRSolver(state_abstraction=state_abstraction)
+
+    start = time.perf_counter()
+    solver.solve(game, iterations)
+    seconds = time.perf_counter() - start
+
+    get_state = state_abstraction.get_abstract_state if state_abstraction else None
+    return SolveStatistics(
+        states=solver.get_table().get_number_of_states(),
+        entries=solver.get_table().get_number_of_entries(),
+        seconds_per_iteration=seconds / iterations,
+        exploitability=exploitability.get_exploitability(
+            game, policy.TabularPolicy(solver.get_policy(), get_state)
+        ),
+    )
+
+
+def compare_abstraction(
+    game: Callable[[], base_game.Game],
+    state_abstraction: abstraction.StateAbstraction,
+    iterations: int,
+) -> AbstractionReport:
+    """Solve the game with and without abstraction, and compare the results.
+
+    The abstract policy is mapped back onto the real game to measure its
+    exploitability, so the game must be small enough to compute best responses.
+
+    :param game: The game to solve.
+    :param state_abstraction: The abstraction to evaluate.
+    :param iterations: Number of traversals for each solve.
+    :return: The comparison report.
+    """
+    return AbstractionReport(
+        baseline=_solve(game, iterations, None),
+        abstracted=_solve(game, iterations, state_abstraction),
+    )
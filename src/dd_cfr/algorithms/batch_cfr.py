@@ -0,0 +1,289 @@
+"""Vanilla CFR for many configurations of the same game at once.
+
+:obj:`BatchCFRSolver` compiles the game tree once, see
+:func:`compiled_game.compile_game`, and solves several :obj:`Configuration` s in a
+single traversal per iteration. Every state is assigned a fixed row of its legal
+actions, and the regret and policy tables hold one array of all rows per
+configuration, so the tree walk, the table lookups and the chance probabilities
+are shared, while the regrets, policies and reach probabilities are kept per
+configuration. Each configuration computes the same tables as :obj:`cfr.CFRSolver`
+would on its own, up to the summation order of chance outcomes.
+"""
+
+import array
+import dataclasses
+from typing import Callable, cast, Mapping, Optional, Sequence
+
+from dd_cfr import common
+from dd_cfr.games import base_game, compiled_game
+
+
+@dataclasses.dataclass(frozen=True)
+class Configuration:
+    """The settings of one of the solves of a :obj:`BatchCFRSolver`."""
+
+    #: Number of traversals.
+    iterations: int
+    #: Whether to use regret-matching+ (https://arxiv.org/abs/1407.5042).
+    regret_matching_plus: bool = False
+    #: A variant of the solved game with the same tree but other payoffs, e.g., other
+    #: bet sizes, or None for the solved game itself.
+    game: Optional[Callable[[], base_game.Game]] = None
+
+
+def _get_payoffs(
+    table: compiled_game.GameTable, root: base_game.Game
+) -> list[Optional[Sequence[float]]]:
+    """Collect the terminal payoffs of a game with the tree of a compiled game.
+
+    :param table: The compiled game.
+    :param root: The root of the game to collect the payoffs of.
+    :raises ValueError: If the game's tree differs from the compiled one.
+    :return: The payoffs of terminal nodes by state id, ``None`` for all other nodes.
+    """
+    payoffs: list[Optional[Sequence[float]]] = [None] * table.get_number_of_states()
+    nodes = [(0, root)]
+    while nodes:
+        state_id, game = nodes.pop()
+        if game.is_terminal() != table.terminals[state_id]:
+            raise ValueError("The games of all configurations must share their tree.")
+
+        if game.is_terminal():
+            payoffs[state_id] = tuple(game.get_payoffs())
+            continue
+
+        children = table.children[state_id]
+        nodes.extend((children[action], game.child(action)) for action in children)
+
+    return payoffs
+
+
+class BatchCFRSolver:
+    """CFR Solver for many configurations sharing one compiled game tree."""
+
+    def __init__(
+        self, configurations: Sequence[Configuration], max_states: int = 100_000
+    ) -> None:
+        """Initialize BatchCFRSolver class.
+
+        :param configurations: The configurations to solve.
+        :param max_states: The maximum number of nodes of the compiled game,
+            defaults to 100000.
+        """
+        self._configurations = configurations
+        self._max_states = max_states
+        # Maps states to the offset of their row and their legal actions.
+        self._rows: dict[str, tuple[int, Sequence[base_game.Action]]] = {}
+        # The offset of each node's row, -1 at chance and terminal nodes.
+        self._offsets: list[int] = []
+        # The terminal payoffs of each node per configuration.
+        self._payoffs: list[list[Optional[Sequence[float]]]] = []
+        # The cumulative regrets and policies, one array per configuration.
+        self._regrets: list["array.array[float]"] = []
+        self._policies: list["array.array[float]"] = []
+        self._regret_matching_plus = [
+            configuration.regret_matching_plus for configuration in configurations
+        ]
+        # The indices of the configurations solved in the current iteration.
+        self._active: list[int] = []
+
+    def _compile(self, game: Callable[[], base_game.Game]) -> compiled_game.GameTable:
+        table = compiled_game.compile_game(game(), self._max_states)
+        self._rows, self._offsets = {}, []
+        size = 0
+        for state_id in range(table.get_number_of_states()):
+            if (
+                table.terminals[state_id]
+                or table.active_players[state_id] == common.CHANCE_PLAYER
+            ):
+                self._offsets.append(-1)
+                continue
+
+            state = table.states[state_id]
+            if state not in self._rows:
+                self._rows[state] = (size, table.legal_actions[state_id])
+                size += len(table.legal_actions[state_id])
+            self._offsets.append(self._rows[state][0])
+
+        payoffs: list[Optional[Sequence[float]]] = list(table.payoffs)
+        self._payoffs = [
+            _get_payoffs(table, configuration.game()) if configuration.game else payoffs
+            for configuration in self._configurations
+        ]
+        self._regrets = [array.array("d", bytes(8 * size)) for _ in self._payoffs]
+        self._policies = [array.array("d", bytes(8 * size)) for _ in self._payoffs]
+        return table
+
+    def _get_current_policy(
+        self, configuration: int, offset: int, num_actions: int
+    ) -> list[float]:
+        regrets = self._regrets[configuration]
+        positive_regrets = [max(regrets[offset + i], 0.0) for i in range(num_actions)]
+        total = sum(positive_regrets)
+        if not total:
+            return [1 / num_actions] * num_actions
+
+        return [regret / total for regret in positive_regrets]
+
+    def _traverse_chance(
+        self,
+        table: compiled_game.GameTable,
+        state_id: int,
+        reach_probs: Sequence[Sequence[float]],
+        chance_reach_prob: float,
+    ) -> list[list[float]]:
+        payoffs = [[0.0] * len(reach_probs) for _ in self._active]
+        probabilities = cast(
+            Mapping[base_game.Action, float], table.chance_probabilities[state_id]
+        )
+        for action, child in table.children[state_id].items():
+            probability = probabilities[action]
+            rewards = self._traverse(
+                table, child, reach_probs, chance_reach_prob * probability
+            )
+            for configuration_payoffs, reward in zip(payoffs, rewards):
+                for player_id, player_reward in enumerate(reward):
+                    configuration_payoffs[player_id] += player_reward * probability
+
+        return payoffs
+
+    def _update(
+        self,
+        offset: int,
+        player: int,
+        policies: Sequence[Sequence[float]],
+        rewards: Sequence[Sequence[Sequence[float]]],
+        payoffs: Sequence[Sequence[float]],
+        reach_probs: Sequence[Sequence[float]],
+        chance_reach_prob: float,
+    ) -> None:
+        """Update the regrets and policies of a row for all active configurations.
+
+        :param offset: The offset of the row.
+        :param player: The active player.
+        :param policies: The current policy of each active configuration.
+        :param rewards: The payoffs of each action's child, per active configuration.
+        :param payoffs: The expected payoffs per active configuration.
+        :param reach_probs: The reach probabilities of each player, per active
+            configuration.
+        :param chance_reach_prob: The reach probability of the chance player.
+        """
+        for index, configuration in enumerate(self._active):
+            reach_prob = chance_reach_prob
+            for other_player, player_reach_probs in enumerate(reach_probs):
+                if other_player != player:
+                    reach_prob = player_reach_probs[index] * reach_prob
+
+            regrets = self._regrets[configuration]
+            cumulative_policies = self._policies[configuration]
+            regret_matching_plus = self._regret_matching_plus[configuration]
+            for i, (probability, reward) in enumerate(zip(policies[index], rewards)):
+                regret = reward[index][player] - payoffs[index][player]
+                regrets[offset + i] += regret * reach_prob
+                if regret_matching_plus:
+                    regrets[offset + i] = max(regrets[offset + i], 0.0)
+                cumulative_policies[offset + i] += probability * reach_prob
+
+    def _traverse(
+        self,
+        table: compiled_game.GameTable,
+        state_id: int,
+        reach_probs: Sequence[Sequence[float]],
+        chance_reach_prob: float,
+    ) -> Sequence[Sequence[float]]:
+        """Traverse the subtree of a node for all active configurations.
+
+        :param table: The compiled game.
+        :param state_id: The id of the node.
+        :param reach_probs: The reach probabilities of each player, per active
+            configuration.
+        :param chance_reach_prob: The reach probability of the chance player.
+        :return: The expected payoffs of all players, per active configuration.
+        """
+        if table.terminals[state_id]:
+            return [
+                cast(Sequence[float], self._payoffs[configuration][state_id])
+                for configuration in self._active
+            ]
+
+        player = table.active_players[state_id]
+        if player == common.CHANCE_PLAYER:
+            return self._traverse_chance(
+                table, state_id, reach_probs, chance_reach_prob
+            )
+
+        offset = self._offsets[state_id]
+        children = table.children[state_id]
+        policies = [
+            self._get_current_policy(configuration, offset, len(children))
+            for configuration in self._active
+        ]
+
+        rewards = []
+        for i, child in enumerate(children.values()):
+            next_reach_probs = list(reach_probs)
+            next_reach_probs[player] = [
+                reach_prob * policy[i]
+                for reach_prob, policy in zip(reach_probs[player], policies)
+            ]
+            rewards.append(
+                self._traverse(table, child, next_reach_probs, chance_reach_prob)
+            )
+
+        payoffs = []
+        for index, policy in enumerate(policies):
+            configuration_payoffs = [0.0] * len(reach_probs)
+            for probability, reward in zip(policy, rewards):
+                for player_id, player_reward in enumerate(reward[index]):
+                    configuration_payoffs[player_id] += player_reward * probability
+            payoffs.append(configuration_payoffs)
+
+        self._update(
+            offset, player, policies, rewards, payoffs, reach_probs, chance_reach_prob
+        )
+        return payoffs
+
+    def solve(self, game: Callable[[], base_game.Game]) -> None:
+        """Solve a nash equilibrium of the provided game for all configurations.
+
+        Each configuration runs its own number of iterations, and iterations
+        traverse the tree once for all configurations that are not done yet.
+
+        :param game: The game to solve.
+        """
+        table = self._compile(game)
+        num_players = game().get_num_players()
+
+        iterations = [
+            configuration.iterations for configuration in self._configurations
+        ]
+        for iteration in range(max(iterations, default=0)):
+            self._active = [
+                configuration
+                for configuration, configuration_iterations in enumerate(iterations)
+                if configuration_iterations > iteration
+            ]
+            self._traverse(table, 0, [[1.0] * len(self._active)] * num_players, 1.0)
+
+    def get_policies(self) -> list[dict[str, dict[base_game.Action, float]]]:
+        """Return the average policy of each configuration.
+
+        :return: The average policies, in the order of the configurations, empty
+            before solving.
+        """
+        result = []
+        for cumulative_policies in self._policies:
+            policy = {}
+            for state, (offset, actions) in self._rows.items():
+                sums = [
+                    max(cumulative_policies[offset + i], 0.0)
+                    for i in range(len(actions))
+                ]
+                total = sum(sums)
+                policy[state] = {
+                    action: value / total if total else 1 / len(actions)
+                    for action, value in zip(actions, sums)
+                }
+            result.append(policy)
+
+        return result
@@ -0,0 +1,117 @@
+"""Benchmarks comparing solver configurations."""
+
+import sysconfig
+import time
+from typing import Callable, cast, Sequence
+
+from dd_cfr import common
+from dd_cfr.algorithms import cfr, hogwild
+from dd_cfr.games import base_game, kuhn_poker
+
+
+def is_free_threaded() -> bool:
+    """Return whether this Python build can run threads without the GIL.
+
+    :return: Whether this is a free-threaded build.
+    """
+    return bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+
+
+def benchmark_thread_scaling(
+    game: Callable[[], base_game.Game],
+    iterations: int,
+    thread_counts: Sequence[int] = (1, 2, 4),
+) -> dict[int, float]:
+    """Measure the time per iteration of :obj:`cfr.CFRSolver` per thread count.
+
+    Threads only speed up solving on free-threaded builds, see
+    :func:`is_free_threaded`; with the GIL, lock striping adds a small overhead.
+
+    :param game: The game to solve, e.g., ``GeneralizedKuhnPoker``.
+    :param iterations: Number of traversals per measurement.
+    :param thread_counts: The numbers of threads to measure, defaults to
+        ``(1, 2, 4)``.
+    :return: Maps each thread count to the seconds per iteration.
+    """
+    seconds_per_iteration = {}
+    for num_threads in thread_counts:
+        solver = cfr.CFRSolver(num_threads=num_threads)
+
+        start = time.perf_counter()
+        solver.solve(game, iterations)
+        seconds_per_iteration[num_threads] = (time.perf_counter() - start) / iterations
+
+    return seconds_per_iteration
+
+
+def benchmark_process_scaling(
+    game: Callable[[], base_game.Game],
+    iterations: int,
+    worker_counts: Sequence[int] = (1, 2, 4),
+) -> dict[int, float]:
+    """Measure the time per iteration of :obj:`hogwild.HogwildCFRSolver` per worker.
+
+    Measurements include starting the worker processes and compiling the game in
+    each of them, so they should use enough iterations to amortize both.
+
+    :param game: The game to solve, e.g., ``GeneralizedKuhnPoker``.
+    :param iterations: Number of sampled traversals per measurement.
+    :param worker_counts: The numbers of worker processes to measure, defaults to
+        ``(1, 2, 4)``.
+    :return: Maps each worker count to the seconds per iteration.
+    """
+    seconds_per_iteration = {}
+    for num_workers in worker_counts:
+        solver = hogwild.HogwildCFRSolver(num_workers=num_workers)
+
+        start = time.perf_counter()
+        solver.solve(game, iterations)
+        seconds_per_iteration[num_workers] = (time.perf_counter() - start) / iterations
+
+    return seconds_per_iteration
+
+
+def _get_terminals(game: base_game.Game) -> list[base_game.Game]:
+    if game.is_terminal():
+        return [game]
+
+    actions = (
+        list(game.get_chance_probabilities())
+        if game.get_active_player() == common.CHANCE_PLAYER
+        else game.get_legal_actions()
+    )
+    return [
+        terminal
+        for action in actions
+        for terminal in _get_terminals(game.child(action))
+    ]
+
+
+def benchmark_kuhn_payoffs(
+    game: Callable[[], kuhn_poker.KuhnPoker], repeats: int
+) -> dict[str, float]:
+    """Measure the time per terminal payoff of Kuhn poker, from tables and rules.
+
+    :param game: The game to evaluate, e.g., ``KuhnPoker``.
+    :param repeats: Number of evaluations of every terminal state per measurement.
+    :return: Maps ``"table"`` for :meth:`kuhn_poker.KuhnPoker.get_payoffs` and
+        ``"rules"`` for :meth:`kuhn_poker.KuhnPoker.compute_payoffs` to the seconds
+        per terminal state.
+    """
+    terminals = cast(list[kuhn_poker.KuhnPoker], _get_terminals(game()))
+    methods = {
+        "table": kuhn_poker.KuhnPoker.get_payoffs,
+        "rules": kuhn_poker.KuhnPoker.compute_payoffs,
+    }
+
+    seconds_per_terminal = {}
+    for name, method in methods.items():
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for terminal in terminals:
+                method(terminal)
+        seconds_per_terminal[name] = (time.perf_counter() - start) / (
+            repeats * len(terminals)
+        )
+
+    return seconds_per_terminal
@@ -0,0 +1,110 @@
+"""Exact best response and exploitability for games small enough to enumerate.
+
+See http://mlanctot.info/files/papers/PhD_Thesis_MarcLanctot.pdf, section 3.4.
+"""
+
+import collections
+from typing import Callable, Mapping
+
+from dd_cfr import common
+from dd_cfr.algorithms import policy as policy_lib
+from dd_cfr.games import base_game
+
+
+class _BestResponse:
+    """Best response of one player against a fixed policy of the other player."""
+
+    def __init__(
+        self,
+        game: base_game.Game,
+        player: int,
+        policy: policy_lib.PolicyFunction,
+    ) -> None:
+        self._player = player
+        self._policy = policy
+        # Maps the best responder's states to all consistent game states and their
+        # reach probabilities, ignoring the best responder.
+        self._info_sets: dict[
+            str, list[tuple[base_game.Game, float]]
+        ] = collections.defaultdict(list)
+        self._best_actions: dict[str, base_game.Action] = {}
+
+        self._collect_info_sets(game, 1.0)
+        self.value = self._get_value(game)
+
+    def _get_action_probabilities(
+        self, game: base_game.Game
+    ) -> Mapping[base_game.Action, float]:
+        if game.get_active_player() == common.CHANCE_PLAYER:
+            return game.get_chance_probabilities()
+
+        return self._policy(game)
+
+    def _collect_info_sets(self, game: base_game.Game, reach_prob: float) -> None:
+        if game.is_terminal():
+            return
+
+        if game.get_active_player() == self._player:
+            self._info_sets[game.get_state()].append((game, reach_prob))
+            for action in game.get_legal_actions():
+                self._collect_info_sets(game.child(action), reach_prob)
+            return
+
+        for action, probability in self._get_action_probabilities(game).items():
+            self._collect_info_sets(game.child(action), reach_prob * probability)
+
+    def _get_best_action(self, state: str) -> base_game.Action:
+        if state not in self._best_actions:
+            nodes = self._info_sets[state]
+            self._best_actions[state] = max(
+                nodes[0][0].get_legal_actions(),
+                key=lambda action: sum(
+                    reach_prob * self._get_value(node.child(action))
+                    for node, reach_prob in nodes
+                ),
+            )
+
+        return self._best_actions[state]
+
+    def _get_value(self, game: base_game.Game) -> float:
+        if game.is_terminal():
+            return game.get_payoffs()[self._player]
+
+        if game.get_active_player() == self._player:
+            action = self._get_best_action(game.get_state())
+            return self._get_value(game.child(action))
+
+        return sum(
+            probability * self._get_value(game.child(action))
+            for action, probability in self._get_action_probabilities(game).items()
+        )
+
+
+def get_best_response_value(
+    game: Callable[[], base_game.Game],
+    player: int,
+    policy: policy_lib.PolicyFunction,
+) -> float:
+    """Return the expected payoff of a best response against the given policy.
+
+    :param game: The game to evaluate.
+    :param player: The player computing the best response.
+    :param policy: The policy played by all other players.
+    :return: The expected payoff of :obj:`player` when best responding.
+    """
+    return _BestResponse(game(), player, policy).value
+
+
+def get_exploitability(
+    game: Callable[[], base_game.Game], policy: policy_lib.PolicyFunction
+) -> float:
+    """Return the exploitability of the given policy in a two-player zero-sum game.
+
+    The exploitability is the average gain of the best responses against the
+    policy, and zero exactly for a nash equilibrium.
+
+    :param game: The game to evaluate.
+    :param policy: The policy to evaluate.
+    :return: The exploitability of :obj:`policy`.
+    """
+    return sum(get_best_response_value(game, player, policy) for player in range(2)) / 2
@@ -0,0 +1,204 @@
+"""Head-to-head evaluation of two policies by simulated play.
+
+Deals are played in duplicate: each deal is played twice with the same stream of
+chance outcomes, once with each policy in each seat, which removes most of the luck
+of the cards from the measured payoff. Every deal draws its chance outcomes and
+actions from its own random streams, derived from the match seed and the deal's
+index by :obj:`rng.SeedSequence`, so results are reproducible regardless of how the
+deals are split across processes.
+"""
+
+import concurrent.futures
+import dataclasses
+import functools
+import math
+import statistics
+import time
+from typing import Callable, Mapping, Sequence, Union
+
+from dd_cfr import common, rng
+from dd_cfr.algorithms import policy
+from dd_cfr.games import base_game
+
+#: A policy dict as returned by ``CFRSolver.get_policy()``, or a policy function.
+Policy = Union[Mapping[str, Mapping[base_game.Action, float]], policy.PolicyFunction]
+
+
+@dataclasses.dataclass
+class MatchResult:
+    """The outcome of a match from the perspective of the first policy."""
+
+    #: Number of played hands, two per deal.
+    hands: int
+    #: Mean payoff per hand.
+    mean_payoff: float
+    #: Standard error of the mean payoff, estimated across deals.
+    standard_error: float
+    #: Played hands per second of wall-clock time.
+    hands_per_second: float
+
+    def get_confidence_interval(self, confidence: float = 0.95) -> tuple[float, float]:
+        """Return a normal approximation confidence interval of the mean payoff.
+
+        :param confidence: The confidence level, defaults to 0.95.
+        :return: The lower and upper bound.
+        """
+        z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+        return (
+            self.mean_payoff - z * self.standard_error,
+            self.mean_payoff + z * self.standard_error,
+        )
+
+
+def sample_action(
+    stream: rng.RandomStream, probabilities: Mapping[base_game.Action, float]
+) -> base_game.Action:
+    """Return a random action, chosen with its probability.
+
+    :param stream: The random stream to draw from.
+    :param probabilities: The probabilities of the actions.
+    :return: The chosen action.
+    """
+    return list(probabilities)[stream.choose(list(probabilities.values()))]
+
+
+def _play_hand(
+    game: base_game.Game,
+    policies: Sequence[policy.PolicyFunction],
+    chance_stream: rng.RandomStream,
+    action_stream: rng.RandomStream,
+) -> list[float]:
+    while not game.is_terminal():
+        if game.get_active_player() == common.CHANCE_PLAYER:
+            action = sample_action(chance_stream, game.get_chance_probabilities())
+        else:
+            action = sample_action(
+                action_stream, policies[game.get_active_player()](game)
+            )
+        game = game.child(action)
+
+    return game.get_payoffs()
+
+
+def _play_deals(
+    game: Callable[[], base_game.Game],
+    policies: Sequence[policy.PolicyFunction],
+    seeds: rng.SeedSequence,
+    deals: range,
+) -> tuple[float, float]:
+    # Returns the sum and the sum of squares of the first policy's mean payoff per
+    # deal, which is all needed to merge the results of several workers.
+    total, total_of_squares = 0.0, 0.0
+    for deal in deals:
+        payoff = 0.0
+        for seat in range(2):
+            seated_policies = policies if seat == 0 else policies[::-1]
+            payoffs = _play_hand(
+                game(),
+                seated_policies,
+                seeds.spawn(deal, "chance").get_stream(),
+                seeds.spawn(deal, seat, "actions").get_stream(),
+            )
+            payoff += payoffs[seat] / 2
+
+        total += payoff
+        total_of_squares += payoff**2
+
+    return total, total_of_squares
+
+
+def _to_policy_function(policy_or_table: Policy) -> policy.PolicyFunction:
+    if isinstance(policy_or_table, Mapping):
+        return policy.TabularPolicy(policy_or_table)
+
+    return policy_or_table
+
+
+def play_match(
+    game: Callable[[], base_game.Game],
+    first_policy: Policy,
+    second_policy: Policy,
+    num_deals: int,
+    seed: int = 0,
+    num_processes: int = 1,
+    chunk_size: int = 10_000,
+) -> MatchResult:
+    """Play two policies against each other on duplicate deals.
+
+    :param game: The game to play, e.g., ``KuhnPoker``.
+    :param first_policy: The policy whose payoff is reported.
+    :param second_policy: The opposing policy.
+    :param num_deals: The number of deals, each played twice with swapped seats.
+    :param seed: The seed of the match, defaults to 0.
+    :param num_processes: The number of worker processes, defaults to 1 to play in
+        the calling process. With multiple processes, the game and both policies
+        must be picklable, e.g., classes and :obj:`policy.TabularPolicy` instances.
+    :param chunk_size: The number of deals per task sent to a worker process,
+        defaults to 10000.
+    :return: The result of the match.
+    """
+    policies = [_to_policy_function(first_policy), _to_policy_function(second_policy)]
+    play_deals = functools.partial(_play_deals, game, policies, rng.SeedSequence(seed))
+    return run_deals(play_deals, num_deals, num_processes, chunk_size)
+
+
+def run_deals(
+    play_deals: Callable[[range], tuple[float, float]],
+    num_deals: int,
+    num_processes: int,
+    chunk_size: int,
+) -> MatchResult:
+    """Play deals in chunks, possibly in worker processes, and summarize them.
+
+    :param play_deals: Plays a range of deals and returns the sum and the sum of
+        squares of the mean payoff per deal. With multiple processes, it must be
+        picklable, e.g., a :func:`functools.partial` of a module-level function.
+    :param num_deals: The number of deals, each played twice with swapped seats.
+    :param num_processes: The number of worker processes, 1 to play in the calling
+        process.
+    :param chunk_size: The number of deals per task sent to a worker process.
+    :raises ValueError: If :obj:`num_deals` is less than one.
+    :return: The result, see :func:`summarize_deals`.
+    """
+    if num_deals < 1:
+        raise ValueError("At least one deal is required.")
+
+    chunks = [
+        range(start, min(start + chunk_size, num_deals))
+        for start in range(0, num_deals, chunk_size)
+    ]
+
+    start_time = time.perf_counter()
+    if num_processes == 1:
+        sums = [play_deals(chunk) for chunk in chunks]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(num_processes) as executor:
+            futures = [executor.submit(play_deals, chunk) for chunk in chunks]
+            sums = [future.result() for future in futures]
+    seconds = time.perf_counter() - start_time
+
+    return summarize_deals(sums, num_deals, seconds)
+
+
+def summarize_deals(
+    sums: Sequence[tuple[float, float]], num_deals: int, seconds: float
+) -> MatchResult:
+    """Merge the payoff sums of chunks of deals into a match result.
+
+    :param sums: The sum and the sum of squares of the mean payoff per deal, one
+        pair per chunk.
+    :param num_deals: The total number of deals, each played twice.
+    :param seconds: The wall-clock time of playing all deals.
+    :return: The result, whose standard error is estimated across deals.
+    """
+    total = sum(chunk_total for chunk_total, _ in sums)
+    total_of_squares = sum(chunk_squares for _, chunk_squares in sums)
+    mean = total / num_deals
+    variance = max(total_of_squares / num_deals - mean**2, 0.0)
+
+    return MatchResult(
+        hands=2 * num_deals,
+        mean_payoff=mean,
+        standard_error=math.sqrt(variance / num_deals),
+        hands_per_second=2 * num_deals / seconds,
+    )
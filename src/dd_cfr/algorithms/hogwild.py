@@ -0,0 +1,283 @@
+"""Multi-process chance-sampling CFR on tables in shared memory.
+
+:obj:`HogwildCFRSolver` compiles the game, see :func:`compiled_game.compile_game`,
+and assigns every state a fixed row of its legal actions in one array of doubles
+held in ``multiprocessing.shared_memory``: the cumulative regrets, followed by the
+cumulative policies. Worker processes sample one outcome per chance node
+(chance-sampling CFR, see http://mlanctot.info/files/papers/nips09mccfr.pdf) and
+update the shared array in place without locks (Hogwild, see
+https://arxiv.org/abs/1106.5730). Concurrent updates of the same entry may
+occasionally be lost, which adds noise but does not prevent convergence, and nothing
+is serialized or merged between iterations.
+"""
+
+import array
+import concurrent.futures
+import itertools
+from multiprocessing import shared_memory
+from typing import Callable, cast, Optional, Sequence
+
+from dd_cfr import common, rng
+from dd_cfr.games import base_game, compiled_game
+
+
+class _Layout:
+    """Assigns every state of a compiled game a row in the shared array."""
+
+    def __init__(self, table: compiled_game.GameTable) -> None:
+        self.table = table
+        # Maps states to the offset of their row and their legal actions.
+        self.rows: dict[str, tuple[int, Sequence[base_game.Action]]] = {}
+        # The offset of each node's row, -1 at chance and terminal nodes.
+        self.offsets: list[int] = []
+        # The cumulative probabilities of each chance node's legal actions, empty
+        # elsewhere.
+        self.chance_weights: list[list[float]] = []
+        self.size = 0
+
+        for state_id in range(table.get_number_of_states()):
+            probabilities = table.chance_probabilities[state_id]
+            self.chance_weights.append(
+                list(
+                    itertools.accumulate(
+                        probabilities[action]
+                        for action in table.legal_actions[state_id]
+                    )
+                )
+                if probabilities is not None
+                else []
+            )
+            if (
+                table.terminals[state_id]
+                or table.active_players[state_id] == common.CHANCE_PLAYER
+            ):
+                self.offsets.append(-1)
+                continue
+
+            state = table.states[state_id]
+            if state not in self.rows:
+                self.rows[state] = (self.size, table.legal_actions[state_id])
+                self.size += len(table.legal_actions[state_id])
+            self.offsets.append(self.rows[state][0])
+
+
+class _Worker:
+    """Runs chance-sampling CFR iterations on a shared array."""
+
+    def __init__(
+        self,
+        layout: _Layout,
+        values: memoryview,
+        regret_matching_plus: bool,
+    ) -> None:
+        self._layout = layout
+        self._table = layout.table
+        # Regrets start at 0, cumulative policies at layout.size. The item type is
+        # only given to the type checker, as Python 3.9 cannot evaluate it.
+        self._values = cast("memoryview[float]", values)
+        self._regret_matching_plus = regret_matching_plus
+        self._stream = rng.RandomStream(0)
+
+    def _get_current_policy(self, offset: int, num_actions: int) -> list[float]:
+        regrets = [max(self._values[offset + i], 0.0) for i in range(num_actions)]
+        total = sum(regrets)
+        if not total:
+            return [1 / num_actions] * num_actions
+
+        return [regret / total for regret in regrets]
+
+    def _update(
+        self,
+        offset: int,
+        player: int,
+        policy: Sequence[float],
+        rewards: Sequence[Sequence[float]],
+        payoffs: Sequence[float],
+        reach_probs: Sequence[float],
+    ) -> None:
+        values, policy_offset = self._values, self._layout.size + offset
+        for i, reward in enumerate(rewards):
+            regret = values[offset + i] + reach_probs[1 - player] * (
+                reward[player] - payoffs[player]
+            )
+            values[offset + i] = (
+                max(regret, 0.0) if self._regret_matching_plus else regret
+            )
+            values[policy_offset + i] += reach_probs[player] * policy[i]
+
+    def _traverse(self, state_id: int, reach_probs: Sequence[float]) -> Sequence[float]:
+        table = self._table
+        if table.terminals[state_id]:
+            return cast(Sequence[float], table.payoffs[state_id])
+
+        player = table.active_players[state_id]
+        children = table.children[state_id]
+        if player == common.CHANCE_PLAYER:
+            outcome = self._stream.choose_cumulative(
+                self._layout.chance_weights[state_id]
+            )
+            return self._traverse(
+                children[table.legal_actions[state_id][outcome]], reach_probs
+            )
+
+        offset = self._layout.offsets[state_id]
+        actions = table.legal_actions[state_id]
+        policy = self._get_current_policy(offset, len(actions))
+
+        rewards = []
+        payoffs = [0.0, 0.0]
+        for action, probability in zip(actions, policy):
+            next_reach_probs = list(reach_probs)
+            next_reach_probs[player] *= probability
+            reward = self._traverse(children[action], next_reach_probs)
+            rewards.append(reward)
+            for player_id in range(2):
+                payoffs[player_id] += reward[player_id] * probability
+
+        self._update(offset, player, policy, rewards, payoffs, reach_probs)
+        return payoffs
+
+    def run(self, seeds: rng.SeedSequence, iterations: Sequence[int]) -> None:
+        """Run the given iterations, each with its own chance outcomes.
+
+        :param seeds: The seeds of the solver.
+        :param iterations: The indices of the iterations to run.
+        """
+        for iteration in iterations:
+            self._stream = seeds.spawn(iteration).get_stream()
+            self._traverse(0, (1.0, 1.0))
+
+
+def _get_values(memory: shared_memory.SharedMemory, size: int) -> memoryview:
+    # The regrets and policies of all rows as doubles, in a block that may be
+    # larger than requested.
+    buffer = cast(memoryview, memory.buf)[: 16 * size]
+    return cast(memoryview, buffer.cast("d"))
+
+
+def _run_worker(
+    game: Callable[[], base_game.Game],
+    max_states: int,
+    name: str,
+    seeds: rng.SeedSequence,
+    iterations: Sequence[int],
+    regret_matching_plus: bool,
+) -> None:
+    # Compiling is deterministic, so every worker derives the same layout.
+    layout = _Layout(compiled_game.compile_game(game(), max_states))
+    memory = shared_memory.SharedMemory(name)
+    values = _get_values(memory, layout.size)
+    try:
+        _Worker(layout, values, regret_matching_plus).run(seeds, iterations)
+    finally:
+        values.release()
+        memory.close()
+
+
+class HogwildCFRSolver:
+    """Chance-sampling CFR with worker processes sharing lock-free tables."""
+
+    def __init__(
+        self,
+        num_workers: int = 2,
+        regret_matching_plus: bool = False,
+        seed: int = 0,
+        max_states: int = 100_000,
+    ) -> None:
+        """Initialize HogwildCFRSolver class.
+
+        :param num_workers: The number of worker processes, defaults to 2. With a
+            single worker, iterations run in the calling process and results are
+            reproducible.
+        :param regret_matching_plus: Whether to use regret-matching+
+            (https://arxiv.org/abs/1407.5042), defaults to False.
+        :param seed: The seed of the chance outcomes, defaults to 0.
+        :param max_states: The maximum number of nodes of the compiled game,
+            defaults to 100000.
+        """
+        self._num_workers = num_workers
+        self._regret_matching_plus = regret_matching_plus
+        self._seeds = rng.SeedSequence(seed)
+        self._max_states = max_states
+        self._layout: Optional[_Layout] = None
+        # The regrets followed by the policies, between calls to solve.
+        self._values = array.array("d")
+        self._iteration = 0
+
+    def _run(
+        self, game: Callable[[], base_game.Game], name: str, iterations: int
+    ) -> None:
+        end = self._iteration + iterations
+        if self._num_workers == 1:
+            _run_worker(
+                game,
+                self._max_states,
+                name,
+                self._seeds,
+                range(self._iteration, end),
+                self._regret_matching_plus,
+            )
+            return
+
+        with concurrent.futures.ProcessPoolExecutor(self._num_workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_worker,
+                    game,
+                    self._max_states,
+                    name,
+                    self._seeds,
+                    range(self._iteration + worker, end, self._num_workers),
+                    self._regret_matching_plus,
+                )
+                for worker in range(self._num_workers)
+            ]
+            for future in futures:
+                future.result()
+
+    def solve(self, game: Callable[[], base_game.Game], iterations: int) -> None:
+        """Solve a nash equilibrium for the provided game.
+
+        :param game: The game to solve, which must be picklable with multiple
+            workers, e.g., a class.
+        :param iterations: Number of sampled traversals, split across the workers.
+            Solving a game with other states than the previous one starts over.
+        """
+        layout = _Layout(compiled_game.compile_game(game(), self._max_states))
+        if self._layout is None or self._layout.rows != layout.rows:
+            self._values = array.array("d", bytes(16 * layout.size))
+            self._iteration = 0
+
+        memory = shared_memory.SharedMemory(create=True, size=16 * layout.size)
+        values = _get_values(memory, layout.size)
+        try:
+            values[:] = self._values
+            self._run(game, memory.name, iterations)
+            self._values = array.array("d", values)
+        finally:
+            values.release()
+            memory.close()
+            memory.unlink()
+
+        self._layout = layout
+        self._iteration += iterations
+
+    def get_policy(self) -> dict[str, dict[base_game.Action, float]]:
+        """Return the average policy for all states.
+
+        :return: The average policy, empty before solving.
+        """
+        if self._layout is None:
+            return {}
+
+        policy = {}
+        size = self._layout.size
+        for state, (offset, actions) in self._layout.rows.items():
+            sums = [self._values[size + offset + i] for i in range(len(actions))]
+            total = sum(sums)
+            policy[state] = {
+                action: value / total if total else 1 / len(actions)
+                for action, value in zip(actions, sums)
+            }
+
+        return policy
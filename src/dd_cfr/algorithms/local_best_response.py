@@ -0,0 +1,255 @@
+"""Local best response (LBR), a lower bound on exploitability for large games.
+
+See https://arxiv.org/abs/1612.07547.
+
+LBR plays both seats against the policy on sampled deals. At each of its decisions,
+it estimates the opponent's range by particles: histories that replay the actions so
+far with resampled chance outcomes, are observed by LBR as the same state, and are
+weighted by the policy's probabilities of the opponent's actions. Chance nodes are
+expected at the same points of all histories that LBR cannot tell apart, as when
+cards are dealt at fixed points of a hand. Every legal action is valued by rollouts
+from each particle in which both players follow the policy afterwards, and LBR plays
+the action of highest value. If no particle is found, LBR plays the policy's action
+instead, as it must not act on knowledge of the actual state.
+
+LBR is a valid strategy, so its mean payoff is a lower bound on the exploitability
+of the policy, up to sampling error. The cost per decision depends on the number of
+particles and rollouts, but not on the size of the game.
+"""
+
+import functools
+from typing import Callable, Mapping, Sequence
+
+from dd_cfr import common, rng
+from dd_cfr.algorithms import head_to_head
+from dd_cfr.algorithms import policy as policy_lib
+from dd_cfr.games import base_game
+
+# Attempts to find a consistent particle, per requested particle.
+_ATTEMPTS_PER_PARTICLE = 20
+
+# Pairs of the acting player and their action, from the root.
+_History = list[tuple[int, base_game.Action]]
+
+
+def _get_action_probabilities(
+    game: base_game.Game, policy: policy_lib.PolicyFunction
+) -> Mapping[base_game.Action, float]:
+    if game.get_active_player() == common.CHANCE_PLAYER:
+        return game.get_chance_probabilities()
+
+    return policy(game)
+
+
+def _rollout(
+    game: base_game.Game, policy: policy_lib.PolicyFunction, stream: rng.RandomStream
+) -> list[float]:
+    while not game.is_terminal():
+        game = game.child(
+            head_to_head.sample_action(stream, _get_action_probabilities(game, policy))
+        )
+
+    return game.get_payoffs()
+
+
+def _replay(
+    root: base_game.Game,
+    history: _History,
+    player: int,
+    policy: policy_lib.PolicyFunction,
+    stream: rng.RandomStream,
+) -> tuple[base_game.Game, float]:
+    """Replay a history with resampled chance outcomes.
+
+    :param root: The root of the game.
+    :param history: The acting players and their actions so far.
+    :param player: The player computing the local best response.
+    :param policy: The opponent's policy.
+    :param stream: The stream to sample chance outcomes from.
+    :return: The reached game and the opponent's reach probability, which is zero
+        if the history cannot be replayed.
+    """
+    game, weight = root, 1.0
+    for actor, action in history:
+        if game.get_active_player() != actor:
+            return game, 0.0
+
+        if actor == common.CHANCE_PLAYER:
+            game = game.child(
+                head_to_head.sample_action(stream, game.get_chance_probabilities())
+            )
+            continue
+
+        if actor != player:
+            weight *= policy(game).get(action, 0.0)
+        if not weight or action not in game.get_legal_actions():
+            return game, 0.0
+        game = game.child(action)
+
+    return game, weight
+
+
+def _get_particles(
+    game: base_game.Game,
+    root: Callable[[], base_game.Game],
+    history: _History,
+    policy: policy_lib.PolicyFunction,
+    stream: rng.RandomStream,
+    num_particles: int,
+) -> list[tuple[base_game.Game, float]]:
+    """Sample game states consistent with the observation of the player to move.
+
+    :param game: The actual game state.
+    :param root: Creates the root of the game.
+    :param history: The acting players and their actions leading to :obj:`game`.
+    :param policy: The opponent's policy.
+    :param stream: The stream to sample chance outcomes from.
+    :param num_particles: The number of particles to sample.
+    :return: Pairs of consistent game states and their weights, empty if none was
+        found.
+    """
+    player, state = game.get_active_player(), game.get_state()
+    particles = []
+    for _ in range(num_particles * _ATTEMPTS_PER_PARTICLE):
+        particle, weight = _replay(root(), history, player, policy, stream)
+        if weight and particle.get_state() == state:
+            particles.append((particle, weight))
+            if len(particles) == num_particles:
+                break
+
+    return particles
+
+
+def _get_best_action(
+    particles: Sequence[tuple[base_game.Game, float]],
+    policy: policy_lib.PolicyFunction,
+    stream: rng.RandomStream,
+    num_rollouts: int,
+) -> base_game.Action:
+    player = particles[0][0].get_active_player()
+    total_weight = sum(weight for _, weight in particles)
+
+    def get_value(action: base_game.Action) -> float:
+        return sum(
+            weight * _rollout(particle.child(action), policy, stream)[player]
+            for particle, weight in particles
+            for _ in range(num_rollouts)
+        ) / (total_weight * num_rollouts)
+
+    return max(particles[0][0].get_legal_actions(), key=get_value)
+
+
+def _play_hand(
+    root: Callable[[], base_game.Game],
+    player: int,
+    policy: policy_lib.PolicyFunction,
+    seeds: rng.SeedSequence,
+    num_particles: int,
+    num_rollouts: int,
+) -> float:
+    # Returns the payoff of the local best response playing as the given player.
+    chance_stream = seeds.spawn("chance").get_stream()
+    seat_seeds = seeds.spawn(player)
+    action_stream = seat_seeds.spawn("actions").get_stream()
+    particle_stream = seat_seeds.spawn("particles").get_stream()
+    rollout_stream = seat_seeds.spawn("rollouts").get_stream()
+
+    game = root()
+    history: _History = []
+    while not game.is_terminal():
+        active_player = game.get_active_player()
+        if active_player == player:
+            particles = _get_particles(
+                game, root, history, policy, particle_stream, num_particles
+            )
+            action = (
+                _get_best_action(particles, policy, rollout_stream, num_rollouts)
+                if particles
+                else head_to_head.sample_action(action_stream, policy(game))
+            )
+        else:
+            action = head_to_head.sample_action(
+                (
+                    chance_stream
+                    if active_player == common.CHANCE_PLAYER
+                    else action_stream
+                ),
+                _get_action_probabilities(game, policy),
+            )
+
+        history.append((active_player, action))
+        game = game.child(action)
+
+    return game.get_payoffs()[player]
+
+
+def _play_deals(
+    game: Callable[[], base_game.Game],
+    policy: policy_lib.PolicyFunction,
+    seeds: rng.SeedSequence,
+    deals: range,
+    *,
+    num_particles: int,
+    num_rollouts: int,
+) -> tuple[float, float]:
+    # Returns the sum and the sum of squares of the mean payoff per deal.
+    total, total_of_squares = 0.0, 0.0
+    for deal in deals:
+        payoff = (
+            sum(
+                _play_hand(
+                    game, player, policy, seeds.spawn(deal), num_particles, num_rollouts
+                )
+                for player in range(2)
+            )
+            / 2
+        )
+        total += payoff
+        total_of_squares += payoff**2
+
+    return total, total_of_squares
+
+
+def get_local_best_response(
+    game: Callable[[], base_game.Game],
+    policy: policy_lib.PolicyFunction,
+    num_deals: int,
+    seed: int = 0,
+    num_particles: int = 10,
+    num_rollouts: int = 1,
+    num_processes: int = 1,
+    chunk_size: int = 1000,
+) -> head_to_head.MatchResult:
+    """Play a local best response against the policy to bound its exploitability.
+
+    :param game: The game to evaluate, e.g., ``KuhnPoker``.
+    :param policy: The policy to evaluate, played by the opponent.
+    :param num_deals: The number of deals, each played twice with the local best
+        response in either seat.
+    :param seed: The seed of the evaluation, defaults to 0.
+    :param num_particles: The number of sampled opponent states per decision,
+        defaults to 10.
+    :param num_rollouts: The number of rollouts per particle and action, defaults
+        to 1.
+    :param num_processes: The number of worker processes, defaults to 1 to play in
+        the calling process. With multiple processes, the game and the policy must
+        be picklable.
+    :param chunk_size: The number of deals per task sent to a worker process,
+        defaults to 1000.
+    :raises ValueError: If :obj:`num_deals` or :obj:`num_particles` is less than
+        one.
+    :return: The result from the perspective of the local best response, whose mean
+        payoff estimates a lower bound on the exploitability of :obj:`policy`.
+    """
+    if num_particles < 1:
+        raise ValueError("At least one particle per decision is required.")
+
+    play_deals = functools.partial(
+        _play_deals,
+        game,
+        policy,
+        rng.SeedSequence(seed),
+        num_particles=num_particles,
+        num_rollouts=num_rollouts,
+    )
+    return head_to_head.run_deals(play_deals, num_deals, num_processes, chunk_size)
@@ -0,0 +1,51 @@
+"""Helpers for querying policies computed by the solvers."""
+
+from typing import Callable, Mapping, Optional
+
+from dd_cfr.games import base_game
+
+#: A policy as a function from a game state to the active player's action
+#: probabilities.
+PolicyFunction = Callable[[base_game.Game], Mapping[base_game.Action, float]]
+
+
+def get_uniform_policy(game: base_game.Game) -> dict[base_game.Action, float]:
+    """Return the uniform policy over the legal actions of the given game state.
+
+    :param game: The game state to get the policy for.
+    :return: The uniform policy.
+    """
+    legal_actions = game.get_legal_actions()
+    return {action: 1 / len(legal_actions) for action in legal_actions}
+
+
+class TabularPolicy:
+    """Policy function backed by a ``CFRSolver.get_policy()``-style dict."""
+
+    def __init__(
+        self,
+        policy: Mapping[str, Mapping[base_game.Action, float]],
+        get_state: Optional[Callable[[base_game.Game], str]] = None,
+    ) -> None:
+        """Initialize TabularPolicy class.
+
+        :param policy: Maps states to action probabilities.
+        :param get_state: Maps a game to the key used in :obj:`policy`, e.g., an
+            abstract state. Defaults to the game's own ``get_state()``.
+        """
+        self._policy = policy
+        self._get_state = get_state
+
+    def __call__(self, game: base_game.Game) -> Mapping[base_game.Action, float]:
+        """Return the action probabilities for the given game state.
+
+        States missing from the table are played uniformly at random.
+
+        :param game: The game state to get the policy for.
+        :return: The action probabilities.
+        """
+        state = self._get_state(game) if self._get_state else game.get_state()
+        if state not in self._policy:
+            return get_uniform_policy(game)
+
+        return self._policy[state]
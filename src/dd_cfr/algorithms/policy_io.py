@@ -0,0 +1,162 @@
+"""Streaming import and export of policies.
+
+All functions take or return iterables of ``(state, policy)`` pairs, such as
+``CFRSolver.iter_policy()``, so that policies are written and read one state at a
+time and never held in memory as a whole.
+
+Three formats are supported:
+
+* JSON lines, one ``{"state": ..., "policy": {<action name>: <probability>}}``
+  object per line.
+* CSV with a header and one ``state,action,probability`` row per action.
+* A compact binary format: the magic bytes ``DDCFRPOL`` followed by one record per
+  state, made up of the state's UTF-8 length (``uint16``), the state itself, the
+  number of actions (``uint8``), and per action its enum value (``int16``) and
+  probability (``float32``), all little-endian.
+"""
+
+import csv
+import json
+import struct
+from typing import BinaryIO, Iterable, Iterator, Mapping, TextIO, Type
+
+from dd_cfr.games import base_game
+
+PolicyItems = Iterable[tuple[str, Mapping[base_game.Action, float]]]
+
+_BINARY_MAGIC = b"DDCFRPOL"
+_STATE_HEADER = struct.Struct("<H")
+_ACTIONS_HEADER = struct.Struct("<B")
+_ACTION = struct.Struct("<hf")
+
+
+def write_jsonl(policy: PolicyItems, file: TextIO) -> int:
+    """Write the policy as JSON lines.
+
+    :param policy: The policy to write.
+    :param file: The text file to write to.
+    :return: The number of written states.
+    """
+    count = 0
+    for state, action_probabilities in policy:
+        record = {
+            "state": state,
+            "policy": {action.name: p for action, p in action_probabilities.items()},
+        }
+        file.write(json.dumps(record) + "\n")
+        count += 1
+
+    return count
+
+
+def read_jsonl(
+    file: TextIO, action_type: Type[base_game.Action]
+) -> Iterator[tuple[str, dict[base_game.Action, float]]]:
+    """Read a policy written by :func:`write_jsonl`.
+
+    :param file: The text file to read from.
+    :param action_type: The enum of the policy's actions.
+    :yield: Pairs of states and their policies.
+    """
+    for line in file:
+        record = json.loads(line)
+        yield record["state"], {
+            action_type[name]: p for name, p in record["policy"].items()
+        }
+
+
+def write_csv(policy: PolicyItems, file: TextIO) -> int:
+    """Write the policy as CSV.
+
+    :param policy: The policy to write.
+    :param file: The text file to write to, opened with ``newline=""``.
+    :return: The number of written states.
+    """
+    writer = csv.writer(file)
+    writer.writerow(["state", "action", "probability"])
+
+    count = 0
+    for state, action_probabilities in policy:
+        writer.writerows(
+            [state, action.name, repr(p)] for action, p in action_probabilities.items()
+        )
+        count += 1
+
+    return count
+
+
+def read_csv(
+    file: TextIO, action_type: Type[base_game.Action]
+) -> Iterator[tuple[str, dict[base_game.Action, float]]]:
+    """Read a policy written by :func:`write_csv`.
+
+    Rows of the same state must be consecutive.
+
+    :param file: The text file to read from, opened with ``newline=""``.
+    :param action_type: The enum of the policy's actions.
+    :yield: Pairs of states and their policies.
+    """
+    reader = csv.reader(file)
+    next(reader, None)
+
+    state = None
+    action_probabilities: dict[base_game.Action, float] = {}
+    for row_state, action, probability in reader:
+        if row_state != state:
+            if state is not None:
+                yield state, action_probabilities
+            state, action_probabilities = row_state, {}
+        action_probabilities[action_type[action]] = float(probability)
+
+    if state is not None:
+        yield state, action_probabilities
+
+
+def write_binary(policy: PolicyItems, file: BinaryIO) -> int:
+    """Write the policy in the compact binary format.
+
+    Probabilities are stored with single precision.
+
+    :param policy: The policy to write, with integer action values.
+    :param file: The binary file to write to.
+    :return: The number of written states.
+    """
+    file.write(_BINARY_MAGIC)
+
+    count = 0
+    for state, action_probabilities in policy:
+        encoded_state = state.encode()
+        file.write(_STATE_HEADER.pack(len(encoded_state)))
+        file.write(encoded_state)
+        file.write(_ACTIONS_HEADER.pack(len(action_probabilities)))
+        for action, p in action_probabilities.items():
+            file.write(_ACTION.pack(action.value, p))
+        count += 1
+
+    return count
+
+
+def read_binary(
+    file: BinaryIO, action_type: Type[base_game.Action]
+) -> Iterator[tuple[str, dict[base_game.Action, float]]]:
+    """Read a policy written by :func:`write_binary`.
+
+    :param file: The binary file to read from.
+    :param action_type: The enum of the policy's actions.
+    :raises ValueError: If the file is not in the binary policy format.
+    :yield: Pairs of states and their policies.
+    """
+    if file.read(len(_BINARY_MAGIC)) != _BINARY_MAGIC:
+        raise ValueError("Not a binary policy file.")
+
+    while header := file.read(_STATE_HEADER.size):
+        (state_length,) = _STATE_HEADER.unpack(header)
+        state = file.read(state_length).decode()
+        (num_actions,) = _ACTIONS_HEADER.unpack(file.read(_ACTIONS_HEADER.size))
+
+        action_probabilities = {}
+        for _ in range(num_actions):
+            value, p = _ACTION.unpack(file.read(_ACTION.size))
+            action_probabilities[action_type(value)] = p
+
+        yield state, action_probabilities
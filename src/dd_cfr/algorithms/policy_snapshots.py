@@ -0,0 +1,199 @@
+"""Average policies estimated from sampled snapshots instead of a cumulative table.
+
+The average policy of CFR weights each iteration's current policy by its reach
+probability. Instead of accumulating these contributions for every iteration in a
+second table held in memory, :obj:`PolicySnapshots` keeps the contributions of a
+uniform sample of iterations, chosen by reservoir sampling, in files on disk. The
+average policy of a state is reconstructed on query as the streaming mean over the
+snapshots, normalized over its actions. The mean of each action's contributions is
+an unbiased estimate, but their ratio is not: the estimated policy is consistent,
+converging to the exact average as more iterations are kept, yet biased for few
+snapshots.
+
+Each snapshot is an array of single precision floats in native byte order. All
+snapshots share one layout that maps each state to the offset of its actions;
+states first seen after a snapshot was written lie beyond its end and read as zero.
+Snapshots are memory-mapped on their first query and stay mapped until they are
+replaced.
+"""
+
+import array
+import mmap
+import os
+import random
+import threading
+from typing import Iterator, Mapping, Optional, Sequence
+
+from dd_cfr.games import base_game
+
+_TYPECODE = "f"
+
+
+class PolicySnapshots:
+    """Reservoir of reach-weighted policy snapshots stored on disk."""
+
+    def __init__(self, directory: str, num_snapshots: int, rng: random.Random) -> None:
+        """Initialize PolicySnapshots class.
+
+        :param directory: The existing directory to write the snapshot files to.
+        :param num_snapshots: The number of snapshots to keep.
+        :param rng: The random number generator used to sample iterations.
+        """
+        self._directory = directory
+        self._num_snapshots = num_snapshots
+        self._rng = rng
+
+        # Maps each state to the offset of its first action and its actions.
+        self._layout: dict[str, tuple[int, tuple[base_game.Action, ...]]] = {}
+        self._actions_cache: dict[
+            tuple[base_game.Action, ...], tuple[base_game.Action, ...]
+        ] = {}
+        self._num_entries = 0
+
+        self._iterations = 0
+        # Number of entries of each stored snapshot, by slot.
+        self._sizes: list[int] = []
+        # The memory map of each stored snapshot, by slot, once it was queried.
+        self._maps: list[Optional[mmap.mmap]] = []
+        self._slot: Optional[int] = None
+        self._buffer: Optional["array.array[float]"] = None
+        self._lock = threading.Lock()
+
+    def _get_path(self, slot: int) -> str:
+        return os.path.join(self._directory, f"snapshot-{slot}.f32")
+
+    def get_number_of_snapshots(self) -> int:
+        """Return the number of stored snapshots.
+
+        :return: The number of snapshots on disk.
+        """
+        return len(self._sizes)
+
+    def begin_iteration(self) -> bool:
+        """Decide whether the starting iteration replaces a snapshot.
+
+        The ``t``-th iteration is kept with probability ``num_snapshots / t``, so that
+        the snapshots are always a uniform sample of all iterations so far.
+
+        :return: Whether the iteration's contributions are recorded.
+        """
+        self._iterations += 1
+        if self._iterations <= self._num_snapshots:
+            self._slot = self._iterations - 1
+        else:
+            slot = self._rng.randrange(self._iterations)
+            self._slot = slot if slot < self._num_snapshots else None
+
+        if self._slot is not None:
+            self._buffer = array.array(_TYPECODE, bytes(4 * self._num_entries))
+
+        return self._slot is not None
+
+    def add(
+        self, state: str, policy: Mapping[base_game.Action, float], weight: float
+    ) -> None:
+        """Add a visit's policy contribution to the current iteration's snapshot.
+
+        Does nothing if the current iteration is not recorded.
+
+        :param state: The visited state.
+        :param policy: The current policy of the state over all legal actions.
+        :param weight: The weight of the contribution, e.g., the reach probability.
+        """
+        if self._buffer is None:
+            return
+
+        with self._lock:
+            if state not in self._layout:
+                actions = tuple(policy)
+                self._layout[state] = (
+                    self._num_entries,
+                    self._actions_cache.setdefault(actions, actions),
+                )
+                self._num_entries += len(actions)
+                self._buffer.extend(0.0 for _ in actions)
+
+            offset, actions = self._layout[state]
+            for i, action in enumerate(actions):
+                self._buffer[offset + i] += policy.get(action, 0.0) * weight
+
+    def end_iteration(self) -> None:
+        """Write the current iteration's snapshot to disk, if it is recorded."""
+        if self._slot is None or self._buffer is None:
+            return
+
+        if self._slot == len(self._sizes):
+            self._sizes.append(0)
+            self._maps.append(None)
+        self._close_map(self._slot)
+
+        with open(self._get_path(self._slot), "wb") as snapshot:
+            self._buffer.tofile(snapshot)
+        self._sizes[self._slot] = len(self._buffer)
+        self._slot, self._buffer = None, None
+
+    def _close_map(self, slot: int) -> None:
+        snapshot = self._maps[slot]
+        if snapshot is not None:
+            snapshot.close()
+            self._maps[slot] = None
+
+    def _get_map(self, slot: int) -> mmap.mmap:
+        snapshot = self._maps[slot]
+        if snapshot is None:
+            with open(self._get_path(slot), "rb") as file:
+                snapshot = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[slot] = snapshot
+
+        return snapshot
+
+    def _read(self, slot: int, offset: int, count: int) -> Sequence[float]:
+        values = array.array(_TYPECODE)
+        if offset >= self._sizes[slot]:
+            return [0.0] * count
+
+        start = offset * values.itemsize
+        end = start + count * values.itemsize
+        values.frombytes(self._get_map(slot)[start:end])
+        return values.tolist()
+
+    def get_average_policy(self, state: str) -> dict[base_game.Action, float]:
+        """Return the average policy of a state, estimated from the snapshots.
+
+        :param state: The state to get the policy for.
+        :return: The estimated average policy, empty for unknown states.
+        """
+        if state not in self._layout:
+            return {}
+
+        offset, actions = self._layout[state]
+        mean = [0.0] * len(actions)
+        for count, slot in enumerate(range(len(self._sizes)), 1):
+            for i, value in enumerate(self._read(slot, offset, len(actions))):
+                mean[i] += (value - mean[i]) / count
+
+        total = sum(mean)
+        if not total:
+            return {action: 1 / len(actions) for action in actions}
+
+        return {action: value / total for action, value in zip(actions, mean)}
+
+    def iter_policy(self) -> Iterator[tuple[str, dict[base_game.Action, float]]]:
+        """Yield the estimated average policy state by state.
+
+        :yield: Pairs of recorded states and their average policies.
+        """
+        for state in list(self._layout):
+            yield state, self.get_average_policy(state)
+
+    def get_number_of_states(self) -> int:
+        """Return the number of states in the snapshot layout.
+
+        :return: The number of states.
+        """
+        return len(self._layout)
+
+    def close(self) -> None:
+        """Unmap the snapshots, which are mapped again on the next query."""
+        for slot in range(len(self._maps)):
+            self._close_map(slot)
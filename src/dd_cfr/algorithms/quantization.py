@@ -0,0 +1,107 @@
+"""Quantized storage for final average policies.
+
+Each state's probabilities are stored as 8 or 16 bit integers, scaled so that the
+state's most likely action maps to the largest integer. An action's probability
+is thus off by at most half a quantization step of its state, i.e., by at most
+``0.002`` with 8 bits and ``0.000008`` with 16 bits, and probabilities of a state
+sum to one only up to the same error.
+"""
+
+import array
+from typing import Iterator, Mapping
+
+from dd_cfr.algorithms import policy_io
+from dd_cfr.games import base_game
+
+_TYPECODES = {8: "B", 16: "H"}
+
+
+class QuantizedPolicy:
+    """A policy stored with 8 or 16 bits per action probability."""
+
+    def __init__(self, policy: policy_io.PolicyItems, bits: int = 8) -> None:
+        """Initialize QuantizedPolicy class.
+
+        :param policy: The policy to quantize, e.g., ``CFRSolver.iter_policy()``.
+        :param bits: The bits per probability, either 8 or 16, defaults to 8.
+        :raises ValueError: If :obj:`bits` is neither 8 nor 16.
+        """
+        if bits not in _TYPECODES:
+            raise ValueError(f"Unsupported number of bits: {bits}")
+
+        self._max_value = 2**bits - 1
+        # Maps states to the scale, actions, and quantized probabilities.
+        self._policy: dict[
+            str, tuple[float, tuple[base_game.Action, ...], array.array]
+        ] = {}
+        # States with the same actions share one tuple.
+        actions_cache: dict[
+            tuple[base_game.Action, ...], tuple[base_game.Action, ...]
+        ] = {}
+
+        for state, action_probabilities in policy:
+            actions = tuple(action_probabilities)
+            scale = max(action_probabilities.values(), default=0.0) / self._max_value
+            values = array.array(
+                _TYPECODES[bits],
+                (
+                    round(p / scale) if scale else 0
+                    for p in action_probabilities.values()
+                ),
+            )
+            self._policy[state] = (
+                scale,
+                actions_cache.setdefault(actions, actions),
+                values,
+            )
+
+    def __len__(self) -> int:
+        """Return the number of states.
+
+        :return: The number of states.
+        """
+        return len(self._policy)
+
+    def get_average_policy(self, state: str) -> dict[base_game.Action, float]:
+        """Return the dequantized policy for a given state.
+
+        :param state: The state to get the policy for.
+        :return: The dequantized policy.
+        """
+        scale, actions, values = self._policy[state]
+        return {action: value * scale for action, value in zip(actions, values)}
+
+    def iter_policy(self) -> Iterator[tuple[str, dict[base_game.Action, float]]]:
+        """Yield the dequantized policy state by state.
+
+        :yield: Pairs of states and their dequantized policies.
+        """
+        for state in self._policy:
+            yield state, self.get_average_policy(state)
+
+    def get_policy(self) -> dict[str, dict[base_game.Action, float]]:
+        """Return the dequantized policy for all states.
+
+        :return: The dequantized policy for all states.
+        """
+        return dict(self.iter_policy())
+
+
+def get_policy_drift(
+    policy: Mapping[str, Mapping[base_game.Action, float]],
+    reference: Mapping[str, Mapping[base_game.Action, float]],
+) -> float:
+    """Return the largest difference of an action probability between two policies.
+
+    :param policy: The policy to compare.
+    :param reference: The reference policy, with the same states and actions.
+    :return: The largest absolute difference of any action probability.
+    """
+    return max(
+        (
+            abs(p - reference[state][action])
+            for state, action_probabilities in policy.items()
+            for action, p in action_probabilities.items()
+        ),
+        default=0.0,
+    )
@@ -0,0 +1,316 @@
+"""A state table that spills rarely used rows to disk.
+
+:obj:`TieredTable` keeps the most recently used rows in memory and evicts the least
+recently used one once more than ``hot_capacity`` rows are held. Evicted rows are
+written back to a hash table with open addressing and linear probing in a
+memory-mapped file, and loaded again on their next access. The file doubles in size
+whenever it is three quarters full.
+
+Each slot of the file holds a fixed size record: an occupied flag (``uint8``), the
+state's UTF-8 length (``uint16``) and the state padded to ``max_key_length`` bytes,
+the number of actions (``uint8``), and per action its enum value (``int16``) and
+value, all little-endian.
+"""
+
+import collections
+import dataclasses
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from typing import Iterator, MutableMapping, Type
+
+from dd_cfr.algorithms import cfr
+from dd_cfr.games import base_game
+
+_MAX_LOAD_FACTOR = 0.75
+
+
+@dataclasses.dataclass
+class TableStatistics:
+    """Cache behaviour of a :obj:`TieredTable`."""
+
+    #: Number of accesses to rows held in memory.
+    hits: int
+    #: Number of accesses that went to disk.
+    misses: int
+    #: Number of rows written back to disk on eviction.
+    evictions: int
+    #: Number of rows held in memory.
+    hot_rows: int
+    #: Number of rows stored on disk, possibly also held in memory.
+    disk_rows: int
+
+    def get_hit_rate(self) -> float:
+        """Return the fraction of accesses served from memory.
+
+        :return: The hit rate, ``0.0`` before the first access.
+        """
+        accesses = self.hits + self.misses
+        return self.hits / accesses if accesses else 0.0
+
+
+class TieredTable(MutableMapping[str, MutableMapping[base_game.Action, float]]):
+    """Maps states to rows of action values, spilling cold rows to disk.
+
+    Like a ``defaultdict``, accessing a missing state creates an empty row whose
+    missing actions read as zero. A returned row is only valid until the table is
+    accessed again, since it may be evicted and reloaded as a new object.
+    """
+
+    #: Rows may be replaced by accesses of other states, so threads of
+    #: :obj:`cfr.CFRSolver` cannot share the table.
+    stable_rows = False
+
+    def __init__(
+        self,
+        path: str,
+        action_type: Type[base_game.Action],
+        hot_capacity: int = 100_000,
+        disk_capacity: int = 1024,
+        max_key_length: int = 128,
+        max_actions: int = 16,
+        precision: cfr.Precision = cfr.Precision.FLOAT64,
+    ) -> None:
+        """Initialize TieredTable class.
+
+        :param path: The file backing the cold rows, overwritten if it exists.
+        :param action_type: The enum of the rows' actions.
+        :param hot_capacity: The maximum number of rows held in memory, defaults to
+            100000.
+        :param disk_capacity: The initial number of slots in the file, defaults to
+            1024.
+        :param max_key_length: The maximum UTF-8 length of a state, defaults to 128.
+        :param max_actions: The maximum number of actions per row, defaults to 16.
+        :param precision: The precision of the values on disk, defaults to
+            :obj:`cfr.Precision.FLOAT64`.
+        """
+        self._path = path
+        self._action_type = action_type
+        self._hot_capacity = hot_capacity
+        self._max_key_length = max_key_length
+        self._max_actions = max_actions
+
+        self._header = struct.Struct(f"<BH{max_key_length}s")
+        self._record = struct.Struct(
+            f"<BH{max_key_length}sB" + f"h{precision.value}" * max_actions
+        )
+
+        # Maps states to their rows and whether the row is stored on disk.
+        self._hot: collections.OrderedDict[
+            str, tuple[MutableMapping[base_game.Action, float], bool]
+        ] = collections.OrderedDict()
+        self._hot_only = 0
+        self._lock = threading.RLock()
+
+        self._capacity = disk_capacity
+        self._disk_rows = 0
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC)
+        self._mmap = self._create_mmap(self._fd, disk_capacity)
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _create_mmap(self, fd: int, capacity: int) -> mmap.mmap:
+        os.ftruncate(fd, capacity * self._record.size)
+        return mmap.mmap(fd, capacity * self._record.size)
+
+    def _get_home_slot(self, key: bytes) -> int:
+        digest = hashlib.blake2b(key, digest_size=8).digest()
+        return int.from_bytes(digest, "little") % self._capacity
+
+    def _find(self, key: bytes) -> tuple[int, bool]:
+        """Return the slot holding the key, or the empty slot it would go to.
+
+        :param key: The encoded state.
+        :return: The slot and whether it holds the key.
+        """
+        slot = self._get_home_slot(key)
+        while True:
+            occupied, length, stored = self._header.unpack_from(
+                self._mmap, slot * self._record.size
+            )
+            if not occupied:
+                return slot, False
+            if length == len(key) and stored.startswith(key):
+                return slot, True
+            slot = (slot + 1) % self._capacity
+
+    def _encode(self, state: str) -> bytes:
+        key = state.encode()
+        if len(key) > self._max_key_length:
+            raise ValueError(f"State exceeds {self._max_key_length} bytes: {state}")
+
+        return key
+
+    def _read(self, slot: int) -> MutableMapping[base_game.Action, float]:
+        values = self._record.unpack_from(self._mmap, slot * self._record.size)
+        num_actions = values[3]
+        row: MutableMapping[base_game.Action, float] = collections.defaultdict(float)
+        for i in range(num_actions):
+            row[self._action_type(values[4 + 2 * i])] = values[5 + 2 * i]
+
+        return row
+
+    def _grow(self) -> None:
+        old_mmap, old_capacity = self._mmap, self._capacity
+        old_fd = self._fd
+
+        grow_path = self._path + ".grow"
+        self._fd = os.open(grow_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC)
+        self._capacity *= 2
+        self._mmap = self._create_mmap(self._fd, self._capacity)
+
+        for old_slot in range(old_capacity):
+            values = self._record.unpack_from(old_mmap, old_slot * self._record.size)
+            if values[0]:
+                slot, _ = self._find(values[2][: values[1]])
+                self._record.pack_into(self._mmap, slot * self._record.size, *values)
+
+        old_mmap.close()
+        os.close(old_fd)
+        os.replace(grow_path, self._path)
+
+    def _write(self, state: str, row: MutableMapping[base_game.Action, float]) -> None:
+        """Write the row to disk, inserting the state if necessary.
+
+        :param state: The state of the row.
+        :param row: The row to write.
+        :raises ValueError: If the row has more than ``max_actions`` actions.
+        """
+        if len(row) > self._max_actions:
+            raise ValueError(
+                f"State has more than {self._max_actions} actions: {state}"
+            )
+
+        key = self._encode(state)
+        slot, found = self._find(key)
+        if not found and self._disk_rows + 1 > self._capacity * _MAX_LOAD_FACTOR:
+            self._grow()
+            slot, found = self._find(key)
+
+        values: list[float] = []
+        for action, value in row.items():
+            values += [action.value, value]
+        values += [0, 0.0] * (self._max_actions - len(row))
+
+        self._record.pack_into(
+            self._mmap, slot * self._record.size, 1, len(key), key, len(row), *values
+        )
+        self._disk_rows += not found
+
+    def _evict(self) -> None:
+        state, (row, on_disk) = self._hot.popitem(last=False)
+        self._write(state, row)
+        self._hot_only -= not on_disk
+        self._evictions += 1
+
+    def _insert(
+        self, state: str, row: MutableMapping[base_game.Action, float], on_disk: bool
+    ) -> None:
+        self._hot[state] = (row, on_disk)
+        self._hot_only += not on_disk
+        while len(self._hot) > self._hot_capacity:
+            self._evict()
+
+    def __getitem__(self, state: str) -> MutableMapping[base_game.Action, float]:
+        """Return the state's row, loading or creating it if necessary.
+
+        :param state: The state to get the row for.
+        :return: The state's row.
+        """
+        with self._lock:
+            if state in self._hot:
+                self._hits += 1
+                self._hot.move_to_end(state)
+                return self._hot[state][0]
+
+            self._misses += 1
+            slot, found = self._find(self._encode(state))
+            row = self._read(slot) if found else collections.defaultdict(float)
+            self._insert(state, row, found)
+            return row
+
+    def __setitem__(
+        self, state: str, row: MutableMapping[base_game.Action, float]
+    ) -> None:
+        """Replace the state's row.
+
+        :param state: The state to set the row for.
+        :param row: The new row.
+        """
+        with self._lock:
+            if state in self._hot:
+                on_disk = self._hot.pop(state)[1]
+                self._hot_only -= not on_disk
+            else:
+                on_disk = self._find(self._encode(state))[1]
+
+            self._insert(state, collections.defaultdict(float, row), on_disk)
+
+    def __delitem__(self, state: str) -> None:
+        """Not supported, rows can only be added.
+
+        :param state: The state to delete.
+        :raises NotImplementedError: Always.
+        """
+        raise NotImplementedError("TieredTable does not support deleting states.")
+
+    def __contains__(self, state: object) -> bool:
+        """Return whether the table has a row for the state, without creating it.
+
+        :param state: The state to look up.
+        :return: Whether the state has a row.
+        """
+        with self._lock:
+            return isinstance(state, str) and (
+                state in self._hot or self._find(self._encode(state))[1]
+            )
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over all states, after writing all rows held in memory to disk.
+
+        :yield: The states.
+        """
+        self.flush()
+        for slot in range(self._capacity):
+            occupied, length, key = self._header.unpack_from(
+                self._mmap, slot * self._record.size
+            )
+            if occupied:
+                yield key[:length].decode()
+
+    def __len__(self) -> int:
+        """Return the number of states.
+
+        :return: The number of states.
+        """
+        return self._disk_rows + self._hot_only
+
+    def flush(self) -> None:
+        """Write all rows held in memory to disk, keeping them in memory."""
+        with self._lock:
+            for state, (row, _) in self._hot.items():
+                self._write(state, row)
+                self._hot[state] = (row, True)
+            self._hot_only = 0
+
+    def close(self) -> None:
+        """Close the backing file. Rows held in memory are discarded."""
+        self._mmap.close()
+        os.close(self._fd)
+
+    def get_statistics(self) -> TableStatistics:
+        """Return the cache statistics since the table was created.
+
+        :return: The table statistics.
+        """
+        return TableStatistics(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            hot_rows=len(self._hot),
+            disk_rows=self._disk_rows,
+        )
@@ -0,0 +1,133 @@
+"""State abstractions that map many game states onto one abstract state.
+
+Solvers store their tables per abstract state instead of per state, which bounds
+the table size for large games at the cost of exploitability.
+"""
+
+import abc
+import random
+from typing import Sequence
+
+from dd_cfr.games import base_game
+
+
+class StateAbstraction(abc.ABC):
+    """Abstract class for implementing state abstractions."""
+
+    @abc.abstractmethod
+    def get_abstract_state(self, game: base_game.Game) -> str:
+        """Return the abstract state from the perspective of the active player.
+
+        :param game: The game state to abstract.
+        """
+
+
+class HistoryCompressor(StateAbstraction):
+    """Keeps only the most recent actions of the betting history.
+
+    Expects states formatted as ``<private information>|<action>, <action>, ...``,
+    as returned by, e.g., ``KuhnPoker.get_state()``.
+    """
+
+    def __init__(
+        self,
+        max_actions: int,
+        history_separator: str = "|",
+        action_separator: str = ", ",
+    ) -> None:
+        """Initialize HistoryCompressor class.
+
+        :param max_actions: The number of most recent actions to keep.
+        :param history_separator: Separates the private information from the
+            history, defaults to ``"|"``.
+        :param action_separator: Separates the actions in the history, defaults to
+            ``", "``.
+        """
+        self._max_actions = max_actions
+        self._history_separator = history_separator
+        self._action_separator = action_separator
+
+    def get_abstract_state(self, game: base_game.Game) -> str:
+        """Return the state with all but the most recent actions removed.
+
+        :param game: The game state to abstract.
+        :return: The abstract state.
+        """
+        state = game.get_state()
+        if self._history_separator not in state:
+            return state
+
+        private, history = state.split(self._history_separator, 1)
+        if not self._max_actions:
+            return private
+
+        first_kept_action = -self._max_actions
+        actions = history.split(self._action_separator)[first_kept_action:]
+        return private + self._history_separator + self._action_separator.join(actions)
+
+
+def _get_squared_distance(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+
+def get_nearest_centroid(
+    point: Sequence[float], centroids: Sequence[Sequence[float]]
+) -> int:
+    """Return the index of the centroid closest to the given point.
+
+    :param point: The point to assign.
+    :param centroids: The centroids to choose from.
+    :return: The index of the closest centroid.
+    """
+    return min(
+        range(len(centroids)),
+        key=lambda i: _get_squared_distance(point, centroids[i]),
+    )
+
+
+def get_k_means_centroids(
+    points: Sequence[Sequence[float]],
+    k: int,
+    rng: random.Random,
+    iterations: int = 20,
+) -> list[list[float]]:
+    """Cluster the given points with Lloyd's algorithm and k-means++ seeding.
+
+    See http://ilpubs.stanford.edu:8090/778/1/2006-13.pdf.
+
+    :param points: The points to cluster, all of the same dimension.
+    :param k: The number of clusters.
+    :param rng: The random number generator used for seeding.
+    :param iterations: The maximum number of Lloyd iterations, defaults to 20.
+    :raises ValueError: If there are fewer points than clusters.
+    :return: The ``k`` centroids.
+    """
+    if len(points) < k:
+        raise ValueError(f"Cannot form {k} clusters from {len(points)} points.")
+
+    centroids = [list(rng.choice(points))]
+    while len(centroids) < k:
+        distances = [
+            min(_get_squared_distance(point, c) for c in centroids) for point in points
+        ]
+        if not sum(distances):
+            centroids.append(list(rng.choice(points)))
+        else:
+            centroids.append(list(rng.choices(points, weights=distances)[0]))
+
+    for _ in range(iterations):
+        clusters: list[list[Sequence[float]]] = [[] for _ in range(k)]
+        for point in points:
+            clusters[get_nearest_centroid(point, centroids)].append(point)
+
+        new_centroids = [
+            [sum(values) / len(cluster) for values in zip(*cluster)]
+            if cluster
+            else centroid
+            for cluster, centroid in zip(clusters, centroids)
+        ]
+        if new_centroids == centroids:
+            break
+        centroids = new_centroids
+
+    return centroids
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import abc
+import array
 import enum
-from typing import Mapping, Sequence
+from typing import Mapping, Optional, Sequence
 
 from dd_cfr import common
 
@@ -12,9 +13,38 @@ class Action(enum.Enum):
     """The set of actions available to the (possibly chance) players."""
 
 
+class TerminalEvaluator(abc.ABC):
+    """Abstract class for evaluating terminal states from precomputed tables.
+
+    A terminal state is identified by the deal of private information and the id of
+    the public history leading to it.
+    """
+
+    @abc.abstractmethod
+    def get_payoffs(self, deal_id: int, history_id: int) -> Sequence[float]:
+        """Return the payoffs for players 1 and 2 of a terminal state.
+
+        :param deal_id: The id of the deal.
+        :param history_id: The id of the terminal history.
+        """
+
+    def get_batch_payoffs(
+        self, deal_ids: Sequence[int], history_id: int
+    ) -> list[Sequence[float]]:
+        """Return the payoffs of the same terminal history for many deals at once.
+
+        :param deal_ids: The ids of the deals.
+        :param history_id: The id of the terminal history.
+        :return: The payoffs for players 1 and 2, one entry per deal.
+        """
+        return [self.get_payoffs(deal_id, history_id) for deal_id in deal_ids]
+
+
 class Game(abc.ABC):
     """Abstract class for implementing games."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def get_state(self) -> str:
         """Return the state from the perspective of the currently active player."""
@@ -25,7 +55,7 @@ class Game(abc.ABC):
 
     @abc.abstractmethod
     def get_payoffs(self) -> list[float]:
-        """Return the payoffs for players 1 and 2 in order."""
+        """Return the payoffs of all players in order."""
 
     @abc.abstractmethod
     def get_legal_actions(self) -> Sequence[Action]:
@@ -46,11 +76,59 @@ class Game(abc.ABC):
         :param action: The action to apply.
         """
 
+    def get_num_players(self) -> int:
+        """Return the number of players, not counting the chance player.
+
+        :return: The number of players, 2 unless overridden.
+        """
+        return 2
+
+    def get_deal_table(self) -> Optional[Sequence[tuple[Sequence[Action], float]]]:
+        """Return all joint deals from this state on, if the game can enumerate them.
+
+        A deal is the sequence of chance actions leading from this chance node to
+        the next player decision. Solvers iterate over the table instead of
+        expanding one chance node after the other.
+
+        :return: Pairs of deals and their probabilities, or ``None`` if the game
+            does not enumerate deals from this state.
+        """
+        return None
+
+    def get_terminal_evaluator(self) -> Optional[TerminalEvaluator]:
+        """Return the game's terminal evaluator, if it has one.
+
+        :return: The evaluator, or ``None`` if payoffs are computed on demand.
+        """
+        return None
+
+    def get_observation_size(self) -> int:
+        """Return the number of values written by :meth:`encode_observation`.
+
+        The size is the same for all states of the game.
+
+        :raises NotImplementedError: If the game does not encode observations.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not encode states.")
+
+    def encode_observation(self, out: array.array, offset: int = 0) -> None:
+        """Write the state of the active player as numbers into a buffer.
+
+        Two states have the same encoding if and only if :meth:`get_state` returns
+        the same string for them, so models can be trained on the encodings in
+        place of the states.
+
+        :param out: The buffer to write to, e.g., a row of a batch.
+        :param offset: The index of the first value to write, defaults to 0.
+        :raises NotImplementedError: If the game does not encode observations.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not encode states.")
+
     def _get_other_player(self, player: int) -> int:
         return (player + 1) % 2
 
     def get_inactive_player(self) -> int:
-        """Return the currently inactive player.
+        """Return the currently inactive player of a two-player game.
 
         :return: The inactive player.
         :raises ValueError: If the currently active player is the chance player.
@@ -63,3 +141,23 @@ class Game(abc.ABC):
             )
 
         return self._get_other_player(active_player)
+
+
+def encode_observations(
+    games: Sequence[Game], out: Optional[array.array] = None
+) -> array.array:
+    """Encode the states of many games into consecutive rows of one buffer.
+
+    :param games: The games to encode, all of the same observation size.
+    :param out: The buffer to write to, defaults to None to allocate one. Reusing
+        the buffer encodes batches without allocating.
+    :return: The buffer, whose row ``i`` holds the encoding of ``games[i]``.
+    """
+    size = games[0].get_observation_size() if games else 0
+    if out is None:
+        out = array.array("f", bytes(4 * size * len(games)))
+
+    for i, game in enumerate(games):
+        game.encode_observation(out, i * size)
+
+    return out
@@ -0,0 +1,215 @@
+"""Precomputed transition tables for small games.
+
+:func:`compile_game` expands a game's full tree once and stores every node's
+properties in tuples indexed by an integer state id. A :obj:`CompiledGame` is a
+drop-in replacement for the original game that only holds the table and its state
+id, so every API call is a tuple lookup instead of a recomputation.
+"""
+from __future__ import annotations
+
+import dataclasses
+import types
+from typing import Mapping, Optional, Sequence
+
+from dd_cfr import common
+from dd_cfr.games import base_game
+
+DealTable = Sequence[tuple[Sequence[base_game.Action], float]]
+
+
+@dataclasses.dataclass(frozen=True)
+class GameTable:
+    """The properties of all nodes of a game tree, indexed by state id.
+
+    The root has state id 0.
+    """
+
+    #: The state from the perspective of the active player, empty at chance nodes.
+    states: tuple[str, ...]
+    #: The active player, :obj:`common.CHANCE_PLAYER` at chance nodes.
+    active_players: tuple[int, ...]
+    #: Whether the node is terminal.
+    terminals: tuple[bool, ...]
+    #: The payoffs of terminal nodes, ``None`` for all other nodes.
+    payoffs: tuple[Optional[tuple[float, ...]], ...]
+    #: The legal actions, chance actions at chance nodes, none at terminal nodes.
+    legal_actions: tuple[tuple[base_game.Action, ...], ...]
+    #: Maps each legal action to the state id of the resulting child.
+    children: tuple[Mapping[base_game.Action, int], ...]
+    #: The chance probabilities of chance nodes, ``None`` for all other nodes.
+    chance_probabilities: tuple[Optional[Mapping[base_game.Action, float]], ...]
+    #: The deal tables as returned by ``Game.get_deal_table()``.
+    deal_tables: tuple[Optional[DealTable], ...]
+
+    def get_number_of_states(self) -> int:
+        """Return the number of nodes in the game tree.
+
+        :return: The number of nodes.
+        """
+        return len(self.states)
+
+
+def compile_game(root: base_game.Game, max_states: int = 100_000) -> GameTable:
+    """Expand the game tree below the given root into a :obj:`GameTable`.
+
+    :param root: The game's initial state.
+    :param max_states: The maximum number of nodes to expand, defaults to 100000.
+    :raises ValueError: If the game tree has more than :obj:`max_states` nodes.
+    :return: The game's transition table.
+    """
+    nodes = [root]
+    children: list[dict[base_game.Action, int]] = []
+
+    # Nodes are numbered in the order they are discovered, so ``nodes`` doubles
+    # as the queue of a breadth-first search.
+    while len(children) < len(nodes):
+        game = nodes[len(children)]
+        if game.is_terminal():
+            actions: Sequence[base_game.Action] = ()
+        elif game.get_active_player() == common.CHANCE_PLAYER:
+            actions = tuple(game.get_chance_probabilities())
+        else:
+            actions = game.get_legal_actions()
+
+        if len(nodes) + len(actions) > max_states:
+            raise ValueError(f"The game has more than {max_states} states.")
+
+        children.append({})
+        for action in actions:
+            children[-1][action] = len(nodes)
+            nodes.append(game.child(action))
+
+    is_chance = [game.get_active_player() == common.CHANCE_PLAYER for game in nodes]
+    return GameTable(
+        states=tuple(
+            "" if chance else game.get_state() for game, chance in zip(nodes, is_chance)
+        ),
+        active_players=tuple(game.get_active_player() for game in nodes),
+        terminals=tuple(game.is_terminal() for game in nodes),
+        payoffs=tuple(
+            tuple(game.get_payoffs()) if game.is_terminal() else None for game in nodes
+        ),
+        legal_actions=tuple(tuple(node_children) for node_children in children),
+        children=tuple(children),
+        chance_probabilities=tuple(
+            types.MappingProxyType(dict(game.get_chance_probabilities()))
+            if chance
+            else None
+            for game, chance in zip(nodes, is_chance)
+        ),
+        deal_tables=tuple(game.get_deal_table() for game in nodes),
+    )
+
+
+class CompiledGame(base_game.Game):
+    """A game state backed by a :obj:`GameTable`.
+
+    Instances are immutable and hashable, and two instances are equal if they
+    refer to the same node of the same table.
+    """
+
+    __slots__ = ("_table", "_state_id")
+
+    def __init__(self, table: GameTable, state_id: int = 0) -> None:
+        """Initialize CompiledGame class.
+
+        :param table: The compiled game.
+        :param state_id: The id of the current node, defaults to 0 for the root.
+        """
+        self._table = table
+        self._state_id = state_id
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether both games are at the same node of the same table.
+
+        :param other: The object to compare with.
+        :return: Whether both games are equal.
+        """
+        if not isinstance(other, CompiledGame):
+            return NotImplemented
+
+        return self._table is other._table and self._state_id == other._state_id
+
+    def __hash__(self) -> int:
+        """Return the hash of the current node.
+
+        :return: The hash.
+        """
+        return hash((id(self._table), self._state_id))
+
+    def get_state_id(self) -> int:
+        """Return the id of the current node in the table.
+
+        :return: The state id.
+        """
+        return self._state_id
+
+    def get_state(self) -> str:
+        """Return the state from the perspective of the currently active player.
+
+        :return: The state from the perspective of the currently active player.
+        """
+        return self._table.states[self._state_id]
+
+    def is_terminal(self) -> bool:
+        """Return whether the current state is terminal.
+
+        :return: Whether the current state is terminal.
+        """
+        return self._table.terminals[self._state_id]
+
+    def get_payoffs(self) -> list[float]:
+        """Return the payoffs for players 1 and 2 in order.
+
+        :raises ValueError: If the current state is not terminal.
+        :return: The payoffs for players 1 and 2 in order.
+        """
+        payoffs = self._table.payoffs[self._state_id]
+        if payoffs is None:
+            raise ValueError("Payoffs are only defined for terminal states.")
+
+        return list(payoffs)
+
+    def get_legal_actions(self) -> Sequence[base_game.Action]:
+        """Return the legal actions for the active (possibly chance) player.
+
+        :return: The legal actions for the active player.
+        """
+        return self._table.legal_actions[self._state_id]
+
+    def get_chance_probabilities(self) -> Mapping[base_game.Action, float]:
+        """Return chance probabilities, only valid when the chance player is active.
+
+        :raises ValueError: If the active player is not the chance player.
+        :return: The chance probabilities for the current state.
+        """
+        chance_probabilities = self._table.chance_probabilities[self._state_id]
+        if chance_probabilities is None:
+            raise ValueError(
+                "Should only call get_chance_probabilities when the chance player is"
+                " active."
+            )
+
+        return chance_probabilities
+
+    def get_deal_table(self) -> Optional[DealTable]:
+        """Return all joint deals from this state on, if the game enumerates them.
+
+        :return: The deal table of the original game at this node.
+        """
+        return self._table.deal_tables[self._state_id]
+
+    def get_active_player(self) -> int:
+        """Return the currently active player.
+
+        :return: The currently active player.
+        """
+        return self._table.active_players[self._state_id]
+
+    def child(self, action: base_game.Action) -> CompiledGame:
+        """Return the game state with the given action applied.
+
+        :param action: The action to apply.
+        :return: The resulting game state.
+        """
+        return type(self)(self._table, self._table.children[self._state_id][action])
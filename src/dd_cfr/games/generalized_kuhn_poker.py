@@ -0,0 +1,64 @@
+"""Kuhn poker with a configurable number of cards.
+
+Played like Kuhn poker, but with a deck of up to 13 cards of distinct ranks, which
+makes for a larger game tree with the same betting structure.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+from dd_cfr.games import base_game, kuhn_poker
+
+
+class Rank(base_game.Action):
+    """All available actions to the chance player, i.e., the card ranks."""
+
+    TWO = 0
+    THREE = 1
+    FOUR = 2
+    FIVE = 3
+    SIX = 4
+    SEVEN = 5
+    EIGHT = 6
+    NINE = 7
+    TEN = 8
+    JACK = 9
+    QUEEN = 10
+    KING = 11
+    ACE = 12
+
+
+#: The largest supported number of cards.
+MAX_NUM_CARDS = len(Rank)
+
+
+class GeneralizedKuhnPoker(kuhn_poker.KuhnPoker):
+    """Kuhn poker played with the lowest ``num_cards`` ranks."""
+
+    def __init__(
+        self,
+        num_cards: int = MAX_NUM_CARDS,
+        cards: Optional[list[base_game.Action]] = None,
+        history: Optional[list[kuhn_poker.PlayerAction]] = None,
+    ) -> None:
+        """Initialize GeneralizedKuhnPoker class.
+
+        :param num_cards: The number of cards in the deck, between 3 and 13,
+            defaults to 13.
+        :param cards: Optional current cards, defaults to None.
+        :param history: Optional current history, defaults to None.
+        :raises ValueError: If :obj:`num_cards` is out of range.
+        """
+        if not 3 <= num_cards <= MAX_NUM_CARDS:
+            raise ValueError(f"Unsupported number of cards: {num_cards}")
+
+        super().__init__(cards, history)
+        self._num_cards = num_cards
+
+    def _get_deck(self) -> tuple[base_game.Action, ...]:
+        return tuple(rank for rank in Rank if rank.value < self._num_cards)
+
+    def _create(
+        self, cards: list[base_game.Action], history: list[kuhn_poker.PlayerAction]
+    ) -> GeneralizedKuhnPoker:
+        return GeneralizedKuhnPoker(self._num_cards, cards, history)
@@ -1,12 +1,16 @@
 """Kuhn poker implementation."""
 from __future__ import annotations
 
+import array
 import copy
 import dataclasses
+import functools
+import itertools
+import types
 from typing import Mapping, Optional, Sequence
 
 from dd_cfr import common
-from dd_cfr.games import base_game
+from dd_cfr.games import base_game, compiled_game
 
 
 class Action(base_game.Action):
@@ -18,6 +22,10 @@ class Action(base_game.Action):
     FOLD = 3
 
 
+#: The maximum number of actions in a hand.
+MAX_HISTORY_LENGTH = 3
+
+
 class ChanceAction(base_game.Action):
     """All available actions to the chance player."""
 
@@ -26,6 +34,51 @@ class ChanceAction(base_game.Action):
     KING = 2
 
 
+@functools.lru_cache(maxsize=None)
+def _get_chance_probabilities(
+    deck: tuple[base_game.Action, ...], cards: tuple[base_game.Action, ...]
+) -> Mapping[base_game.Action, float]:
+    remaining_cards = sorted(set(deck) - set(cards), key=lambda x: x.value)
+    return types.MappingProxyType(
+        {card: 1 / len(remaining_cards) for card in remaining_cards}
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_deal_table(
+    deck: tuple[base_game.Action, ...]
+) -> tuple[tuple[tuple[base_game.Action, ...], float], ...]:
+    deals = list(itertools.permutations(sorted(deck, key=lambda x: x.value), 2))
+    return tuple((deal, 1 / len(deals)) for deal in deals)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_terminal_evaluator(
+    deck: tuple[base_game.Action, ...]
+) -> KuhnTerminalEvaluator:
+    return KuhnTerminalEvaluator(tuple(deal for deal, _ in _get_deal_table(deck)))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_payoff_table() -> tuple[tuple[tuple[tuple[float, ...], ...], ...], ...]:
+    # Terminal payoffs only depend on the last action, the player who took it and
+    # whether player 2 holds the higher card, which index the table in this order.
+    deals: tuple[list[base_game.Action], ...] = (
+        [ChanceAction.KING, ChanceAction.JACK],
+        [ChanceAction.JACK, ChanceAction.KING],
+    )
+    return tuple(
+        tuple(
+            tuple(
+                tuple(KuhnPoker(deal, [PlayerAction(player, action)]).compute_payoffs())
+                for deal in deals
+            )
+            for player in range(2)
+        )
+        for action in Action
+    )
+
+
 @dataclasses.dataclass
 class PlayerAction:
     """Holds the player and action combination."""
@@ -39,7 +92,7 @@ class KuhnPoker(base_game.Game):
 
     def __init__(
         self,
-        cards: Optional[list[ChanceAction]] = None,
+        cards: Optional[list[base_game.Action]] = None,
         history: Optional[list[PlayerAction]] = None,
     ) -> None:
         """Initialize KuhnPoker class.
@@ -61,9 +114,17 @@ class KuhnPoker(base_game.Game):
             return 2
         return 1
 
-    def _get_formatted_card(self, card: ChanceAction) -> str:
+    def _get_formatted_card(self, card: base_game.Action) -> str:
         return card.name
 
+    def _get_deck(self) -> tuple[base_game.Action, ...]:
+        return tuple(ChanceAction)
+
+    def _create(
+        self, cards: list[base_game.Action], history: list[PlayerAction]
+    ) -> KuhnPoker:
+        return KuhnPoker(cards, history)
+
     def _get_formatted_history(self) -> str:
         return ", ".join(str(pa.action.name) for pa in self._history)
 
@@ -82,18 +143,58 @@ class KuhnPoker(base_game.Game):
             "|" + history if history else ""
         )
 
+    def get_observation_size(self) -> int:
+        """Return the number of values written by :meth:`encode_observation`.
+
+        :return: The number of cards plus one slot of all actions per action of the
+            history.
+        """
+        return len(self._get_deck()) + MAX_HISTORY_LENGTH * len(Action)
+
+    def encode_observation(self, out: array.array, offset: int = 0) -> None:
+        """Write the state of the active player as numbers into a buffer.
+
+        Like :meth:`get_state`, the encoding consists of the one-hot card of the
+        active player, followed by one one-hot slot per action of the history.
+
+        :param out: The buffer to write to, e.g., a row of a batch.
+        :param offset: The index of the first value to write, defaults to 0.
+        """
+        for i in range(offset, offset + self.get_observation_size()):
+            out[i] = 0.0
+
+        out[offset + self._cards[self.get_active_player()].value] = 1.0
+        history_offset = offset + len(self._get_deck())
+        for i, player_action in enumerate(self._history):
+            out[history_offset + i * len(Action) + player_action.action.value] = 1.0
+
     def is_terminal(self) -> bool:
         """Return whether the current state is terminal.
 
         :return: Whether the current state is terminal.
         """
-        return len(self._history) == 3 or (
+        return len(self._history) == MAX_HISTORY_LENGTH or (
             len(self._history) == 2 and self._history[-1].action != Action.BET
         )
 
     def get_payoffs(self) -> list[float]:
         """Return the payoffs for players 1 and 2 in order.
 
+        Payoffs are looked up by the card values and the last action, without
+        hashing the deal and the history as :meth:`get_terminal_evaluator` does.
+
+        :return: The payoffs for players 1 and 2 in order.
+        """
+        last = self._history[-1]
+        return list(
+            _get_payoff_table()[last.action.value][last.player][
+                self._cards[0].value < self._cards[1].value
+            ]
+        )
+
+    def compute_payoffs(self) -> list[float]:
+        """Compute the payoffs for players 1 and 2 from the rules, without tables.
+
         :return: The payoffs for players 1 and 2 in order.
         """
         winner = self._get_winner()
@@ -121,6 +222,13 @@ class KuhnPoker(base_game.Game):
             f"Should not reach this state after {self._history[-1]}"
         )  # pragma: no cover
 
+    def get_terminal_evaluator(self) -> KuhnTerminalEvaluator:
+        """Return the payoff tables of all deals and terminal histories.
+
+        :return: The terminal evaluator, shared by all games with the same deck.
+        """
+        return _get_terminal_evaluator(self._get_deck())
+
     def get_chance_probabilities(self) -> Mapping[base_game.Action, float]:
         """Return chance probabilities, only valid when the chance player is active.
 
@@ -133,8 +241,19 @@ class KuhnPoker(base_game.Game):
                 " active."
             )  # pragma: no cover
 
-        cards = sorted((set(ChanceAction) - set(self._cards)), key=lambda x: x.value)
-        return {card: 1 / len(cards) for card in cards}
+        return _get_chance_probabilities(self._get_deck(), tuple(self._cards))
+
+    def get_deal_table(
+        self,
+    ) -> Optional[Sequence[tuple[Sequence[base_game.Action], float]]]:
+        """Return all deals of both cards with their probabilities.
+
+        :return: The deal table before any card is dealt, ``None`` afterwards.
+        """
+        if self._cards:
+            return None
+
+        return _get_deal_table(self._get_deck())
 
     def get_active_player(self) -> int:
         """Return the currently active player.
@@ -153,6 +272,7 @@ class KuhnPoker(base_game.Game):
         """Return a copy of the current game state with the given action applied.
 
         :param action: The action to apply.
+        :raises ValueError: If the chance player deals a card not in the deck.
         :return: A copy of the current game with the given action applied.
         """
 
@@ -160,8 +280,117 @@ class KuhnPoker(base_game.Game):
         new_history = copy.deepcopy(self._history)
 
         if self.get_active_player() == common.CHANCE_PLAYER:
-            new_cards.append(ChanceAction(action))
+            if action not in self._get_deck():
+                raise ValueError(f"Not a card of the deck: {action}")
+            new_cards.append(action)
         else:
             new_history.append(PlayerAction(self.get_active_player(), Action(action)))
 
-        return KuhnPoker(new_cards, new_history)
+        return self._create(new_cards, new_history)
+
+
+class KuhnTerminalEvaluator(base_game.TerminalEvaluator):
+    """Payoffs of all terminal states, indexed by deal and terminal history."""
+
+    def __init__(self, deals: Sequence[Sequence[base_game.Action]]) -> None:
+        """Initialize KuhnTerminalEvaluator class.
+
+        :param deals: All deals of both players' cards, in the order of their ids.
+        """
+        histories: list[tuple[Action, ...]] = []
+        self._collect_histories(KuhnPoker(list(deals[0])), (), histories)
+
+        self._deal_ids = {tuple(deal): i for i, deal in enumerate(deals)}
+        self._history_ids = {history: i for i, history in enumerate(histories)}
+        # Indexed by history id first, so that all deals of a history share a tuple.
+        self._payoffs = tuple(
+            tuple(
+                tuple(self._replay(KuhnPoker(list(deal)), history).compute_payoffs())
+                for deal in deals
+            )
+            for history in histories
+        )
+
+    @classmethod
+    def _collect_histories(
+        cls,
+        game: base_game.Game,
+        history: tuple[Action, ...],
+        histories: list[tuple[Action, ...]],
+    ) -> None:
+        if game.is_terminal():
+            histories.append(history)
+            return
+
+        for action in game.get_legal_actions():
+            cls._collect_histories(
+                game.child(action), history + (Action(action),), histories
+            )
+
+    @staticmethod
+    def _replay(game: KuhnPoker, history: Sequence[Action]) -> KuhnPoker:
+        for action in history:
+            game = game.child(action)
+
+        return game
+
+    def get_deal_id(self, cards: Sequence[base_game.Action]) -> int:
+        """Return the id of a deal.
+
+        :param cards: The cards of players 1 and 2.
+        :return: The deal id.
+        """
+        return self._deal_ids[tuple(cards)]
+
+    def get_history_id(self, history: Sequence[Action]) -> int:
+        """Return the id of a terminal history.
+
+        :param history: The actions of the terminal history.
+        :return: The history id.
+        """
+        return self._history_ids[tuple(history)]
+
+    def get_payoffs(self, deal_id: int, history_id: int) -> tuple[float, ...]:
+        """Return the payoffs for players 1 and 2 of a terminal state.
+
+        :param deal_id: The id of the deal.
+        :param history_id: The id of the terminal history.
+        :return: The payoffs for players 1 and 2 in order.
+        """
+        return self._payoffs[history_id][deal_id]
+
+    def get_batch_payoffs(
+        self, deal_ids: Sequence[int], history_id: int
+    ) -> list[Sequence[float]]:
+        """Return the payoffs of the same terminal history for many deals at once.
+
+        :param deal_ids: The ids of the deals.
+        :param history_id: The id of the terminal history.
+        :return: The payoffs for players 1 and 2, one entry per deal.
+        """
+        payoffs = self._payoffs[history_id]
+        return [payoffs[deal_id] for deal_id in deal_ids]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_compiled_table() -> compiled_game.GameTable:
+    return compiled_game.compile_game(KuhnPoker())
+
+
+class CompiledKuhnPoker(compiled_game.CompiledGame):
+    """Drop-in replacement for :obj:`KuhnPoker` backed by a precomputed table."""
+
+    __slots__ = ()
+
+    def __init__(
+        self, table: Optional[compiled_game.GameTable] = None, state_id: int = 0
+    ) -> None:
+        """Initialize CompiledKuhnPoker class.
+
+        :param table: The compiled game, defaults to None to use the shared table
+            of :obj:`KuhnPoker`.
+        :param state_id: The id of the current node, defaults to 0 for the root.
+        """
+        super().__init__(
+            table if table is not None else _get_compiled_table(), state_id
+        )
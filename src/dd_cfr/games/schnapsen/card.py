@@ -71,3 +71,41 @@ class Card:
 
     suit: Suit
     value: Value
+
+
+#: Number of distinct cards in a Schnapsen deck.
+NUMBER_OF_CARDS = len(Suit) * len(Value)
+
+_SUIT_INDICES = {suit: i for i, suit in enumerate(Suit)}
+_VALUE_INDICES = {value: i for i, value in enumerate(Value)}
+_CARDS = tuple(Card(suit, value) for suit in Suit for value in Value)
+
+
+def get_suit_index(suit: Suit) -> int:
+    """Return the index of the given suit, in the order of definition.
+
+    :param suit: The suit to get the index for.
+    :return: The suit's index in the range ``[0, 4)``.
+    """
+
+    return _SUIT_INDICES[suit]
+
+
+def get_card_index(my_card: Card) -> int:
+    """Return the index of the given card, ordered first by suit, then by value.
+
+    :param my_card: The card to get the index for.
+    :return: The card's index in the range ``[0, NUMBER_OF_CARDS)``.
+    """
+
+    return _SUIT_INDICES[my_card.suit] * len(Value) + _VALUE_INDICES[my_card.value]
+
+
+def get_card(index: int) -> Card:
+    """Return the card with the given index, see :func:`get_card_index`.
+
+    :param index: The card's index in the range ``[0, NUMBER_OF_CARDS)``.
+    :return: The card.
+    """
+
+    return _CARDS[index]
@@ -6,20 +6,37 @@ import typing
 from dd_cfr.games.schnapsen import card
 
 
+#: All Schnapsen cards, ordered first by suit, then by value. Card indices used by
+#: permutations refer to this order.
+ALL_CARDS = tuple(card.get_card(index) for index in range(card.NUMBER_OF_CARDS))
+
+
 class Deck:
     """Represents a playing deck (complete set of cards before shuffling, and the talon
     and turn-up card afterwards until they are drawn too).
     """
 
-    def __init__(self, rng: typing.Optional[random.Random] = None) -> None:
+    def __init__(
+        self,
+        rng: typing.Optional[random.Random] = None,
+        permutation: typing.Optional[typing.Sequence[int]] = None,
+    ) -> None:
         """Construct a new, shuffled deck of Schnapsen cards.
 
         :param rng: A random number generator, or ``None`` to use the global state of
             the :obj:`random` module.
+        :param permutation: Optional indices into :obj:`ALL_CARDS` in dealing order,
+            e.g., from a :obj:`dealing.DealingEngine`, used instead of shuffling.
         """
 
-        self._cards = self._get_list_of_all_cards()
-        (rng or random.Random()).shuffle(self._cards)
+        if permutation is None:
+            self._cards = self._get_list_of_all_cards()
+            (rng or random.Random()).shuffle(self._cards)
+        else:
+            self._cards = [ALL_CARDS[index] for index in permutation]
+
+        # Index of the top card; cards before it were dealt already.
+        self._cursor = 0
 
     @staticmethod
     def get_maximum_number_of_cards() -> int:
@@ -37,7 +54,7 @@ class Deck:
         :return: Number of cards left in the stack.
         """
 
-        return len(self._cards)
+        return len(self._cards) - self._cursor
 
     def get_turn_up_card(self) -> card.Card:
         """Return the turn-up card, without removing it from the deck.
@@ -46,7 +63,7 @@ class Deck:
         :return: The turn-up card.
         """
 
-        if not self._cards:
+        if not self.get_number_of_cards():
             raise ValueError("No cards left in deck to deal")
 
         return self._cards[-1]
@@ -59,10 +76,11 @@ class Deck:
         :return: The top card.
         """
 
-        if not self._cards:
+        if not self.get_number_of_cards():
             raise ValueError("No cards left in deck to deal")
 
-        return self._cards.pop(0)
+        self._cursor += 1
+        return self._cards[self._cursor - 1]
 
     @staticmethod
     def _get_list_of_all_cards() -> list[card.Card]:
@@ -71,7 +89,7 @@ class Deck:
         :return: List of all cards, ordered first by suit, then by value.
         """
 
-        return [card.Card(suit, value) for suit in card.Suit for value in card.Value]
+        return list(ALL_CARDS)
 
 
 class Hand:
@@ -87,7 +105,30 @@ class Hand:
         if not len(cards) == 5:
             raise ValueError("{len(cards)} cards were given instead of 5 expected.")
 
+        self._set_cards(cards)
+
+    @classmethod
+    def from_partial(cls, cards: list[card.Card]) -> "Hand":
+        """Construct a hand of a game in progress, i.e., of at most five cards.
+
+        :param cards: A list of up to five cards (contents will be copied).
+        :raises ValueError: If :obj:`cards` is longer than ``5``.
+        :return: The hand.
+        """
+
+        if len(cards) > 5:
+            raise ValueError(f"{len(cards)} cards were given instead of at most 5.")
+
+        hand = cls.__new__(cls)
+        hand._set_cards(cards)
+        return hand
+
+    def _set_cards(self, cards: list[card.Card]) -> None:
         self._cards = cards[:]
+        # Bit ``card.get_card_index(c)`` is set for each card ``c`` in the hand.
+        self._mask = 0
+        for my_card in self._cards:
+            self._mask |= 1 << card.get_card_index(my_card)
 
     def get_number_of_cards(self) -> int:
         """Return the number of cards in the hand.
@@ -132,7 +173,9 @@ class Hand:
         if index not in range(self.get_number_of_cards()):
             raise IndexError(f"Invalid index for hand: {index}")
 
-        return self._cards.pop(index)
+        my_card = self._cards.pop(index)
+        self._mask &= ~(1 << card.get_card_index(my_card))
+        return my_card
 
     def draw(self, deck: Deck) -> None:
         """Draw the top card of the deck, removing it there and adding it to the hand.
@@ -147,7 +190,18 @@ class Hand:
         if deck.get_number_of_cards() == 0:
             raise ValueError("Cannot draw from an empty deck.")
 
-        self._cards.append(deck.deal_top_card())
+        my_card = deck.deal_top_card()
+        self._cards.append(my_card)
+        self._mask |= 1 << card.get_card_index(my_card)
+
+    def get_mask(self) -> int:
+        """Return the cards in the hand as a bitmask.
+
+        :return: The mask with bit ``card.get_card_index(c)`` set for each card ``c``
+            in the hand.
+        """
+
+        return self._mask
 
     def __contains__(self, my_card: card.Card) -> bool:
         """Return whether the given card is in this hand.
@@ -156,7 +210,7 @@ class Hand:
         :return: ``True`` if the card is in the hand, ``False`` otherwise.
         """
 
-        return my_card in self._cards
+        return bool(self._mask >> card.get_card_index(my_card) & 1)
 
 
 class WonCards:
@@ -166,6 +220,10 @@ class WonCards:
         """Construct an empty list of won cards."""
 
         self._cards: list[card.Card] = []
+        # Running total of the cards' point values.
+        self._points = 0
+        # Bit ``card.get_card_index(c)`` is set for each won card ``c``.
+        self._mask = 0
 
     def get_number_of_cards(self) -> int:
         """Return the number of cards won.
@@ -186,15 +244,26 @@ class WonCards:
             raise ValueError(f"Duplicate card: {my_card}")
 
         self._cards.append(my_card)
+        self._points += my_card.value.get_points()
+        self._mask |= 1 << card.get_card_index(my_card)
 
     def get_number_of_points(self) -> int:
-        """Return the number of points by adding up all the point values of the cards in
-        this collection of won cards.
+        """Return the number of points, i.e., the sum of the point values of the cards
+        in this collection of won cards, which is maintained as cards are added.
 
         :return: The sum of the cards' point values.
         """
 
-        return sum(card.value.get_points() for card in self._cards)
+        return self._points
+
+    def get_mask(self) -> int:
+        """Return the won cards as a bitmask.
+
+        :return: The mask with bit ``card.get_card_index(c)`` set for each won card
+            ``c``.
+        """
+
+        return self._mask
 
     def __contains__(self, my_card: card.Card) -> bool:
         """Return whether the given card is in this hand.
@@ -203,4 +272,4 @@ class WonCards:
         :return: ``True`` if the card is in the hand, ``False`` otherwise.
         """
 
-        return my_card in self._cards
+        return bool(self._mask >> card.get_card_index(my_card) & 1)
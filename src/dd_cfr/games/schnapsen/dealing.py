@@ -0,0 +1,90 @@
+"""Defines the :obj:`DealingEngine` class, which shuffles decks reproducibly in bulk.
+
+Each game's shuffle only depends on the engine's seed and the game's id, so workers
+can deal any range of games independently and still agree on every deal. A
+shuffle is derived by hashing the seed and game id into a 64-bit number, which is
+decoded into a permutation of the deck through the factorial number system.
+"""
+
+import hashlib
+import math
+import struct
+
+from dd_cfr.games.schnapsen import card_collection
+
+_NUM_CARDS = card_collection.Deck.get_maximum_number_of_cards()
+_NUM_PERMUTATIONS = math.factorial(_NUM_CARDS)
+# Hash values at or above this bound are rejected to keep permutations uniform.
+_REJECTION_BOUND = (2**64 // _NUM_PERMUTATIONS) * _NUM_PERMUTATIONS
+_HASH_INPUT = struct.Struct("<QQI")
+
+
+class DealingEngine:
+    """Shuffles Schnapsen decks reproducibly, identified by a seed and a game id."""
+
+    def __init__(self, seed: int) -> None:
+        """Construct a dealing engine.
+
+        :param seed: The seed shared by all workers, in the range ``[0, 2**64)``.
+        """
+
+        self._seed = seed
+
+    def _get_permutation_number(self, game_id: int) -> int:
+        """Return a uniformly distributed number in ``[0, 20!)`` for the game.
+
+        :param game_id: The game's id, in the range ``[0, 2**64)``.
+        :return: The number of the game's permutation.
+        """
+
+        attempt = 0
+        while True:
+            digest = hashlib.blake2b(
+                _HASH_INPUT.pack(self._seed, game_id, attempt), digest_size=8
+            ).digest()
+            number = int.from_bytes(digest, "little")
+            if number < _REJECTION_BOUND:
+                return number % _NUM_PERMUTATIONS
+            attempt += 1
+
+    def get_permutation(self, game_id: int) -> bytes:
+        """Return the game's shuffle as indices into :obj:`card_collection.ALL_CARDS`.
+
+        :param game_id: The game's id, in the range ``[0, 2**64)``.
+        :return: The card indices in dealing order, one byte each.
+        """
+
+        number = self._get_permutation_number(game_id)
+        remaining = list(range(_NUM_CARDS))
+        permutation = bytearray(_NUM_CARDS)
+
+        for position in range(_NUM_CARDS):
+            number, index = divmod(number, _NUM_CARDS - position)
+            permutation[position] = remaining.pop(index)
+
+        return bytes(permutation)
+
+    def get_permutations(self, first_game_id: int, count: int) -> bytearray:
+        """Return the shuffles of consecutive games as one array.
+
+        :param first_game_id: The id of the first game.
+        :param count: The number of games.
+        :return: ``count`` rows of 20 card indices each, one byte per index, where
+            row ``i`` is the shuffle of game ``first_game_id + i``.
+        """
+
+        permutations = bytearray(count * _NUM_CARDS)
+        for i in range(count):
+            start, end = i * _NUM_CARDS, (i + 1) * _NUM_CARDS
+            permutations[start:end] = self.get_permutation(first_game_id + i)
+
+        return permutations
+
+    def get_deck(self, game_id: int) -> card_collection.Deck:
+        """Return the game's shuffled deck.
+
+        :param game_id: The game's id, in the range ``[0, 2**64)``.
+        :return: The shuffled deck.
+        """
+
+        return card_collection.Deck(permutation=self.get_permutation(game_id))
@@ -0,0 +1,103 @@
+"""Encodes Schnapsen observations as fixed-size rows of numbers.
+
+An encoded :obj:`pimc.Observation` consists of five planes of one value per card,
+see :func:`card.get_card_index`, followed by the one-hot trump suit and the scores:
+
+* the player's hand,
+* the cards won by the player and by the opponent,
+* the cards known to be in the opponent's hand, e.g., the turn-up card they drew,
+* the card led to the current trick, if any,
+* the trump suit,
+* the number of cards in the opponent's hand, as a fraction of a full hand,
+* whether the player leads the current trick,
+* the points of the player and of the opponent, including announced marriages, as
+  fractions of :obj:`endgame.WINNING_POINTS`.
+"""
+
+import array
+import typing
+
+from dd_cfr.games.schnapsen import card, endgame, pimc
+
+_NUM_PLANES = 5
+_TRUMP_OFFSET = _NUM_PLANES * card.NUMBER_OF_CARDS
+_SCORE_OFFSET = _TRUMP_OFFSET + len(card.Suit)
+_HAND_SIZE = 5
+
+#: The number of values of an encoded observation.
+OBSERVATION_SIZE = _SCORE_OFFSET + 4
+
+
+def _write_plane(out: array.array, offset: int, plane: int, mask: int) -> None:
+    start = offset + plane * card.NUMBER_OF_CARDS
+    for index in range(card.NUMBER_OF_CARDS):
+        out[start + index] = float(mask >> index & 1)
+
+
+def _get_mask(cards: typing.Iterable[card.Card]) -> int:
+    mask = 0
+    for my_card in cards:
+        mask |= 1 << card.get_card_index(my_card)
+
+    return mask
+
+
+def encode_observation(
+    observation: pimc.Observation, out: array.array, offset: int = 0
+) -> None:
+    """Write an observation as :obj:`OBSERVATION_SIZE` numbers into a buffer.
+
+    :param observation: The observation to encode.
+    :param out: The buffer to write to, e.g., a row of a batch.
+    :param offset: The index of the first value to write, defaults to 0.
+    """
+
+    player = observation.player
+    opponent = 1 - player
+    lead = [observation.lead] if observation.lead is not None else []
+    masks = (
+        observation.hand.get_mask(),
+        observation.won_cards[player].get_mask(),
+        observation.won_cards[opponent].get_mask(),
+        _get_mask(observation.known_opponent_cards),
+        _get_mask(lead),
+    )
+    for plane, mask in enumerate(masks):
+        _write_plane(out, offset, plane, mask)
+
+    for suit in card.Suit:
+        out[offset + _TRUMP_OFFSET + card.get_suit_index(suit)] = float(
+            suit == observation.trump
+        )
+
+    points = [
+        won_cards.get_number_of_points() + marriage_points
+        for won_cards, marriage_points in zip(
+            observation.won_cards, observation.marriage_points
+        )
+    ]
+    out[offset + _SCORE_OFFSET] = observation.opponent_hand_size / _HAND_SIZE
+    out[offset + _SCORE_OFFSET + 1] = float(observation.leader == player)
+    out[offset + _SCORE_OFFSET + 2] = points[player] / endgame.WINNING_POINTS
+    out[offset + _SCORE_OFFSET + 3] = points[opponent] / endgame.WINNING_POINTS
+
+
+def encode_observations(
+    observations: typing.Sequence[pimc.Observation],
+    out: typing.Optional[array.array] = None,
+) -> array.array:
+    """Encode many observations into consecutive rows of one buffer.
+
+    :param observations: The observations to encode.
+    :param out: The buffer to write to, defaults to None to allocate one. Reusing
+        the buffer encodes batches without allocating.
+    :return: The buffer, whose row ``i`` holds the encoding of ``observations[i]``.
+    """
+
+    if out is None:
+        out = array.array("f", bytes(4 * OBSERVATION_SIZE * len(observations)))
+
+    for i, observation in enumerate(observations):
+        encode_observation(observation, out, i * OBSERVATION_SIZE)
+
+    return out
@@ -0,0 +1,372 @@
+"""Defines the :obj:`EndgameSolver` class, which solves Schnapsen endgames exactly.
+
+Once the talon is exhausted or closed, and both hands are known, Schnapsen is a game
+of perfect information under strict rules: the responding player must follow the
+lead suit and win the trick if possible, and must play a trump if they cannot
+follow suit. The solver searches the remaining tricks with alpha-beta pruning over
+bitmasks of the hands, ordering moves by card value and caching results in a
+transposition table keyed by Zobrist hashes of the card ownership.
+
+A player wins as soon as their points reach 66 after a trick, otherwise the winner
+of the last trick wins. Game values are the zero-sum game points of the first
+player, see :mod:`scoring`. Marriages are not announced during the search, but
+points of earlier marriages can be passed in, and the additional rules for a
+player who closed the talon but fails to reach 66 are not modelled.
+"""
+
+import dataclasses
+import random
+import time
+import typing
+
+from dd_cfr.games.schnapsen import card, card_collection, scoring, trick
+
+#: The points needed to win a game.
+WINNING_POINTS = 66
+
+_EXACT, _LOWER_BOUND, _UPPER_BOUND = range(3)
+_NO_LEAD = -1
+# Bounds of the search window, just outside the range of game values.
+_MIN_VALUE, _MAX_VALUE = -scoring.MAX_GAME_POINTS - 1, scoring.MAX_GAME_POINTS + 1
+
+_POINTS = tuple(
+    card.get_card(i).value.get_points() for i in range(card.NUMBER_OF_CARDS)
+)
+#: Card indices by descending value, the order in which moves are searched.
+_MOVE_ORDER = tuple(sorted(range(card.NUMBER_OF_CARDS), key=lambda i: -_POINTS[i]))
+_SUIT_MASKS = tuple(
+    sum(
+        1 << i
+        for i in range(card.NUMBER_OF_CARDS)
+        if card.get_suit_index(card.get_card(i).suit) == suit
+    )
+    for suit in range(len(card.Suit))
+)
+#: The mask of the cards of the same suit that beat each card.
+_HIGHER_MASKS = tuple(
+    sum(
+        1 << j
+        for j in range(card.NUMBER_OF_CARDS)
+        if _SUIT_MASKS[card.get_suit_index(card.get_card(i).suit)] >> j & 1
+        and _POINTS[j] > _POINTS[i]
+    )
+    for i in range(card.NUMBER_OF_CARDS)
+)
+
+_zobrist_rng = random.Random(0)
+#: Random keys per card index and owning player.
+_ZOBRIST_CARDS = tuple(
+    (_zobrist_rng.getrandbits(64), _zobrist_rng.getrandbits(64))
+    for _ in range(card.NUMBER_OF_CARDS)
+)
+
+
+@dataclasses.dataclass
+class SearchStatistics:
+    """Search effort of an :obj:`EndgameSolver`."""
+
+    #: Number of searched nodes.
+    nodes: int
+    #: Number of transposition table lookups.
+    lookups: int
+    #: Number of lookups that found an entry.
+    hits: int
+    #: Time spent searching.
+    seconds: float
+
+    def get_nodes_per_second(self) -> float:
+        """Return the search speed.
+
+        :return: Nodes per second, ``0.0`` before the first search.
+        """
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+    def get_hit_rate(self) -> float:
+        """Return the fraction of transposition table lookups that found an entry.
+
+        :return: The hit rate, ``0.0`` before the first lookup.
+        """
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+@dataclasses.dataclass(frozen=True)
+class _Position:
+    hands: tuple[int, int]
+    points: tuple[int, int]
+    won_tricks: tuple[bool, bool]
+    leader: int
+    lead: int
+    zobrist: int
+
+
+class EndgameSolver:
+    """Solves Schnapsen endgames with both hands known."""
+
+    def __init__(self, trump: card.Suit) -> None:
+        """Construct an endgame solver.
+
+        :param trump: The trump suit.
+        """
+
+        self._trump = card.get_suit_index(trump)
+        self._table: dict[tuple[int, ...], tuple[int, int]] = {}
+        self._nodes = 0
+        self._lookups = 0
+        self._hits = 0
+        self._seconds = 0.0
+
+    def get_statistics(self) -> SearchStatistics:
+        """Return the search statistics since the solver was constructed.
+
+        :return: The search statistics.
+        """
+
+        return SearchStatistics(
+            nodes=self._nodes,
+            lookups=self._lookups,
+            hits=self._hits,
+            seconds=self._seconds,
+        )
+
+    def clear(self) -> None:
+        """Clear the transposition table."""
+
+        self._table.clear()
+
+    def _get_legal_cards(self, hand: int, lead: int) -> int:
+        if lead == _NO_LEAD:
+            return hand
+
+        same_suit = hand & _SUIT_MASKS[card.get_suit_index(card.get_card(lead).suit)]
+        if same_suit:
+            return same_suit & _HIGHER_MASKS[lead] or same_suit
+
+        return hand & _SUIT_MASKS[self._trump] or hand
+
+    def _play(self, position: _Position, my_card: int) -> tuple[_Position, int]:
+        """Play a card and return the new position and the game value, if it ended.
+
+        :param position: The position to play the card in.
+        :param my_card: The index of the card to play.
+        :return: The new position and the game value for the first player, or 0 if
+            the game continues, which is never a game value.
+        """
+
+        player = self._get_player(position)
+        hands = list(position.hands)
+        hands[player] &= ~(1 << my_card)
+        zobrist = position.zobrist ^ _ZOBRIST_CARDS[my_card][player]
+
+        if position.lead == _NO_LEAD:
+            return (
+                _Position(
+                    (hands[0], hands[1]),
+                    position.points,
+                    position.won_tricks,
+                    position.leader,
+                    my_card,
+                    zobrist,
+                ),
+                0,
+            )
+
+        winner = (
+            position.leader
+            if trick.get_trick_winner_by_index(position.lead, my_card, self._trump)
+            == trick.LEAD
+            else player
+        )
+        points = list(position.points)
+        points[winner] += _POINTS[position.lead] + _POINTS[my_card]
+        won_tricks = list(position.won_tricks)
+        won_tricks[winner] = True
+
+        value = 0
+        if points[winner] >= WINNING_POINTS or not hands[0] | hands[1]:
+            loser = 1 - winner
+            value = scoring.get_game_points_by_points(points[loser], won_tricks[loser])
+            value = value if winner == 0 else -value
+
+        return (
+            _Position(
+                (hands[0], hands[1]),
+                (points[0], points[1]),
+                (won_tricks[0], won_tricks[1]),
+                winner,
+                _NO_LEAD,
+                zobrist,
+            ),
+            value,
+        )
+
+    @staticmethod
+    def _get_player(position: _Position) -> int:
+        return position.leader if position.lead == _NO_LEAD else 1 - position.leader
+
+    def _get_moves(self, position: _Position) -> list[int]:
+        player = self._get_player(position)
+        legal = self._get_legal_cards(position.hands[player], position.lead)
+        return [i for i in _MOVE_ORDER if legal >> i & 1]
+
+    def _probe(
+        self, key: tuple[int, ...], alpha: int, beta: int
+    ) -> tuple[typing.Optional[int], int, int]:
+        """Look up a position in the transposition table.
+
+        :param key: The position's key.
+        :param alpha: The lower bound of the search window.
+        :param beta: The upper bound of the search window.
+        :return: The position's value if known within the window, and the narrowed
+            window.
+        """
+
+        self._lookups += 1
+        if key not in self._table:
+            return None, alpha, beta
+
+        self._hits += 1
+        value, bound = self._table[key]
+        if bound == _LOWER_BOUND:
+            alpha = max(alpha, value)
+        elif bound == _UPPER_BOUND:
+            beta = min(beta, value)
+
+        return (value if bound == _EXACT or alpha >= beta else None), alpha, beta
+
+    def _search(self, position: _Position, alpha: int, beta: int) -> int:
+        self._nodes += 1
+
+        key = (
+            position.zobrist,
+            position.points[0],
+            position.points[1],
+            position.won_tricks[0],
+            position.won_tricks[1],
+            position.leader,
+            position.lead,
+        )
+        known, alpha, beta = self._probe(key, alpha, beta)
+        if known is not None:
+            return known
+
+        # The searched window decides which kind of bound the result is.
+        original_alpha, original_beta = alpha, beta
+        player = self._get_player(position)
+        best = _MIN_VALUE if player == 0 else _MAX_VALUE
+
+        for my_card in self._get_moves(position):
+            child, value = self._play(position, my_card)
+            if not value:
+                value = self._search(child, alpha, beta)
+
+            if player == 0:
+                best = max(best, value)
+                alpha = max(alpha, best)
+            else:
+                best = min(best, value)
+                beta = min(beta, best)
+            if alpha >= beta:
+                break
+
+        if best <= original_alpha:
+            self._table[key] = (best, _UPPER_BOUND)
+        elif best >= original_beta:
+            self._table[key] = (best, _LOWER_BOUND)
+        else:
+            self._table[key] = (best, _EXACT)
+
+        return best
+
+    def _get_position(
+        self,
+        hands: typing.Sequence[card_collection.Hand],
+        won_cards: typing.Sequence[card_collection.WonCards],
+        leader: int,
+        lead: typing.Optional[card.Card],
+        marriage_points: typing.Sequence[int],
+    ) -> _Position:
+        masks = (hands[0].get_mask(), hands[1].get_mask())
+        zobrist = 0
+        for player, mask in enumerate(masks):
+            for i in range(card.NUMBER_OF_CARDS):
+                if mask >> i & 1:
+                    zobrist ^= _ZOBRIST_CARDS[i][player]
+
+        return _Position(
+            masks,
+            (
+                won_cards[0].get_number_of_points() + marriage_points[0],
+                won_cards[1].get_number_of_points() + marriage_points[1],
+            ),
+            (
+                won_cards[0].get_number_of_cards() > 0,
+                won_cards[1].get_number_of_cards() > 0,
+            ),
+            leader,
+            _NO_LEAD if lead is None else card.get_card_index(lead),
+            zobrist,
+        )
+
+    def get_card_values(
+        self,
+        hands: typing.Sequence[card_collection.Hand],
+        won_cards: typing.Sequence[card_collection.WonCards],
+        leader: int,
+        lead: typing.Optional[card.Card] = None,
+        marriage_points: typing.Sequence[int] = (0, 0),
+    ) -> list[tuple[card.Card, int]]:
+        """Return the exact game value of each legal card of the player to move.
+
+        :param hands: The hands of both players, without the lead card.
+        :param won_cards: The cards won by both players so far.
+        :param leader: The player leading the current trick.
+        :param lead: The card already led to the current trick, or ``None`` if the
+            leader is to move.
+        :param marriage_points: The points both players announced in marriages,
+            defaults to ``(0, 0)``.
+        :return: Pairs of legal cards, by descending card value, and the game value
+            for the first player after playing them.
+        """
+
+        start = time.perf_counter()
+        position = self._get_position(hands, won_cards, leader, lead, marriage_points)
+
+        card_values = []
+        for my_card in self._get_moves(position):
+            child, value = self._play(position, my_card)
+            if not value:
+                value = self._search(child, _MIN_VALUE, _MAX_VALUE)
+            card_values.append((card.get_card(my_card), value))
+
+        self._seconds += time.perf_counter() - start
+        return card_values
+
+    def solve(
+        self,
+        hands: typing.Sequence[card_collection.Hand],
+        won_cards: typing.Sequence[card_collection.WonCards],
+        leader: int,
+        lead: typing.Optional[card.Card] = None,
+        marriage_points: typing.Sequence[int] = (0, 0),
+    ) -> int:
+        """Return the exact game value of the endgame.
+
+        :param hands: The hands of both players, without the lead card.
+        :param won_cards: The cards won by both players so far.
+        :param leader: The player leading the current trick.
+        :param lead: The card already led to the current trick, or ``None`` if the
+            leader is to move.
+        :param marriage_points: The points both players announced in marriages,
+            defaults to ``(0, 0)``.
+        :return: The game points of the first player under optimal play of both.
+        """
+
+        start = time.perf_counter()
+        value = self._search(
+            self._get_position(hands, won_cards, leader, lead, marriage_points),
+            _MIN_VALUE,
+            _MAX_VALUE,
+        )
+        self._seconds += time.perf_counter() - start
+
+        return value
@@ -0,0 +1,83 @@
+"""Buckets Schnapsen hands of similar strength into the same abstract hand."""
+
+import random
+import typing
+
+from dd_cfr.games import abstraction
+from dd_cfr.games.schnapsen import card, card_collection
+
+
+def get_hand_features(hand: card_collection.Hand, trump: card.Suit) -> list[float]:
+    """Return hand-strength features of the given hand.
+
+    The features are the card points (in tens), the number of trumps, the trump
+    points (in tens), the number of aces and tens, the number of marriages (king
+    and queen of the same suit), and whether the hand holds the trump marriage.
+
+    :param hand: The hand to describe.
+    :param trump: The trump suit.
+    :return: The hand's features.
+    """
+    cards = [hand.get_card(i) for i in range(hand.get_number_of_cards())]
+    trumps = [my_card for my_card in cards if my_card.suit == trump]
+    marriage_suits = [
+        suit
+        for suit in card.Suit
+        if card.Card(suit, card.Value.KING) in cards
+        and card.Card(suit, card.Value.QUEEN) in cards
+    ]
+
+    return [
+        sum(my_card.value.get_points() for my_card in cards) / 10,
+        len(trumps),
+        sum(my_card.value.get_points() for my_card in trumps) / 10,
+        sum(my_card.value in (card.Value.ACE, card.Value.TEN) for my_card in cards),
+        len(marriage_suits),
+        float(trump in marriage_suits),
+    ]
+
+
+class HandBucketing:
+    """Assigns hands to buckets by k-means clustering of their features."""
+
+    def __init__(
+        self, num_buckets: int, rng: typing.Optional[random.Random] = None
+    ) -> None:
+        """Initialize HandBucketing class.
+
+        :param num_buckets: The number of buckets.
+        :param rng: A random number generator used to seed the clustering, or
+            ``None`` to use an unseeded one.
+        """
+        self._num_buckets = num_buckets
+        self._rng = rng or random.Random()
+        self._centroids: list[list[float]] = []
+
+    def fit(
+        self, hands: typing.Sequence[card_collection.Hand], trump: card.Suit
+    ) -> None:
+        """Compute the buckets from a sample of hands.
+
+        :param hands: The sample of hands, at least as many as there are buckets.
+        :param trump: The trump suit of the sampled hands.
+        """
+        self._centroids = abstraction.get_k_means_centroids(
+            [get_hand_features(hand, trump) for hand in hands],
+            self._num_buckets,
+            self._rng,
+        )
+
+    def get_bucket(self, hand: card_collection.Hand, trump: card.Suit) -> int:
+        """Return the bucket of the given hand.
+
+        :param hand: The hand to assign.
+        :param trump: The trump suit.
+        :raises ValueError: If :meth:`fit` was not called yet.
+        :return: The hand's bucket in the range ``[0, num_buckets)``.
+        """
+        if not self._centroids:
+            raise ValueError("HandBucketing.fit must be called before get_bucket.")
+
+        return abstraction.get_nearest_centroid(
+            get_hand_features(hand, trump), self._centroids
+        )
@@ -0,0 +1,246 @@
+"""Defines the :obj:`PIMCPlayer` class, which plays Schnapsen endgames by sampling.
+
+Perfect information Monte Carlo (PIMC) samples determinizations, i.e., assignments
+of the unseen cards to the opponent's hand that are consistent with everything the
+player observed. Each determinization is solved exactly by the
+:obj:`endgame.EndgameSolver`, and every determinization votes for its best cards.
+Determinizations are evaluated in batches, optionally in worker processes, and the
+player can stop after a time budget with the best card found so far.
+"""
+
+import concurrent.futures
+import dataclasses
+import time
+import typing
+
+from dd_cfr import rng
+from dd_cfr.games.schnapsen import card, card_collection, endgame
+
+
+@dataclasses.dataclass
+class Observation:
+    """Everything the player to move knows about an endgame."""
+
+    #: The player to move, 0 or 1.
+    player: int
+    #: The cards in the player's hand.
+    hand: card_collection.Hand
+    #: The cards won by both players so far.
+    won_cards: typing.Sequence[card_collection.WonCards]
+    #: The trump suit.
+    trump: card.Suit
+    #: The number of cards in the opponent's hand.
+    opponent_hand_size: int
+    #: The player leading the current trick.
+    leader: int
+    #: The card already led to the current trick, if the player responds.
+    lead: typing.Optional[card.Card] = None
+    #: Cards known to be in the opponent's hand, e.g., the turn-up card they drew.
+    known_opponent_cards: typing.Sequence[card.Card] = ()
+    #: The points both players announced in marriages.
+    marriage_points: typing.Sequence[int] = (0, 0)
+
+
+@dataclasses.dataclass
+class Decision:
+    """The card chosen by a :obj:`PIMCPlayer`, with the votes behind it."""
+
+    #: The chosen card.
+    choice: card.Card
+    #: Pairs of legal cards and their votes, by descending votes.
+    votes: list[tuple[card.Card, float]]
+    #: Number of evaluated determinizations.
+    determinizations: int
+    #: Time taken to decide.
+    seconds: float
+
+
+def _get_unseen_cards(observation: Observation) -> list[card.Card]:
+    seen_mask = observation.hand.get_mask()
+    for won_cards in observation.won_cards:
+        seen_mask |= won_cards.get_mask()
+    for my_card in list(observation.known_opponent_cards) + (
+        [observation.lead] if observation.lead is not None else []
+    ):
+        seen_mask |= 1 << card.get_card_index(my_card)
+
+    return [
+        my_card
+        for my_card in card_collection.ALL_CARDS
+        if not seen_mask >> card.get_card_index(my_card) & 1
+    ]
+
+
+def _evaluate_batch(
+    observation: Observation, seeds: rng.SeedSequence, count: int
+) -> list[list[tuple[int, int]]]:
+    """Sample and solve a batch of determinizations.
+
+    :param observation: The player's observation.
+    :param seeds: The seeds of the batch.
+    :param count: The number of determinizations.
+    :return: Per determinization, the legal cards' indices and game values for the
+        player to move.
+    """
+    solver = endgame.EndgameSolver(observation.trump)
+    unseen_cards = _get_unseen_cards(observation)
+    known_cards = list(observation.known_opponent_cards)
+    hand = [
+        observation.hand.get_card(i)
+        for i in range(observation.hand.get_number_of_cards())
+    ]
+    sign = 1 if observation.player == 0 else -1
+
+    results = []
+    for i in range(count):
+        opponent_hand = known_cards + seeds.spawn(i).get_random().sample(
+            unseen_cards, observation.opponent_hand_size - len(known_cards)
+        )
+        hands = [
+            card_collection.Hand.from_partial(hand),
+            card_collection.Hand.from_partial(opponent_hand),
+        ]
+        if observation.player == 1:
+            hands.reverse()
+
+        card_values = solver.get_card_values(
+            hands,
+            observation.won_cards,
+            observation.leader,
+            observation.lead,
+            observation.marriage_points,
+        )
+        results.append(
+            [(card.get_card_index(c), sign * value) for c, value in card_values]
+        )
+
+    return results
+
+
+class PIMCPlayer:
+    """Chooses cards by voting over solved determinizations."""
+
+    def __init__(
+        self,
+        num_determinizations: int = 100,
+        batch_size: int = 10,
+        time_budget: typing.Optional[float] = None,
+        seed: int = 0,
+    ) -> None:
+        """Construct a PIMC player.
+
+        :param num_determinizations: The maximum number of determinizations per
+            move, defaults to 100.
+        :param batch_size: The number of determinizations per task, defaults to 10.
+        :param time_budget: If set, the seconds per move after which the player
+            stops evaluating and decides on the determinizations evaluated so far,
+            defaults to None. At least one batch is always evaluated.
+        :param seed: The seed of the player's random streams, defaults to 0.
+        """
+
+        self._num_determinizations = num_determinizations
+        self._batch_size = batch_size
+        self._time_budget = time_budget
+        self._seeds = rng.SeedSequence(seed)
+        self._moves = 0
+
+    def _is_over_budget(self, start: float) -> bool:
+        return (
+            self._time_budget is not None
+            and time.perf_counter() - start >= self._time_budget
+        )
+
+    def _evaluate(
+        self,
+        observation: Observation,
+        executor: typing.Optional[concurrent.futures.Executor],
+        start: float,
+    ) -> list[list[tuple[int, int]]]:
+        seeds = self._seeds.spawn(self._moves)
+        batches = [
+            (seeds.spawn(i), min(self._batch_size, self._num_determinizations - first))
+            for i, first in enumerate(
+                range(0, self._num_determinizations, self._batch_size)
+            )
+        ]
+
+        results: list[list[tuple[int, int]]] = []
+        if executor is None:
+            for batch_seeds, count in batches:
+                results += _evaluate_batch(observation, batch_seeds, count)
+                if self._is_over_budget(start):
+                    break
+            return results
+
+        # Results are merged in batch order to match the evaluation in this process.
+        indices = {
+            executor.submit(_evaluate_batch, observation, batch_seeds, count): i
+            for i, (batch_seeds, count) in enumerate(batches)
+        }
+        batch_results: dict[int, list[list[tuple[int, int]]]] = {}
+        pending = set(indices)
+        while pending:
+            # Until the first batch is done, wait for it regardless of the budget.
+            remaining = (
+                None
+                if self._time_budget is None or not batch_results
+                else max(start + self._time_budget - time.perf_counter(), 0.0)
+            )
+            done, pending = concurrent.futures.wait(
+                pending, remaining, concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                batch_results[indices[future]] = future.result()
+            if batch_results and self._is_over_budget(start):
+                break
+
+        for future in pending:
+            future.cancel()
+        for i in sorted(batch_results):
+            results += batch_results[i]
+        return results
+
+    def choose_card(
+        self,
+        observation: Observation,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+    ) -> Decision:
+        """Choose a card to play.
+
+        :param observation: The player's observation.
+        :param executor: Optional executor, e.g., a process pool, evaluating the
+            batches in parallel, defaults to None to evaluate them in this process.
+        :raises ValueError: If there are too few unseen cards for the opponent's
+            hand.
+        :return: The decision.
+        """
+
+        if (
+            len(_get_unseen_cards(observation)) + len(observation.known_opponent_cards)
+            < observation.opponent_hand_size
+        ):
+            raise ValueError("Too few unseen cards for the opponent's hand.")
+
+        start = time.perf_counter()
+        results = self._evaluate(observation, executor, start)
+        self._moves += 1
+
+        votes: dict[int, float] = {}
+        values: dict[int, float] = {}
+        for card_values in results:
+            best = max(value for _, value in card_values)
+            best_cards = [i for i, value in card_values if value == best]
+            for i, value in card_values:
+                votes[i] = votes.get(i, 0.0) + (
+                    1 / len(best_cards) if i in best_cards else 0.0
+                )
+                values[i] = values.get(i, 0.0) + value
+
+        # Ties in votes are broken by the total game value.
+        ranking = sorted(votes, key=lambda i: (votes[i], values[i]), reverse=True)
+        return Decision(
+            choice=card.get_card(ranking[0]),
+            votes=[(card.get_card(i), votes[i]) for i in ranking],
+            determinizations=len(results),
+            seconds=time.perf_counter() - start,
+        )
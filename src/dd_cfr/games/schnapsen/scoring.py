@@ -0,0 +1,77 @@
+"""Defines lookup tables for scoring a finished Schnapsen game.
+
+The player who reaches 66 points wins game points depending on the opponent's
+result: one game point if the opponent has at least 33 points, two if the opponent
+has fewer points but won a trick, and three if the opponent won no trick at all.
+"""
+
+import typing
+
+from dd_cfr.games.schnapsen import card_collection
+
+#: The largest possible number of points from won cards.
+MAX_POINTS = 120
+
+#: Game points of the winner, indexed by the number of points of the loser who won
+#: at least one trick.
+_GAME_POINTS = tuple(1 if points >= 33 else 2 for points in range(MAX_POINTS + 1))
+
+#: The largest number of game points won in a single game.
+MAX_GAME_POINTS = 3
+
+#: Game points of the winner if the loser won no trick.
+_GAME_POINTS_WITHOUT_TRICKS = MAX_GAME_POINTS
+
+
+def get_game_points(loser: card_collection.WonCards) -> int:
+    """Return the game points won against the given loser.
+
+    :param loser: The cards won by the losing player.
+    :return: The winner's game points, from 1 to 3.
+    """
+
+    return get_game_points_by_points(
+        loser.get_number_of_points(), loser.get_number_of_cards() > 0
+    )
+
+
+def get_game_points_by_points(loser_points: int, loser_won_trick: bool) -> int:
+    """Return the game points won against a loser with the given result.
+
+    :param loser_points: The points of the losing player.
+    :param loser_won_trick: Whether the losing player won at least one trick.
+    :return: The winner's game points, from 1 to 3.
+    """
+
+    if not loser_won_trick:
+        return _GAME_POINTS_WITHOUT_TRICKS
+
+    return _GAME_POINTS[min(loser_points, MAX_POINTS)]
+
+
+def get_payoffs(winner: int, loser: card_collection.WonCards) -> list[float]:
+    """Return the payoffs for players 1 and 2 of a finished game.
+
+    :param winner: The winning player, 0 or 1.
+    :param loser: The cards won by the losing player.
+    :return: The zero-sum payoffs for players 1 and 2 in order.
+    """
+
+    game_points = get_game_points(loser)
+    payoffs = [float(-game_points)] * 2
+    payoffs[winner] = float(game_points)
+
+    return payoffs
+
+
+def get_batch_payoffs(
+    winners: typing.Sequence[int], losers: typing.Sequence[card_collection.WonCards]
+) -> list[list[float]]:
+    """Return the payoffs of many finished games at once.
+
+    :param winners: The winning player of each game.
+    :param losers: The cards won by the losing player of each game.
+    :return: The payoffs for players 1 and 2, one entry per game.
+    """
+
+    return [get_payoffs(winner, loser) for winner, loser in zip(winners, losers)]
@@ -0,0 +1,59 @@
+"""Defines a lookup table for deciding who wins a trick.
+
+The response wins a trick if it follows the lead suit with a higher value, or if
+it is a trump and the lead is not. Otherwise, the lead wins.
+"""
+
+from dd_cfr.games.schnapsen import card
+
+#: Index of the lead card's player in trick results.
+LEAD = 0
+
+#: Index of the responding player in trick results.
+RESPONSE = 1
+
+
+def _get_winner(lead: card.Card, response: card.Card, trump: card.Suit) -> int:
+    if response.suit == lead.suit:
+        return (
+            RESPONSE if response.value.get_points() > lead.value.get_points() else LEAD
+        )
+
+    return RESPONSE if response.suit == trump else LEAD
+
+
+#: Winners by lead card index, response card index, and trump suit index, flattened.
+_WINNERS = bytes(
+    _get_winner(card.get_card(lead), card.get_card(response), trump)
+    for lead in range(card.NUMBER_OF_CARDS)
+    for response in range(card.NUMBER_OF_CARDS)
+    for trump in card.Suit
+)
+
+
+def get_trick_winner_by_index(lead: int, response: int, trump: int) -> int:
+    """Return who wins a trick given as card and suit indices, in a single lookup.
+
+    :param lead: The index of the lead card, see :func:`card.get_card_index`.
+    :param response: The index of the response card.
+    :param trump: The index of the trump suit, see :func:`card.get_suit_index`.
+    :return: :obj:`LEAD` or :obj:`RESPONSE`.
+    """
+
+    return _WINNERS[(lead * card.NUMBER_OF_CARDS + response) * len(card.Suit) + trump]
+
+
+def get_trick_winner(lead: card.Card, response: card.Card, trump: card.Suit) -> int:
+    """Return who wins a trick.
+
+    :param lead: The card played first.
+    :param response: The card played in response.
+    :param trump: The trump suit.
+    :return: :obj:`LEAD` or :obj:`RESPONSE`.
+    """
+
+    return get_trick_winner_by_index(
+        card.get_card_index(lead),
+        card.get_card_index(response),
+        card.get_suit_index(trump),
+    )
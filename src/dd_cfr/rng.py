@@ -0,0 +1,106 @@
+"""Reproducible random number streams derived from a single run seed.
+
+A :obj:`SeedSequence` identifies a stream by the run seed and a path of keys, e.g.,
+``SeedSequence(seed).spawn("worker", 3).spawn("iteration", 17)``. The seed of each
+stream is a hash of its path, so streams are independent of each other and can be
+recreated in any process, in any order, to replay a run exactly.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import itertools
+import random
+from typing import Sequence, Union
+
+Key = Union[int, str]
+
+
+class SeedSequence:
+    """Derives the seeds of independent random streams from a run seed."""
+
+    def __init__(self, seed: int, path: Sequence[Key] = ()) -> None:
+        """Initialize SeedSequence class.
+
+        :param seed: The seed of the run.
+        :param path: The keys identifying this stream within the run, defaults to
+            the run's root stream.
+        """
+        self._seed = seed
+        self._path = tuple(path)
+
+    def spawn(self, *keys: Key) -> SeedSequence:
+        """Return the sequence of a substream, e.g., of a worker or an iteration.
+
+        :param keys: The keys identifying the substream within this stream.
+        :return: The substream's sequence.
+        """
+        return SeedSequence(self._seed, self._path + keys)
+
+    def get_seed(self) -> int:
+        """Return the 64-bit seed of this stream.
+
+        :return: The seed.
+        """
+        key = repr((self._seed,) + self._path).encode()
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+    def get_random(self) -> random.Random:
+        """Return a random number generator seeded for this stream.
+
+        :return: The generator, e.g., for ``Deck`` or ``HandBucketing``.
+        """
+        return random.Random(self.get_seed())
+
+    def get_stream(self) -> RandomStream:
+        """Return a random stream seeded for this stream.
+
+        :return: The stream.
+        """
+        return RandomStream(self.get_seed())
+
+
+class RandomStream(random.Random):
+    """A random number generator with helpers for sampling from weights.
+
+    Draws come straight from :obj:`random.Random`, which is faster than serving
+    them from pre-generated batches.
+    """
+
+    def get_batch(self, count: int) -> list[float]:
+        """Return the next uniform random numbers.
+
+        :param count: The number of values.
+        :return: ``count`` numbers in ``[0, 1)``, the same as from as many calls to
+            :meth:`random`.
+        """
+        draw = self.random
+        return [draw() for _ in range(count)]
+
+    def choose(self, weights: Sequence[float]) -> int:
+        """Return a random index, chosen with probability proportional to its weight.
+
+        :param weights: The non-negative weights, not all zero.
+        :return: The chosen index.
+        """
+        cumulative_weights = list(itertools.accumulate(weights))
+        index = bisect.bisect_right(
+            cumulative_weights, self.random() * cumulative_weights[-1]
+        )
+        return min(index, len(weights) - 1)
+
+    def choose_cumulative(self, cumulative_weights: Sequence[float]) -> int:
+        """Return a random index, chosen by precomputed cumulative weights.
+
+        Like ``cum_weights`` of :meth:`random.Random.choices`, this saves summing up
+        the weights on every call when they are reused, e.g., at a chance node.
+
+        :param cumulative_weights: The running totals of the non-negative weights,
+            the last one positive.
+        :return: The chosen index.
+        """
+        index = bisect.bisect_right(
+            cumulative_weights, self.random() * cumulative_weights[-1]
+        )
+        return min(index, len(cumulative_weights) - 1)
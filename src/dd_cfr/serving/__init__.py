@@ -0,0 +1 @@
+"""Package holding servers for computed policies."""
@@ -0,0 +1,593 @@
+"""Sharded parameter server for the regret and policy tables of tabular CFR.
+
+Each shard is a :obj:`ParameterServer` holding the rows of the states that hash to
+it in a :obj:`cfr.CFR` table. A :obj:`TraversalWorker` solves a game through a
+:obj:`ParameterClient`, which pools connections per shard and exchanges the updates
+of one traversal and the policy queries of the next one in a single round trip per
+shard, with requests to all shards pipelined. :func:`start_shards` runs the shards
+as local subprocesses; across machines, each machine runs :func:`serve_shard` and
+the clients are given the shards' addresses.
+
+Messages are frames of a little-endian ``uint32`` body length, a ``uint8`` opcode
+and the body. A state is its ``uint16`` UTF-8 length and bytes, and every list of
+actions is preceded by its ``uint8`` length. Actions are ``int16`` enum values.
+
+* ``EXCHANGE``: a ``uint8`` regret-matching+ flag and the ``uint32`` numbers of
+  updates and queries. Per update, a state and its actions, each with ``float64``
+  increments of the cumulative regret and policy, and per query, a state and its
+  legal actions. Updates are applied first, and the response holds the ``float64``
+  current policy of each query's legal actions.
+* ``DUMP``: the response holds the ``uint32`` number of states and per state, the
+  state and its actions, each with its ``float64`` average probability.
+* ``STATISTICS``: the response holds the shard's ``uint64`` numbers of requests,
+  updated or queried entries, and states.
+"""
+
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import multiprocessing
+import multiprocessing.connection
+import socket
+import struct
+import time
+from typing import Any, Callable, ContextManager, Mapping, Optional, Sequence, Type
+
+from dd_cfr import common
+from dd_cfr.algorithms import cfr
+from dd_cfr.games import base_game
+from dd_cfr.serving import policy_server
+
+_EXCHANGE, _DUMP, _STATISTICS = range(1, 4)
+
+_FRAME = struct.Struct("<IB")
+_EXCHANGE_HEADER = struct.Struct("<BII")
+_COUNT = struct.Struct("<I")
+_LENGTH = struct.Struct("<H")
+_NUM_ACTIONS = struct.Struct("<B")
+_ACTION = struct.Struct("<h")
+_UPDATE = struct.Struct("<hdd")
+_VALUE = struct.Struct("<d")
+_AVERAGE = struct.Struct("<hd")
+_SHARD_STATISTICS = struct.Struct("<QQQ")
+
+#: Maps states to actions and their cumulative regret and policy increments.
+Updates = Mapping[str, Mapping[base_game.Action, Sequence[float]]]
+
+
+def _pack_state(state: str) -> bytes:
+    encoded = state.encode()
+    return _LENGTH.pack(len(encoded)) + encoded
+
+
+def _pack_frame(opcode: int, body: bytes = b"") -> bytes:
+    return _FRAME.pack(len(body), opcode) + body
+
+
+class _Reader:
+    """Reads values from a message body."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+        self._offset = 0
+
+    def read(self, structure: struct.Struct) -> tuple[Any, ...]:
+        """Read the values of a struct.
+
+        :param structure: The struct to read.
+        :return: The unpacked values.
+        """
+        values = structure.unpack_from(self._body, self._offset)
+        self._offset += structure.size
+        return values
+
+    def read_state(self) -> str:
+        """Read a state.
+
+        :return: The state.
+        """
+        (length,) = self.read(_LENGTH)
+        start, end = self._offset, self._offset + length
+        self._offset = end
+        return self._body[start:end].decode()
+
+
+class ParameterServer:
+    """Serves one shard of the regret and policy tables over TCP."""
+
+    def __init__(self, action_type: Type[base_game.Action]) -> None:
+        """Initialize ParameterServer class.
+
+        :param action_type: The enum of the game's actions.
+        """
+        self._action_type = action_type
+        self._cfr = cfr.CFR()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._requests = 0
+        self._entries = 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start serving.
+
+        :param host: The host to bind to, defaults to ``127.0.0.1``.
+        :param port: The port to bind to, defaults to 0 to pick a free port.
+        :return: The bound port.
+        """
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def _read_actions(self, reader: _Reader) -> list[base_game.Action]:
+        (num_actions,) = reader.read(_NUM_ACTIONS)
+        return [self._action_type(reader.read(_ACTION)[0]) for _ in range(num_actions)]
+
+    def _exchange(self, body: bytes) -> bytes:
+        reader = _Reader(body)
+        regret_matching_plus, num_updates, num_queries = reader.read(_EXCHANGE_HEADER)
+
+        for _ in range(num_updates):
+            state = reader.read_state()
+            (num_actions,) = reader.read(_NUM_ACTIONS)
+            for _ in range(num_actions):
+                action, regret, policy = reader.read(_UPDATE)
+                self._cfr.update(
+                    state,
+                    self._action_type(action),
+                    regret,
+                    policy,
+                    1.0,
+                    bool(regret_matching_plus),
+                )
+                self._entries += 1
+
+        response = bytearray()
+        for _ in range(num_queries):
+            state = reader.read_state()
+            policy = self._cfr.get_current_policy(state, self._read_actions(reader))
+            response += b"".join(_VALUE.pack(p) for p in policy.values())
+            self._entries += len(policy)
+
+        return bytes(response)
+
+    def _dump(self) -> bytes:
+        response = bytearray()
+        count = 0
+        for state, policy in self._cfr.iter_policy():
+            response += _pack_state(state) + _NUM_ACTIONS.pack(len(policy))
+            response += b"".join(
+                _AVERAGE.pack(action.value, p) for action, p in policy.items()
+            )
+            count += 1
+
+        return _COUNT.pack(count) + bytes(response)
+
+    def _handle(self, opcode: int, body: bytes) -> bytes:
+        self._requests += 1
+        if opcode == _EXCHANGE:
+            return self._exchange(body)
+        if opcode == _DUMP:
+            return self._dump()
+
+        return _SHARD_STATISTICS.pack(
+            self._requests, self._entries, self._cfr.get_number_of_states()
+        )
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        with contextlib.suppress(asyncio.IncompleteReadError):
+            while True:
+                length, opcode = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+                body = await reader.readexactly(length)
+                if opcode not in (_EXCHANGE, _DUMP, _STATISTICS):
+                    break
+                writer.write(_pack_frame(opcode, self._handle(opcode, body)))
+
+        writer.close()
+
+
+@dataclasses.dataclass
+class ShardStatistics:
+    """Load and latency of one shard of a :obj:`ParameterClient`."""
+
+    #: Number of requests the shard answered, from all clients.
+    requests: int
+    #: Number of updated or queried entries, from all clients.
+    entries: int
+    #: Number of states stored on the shard.
+    states: int
+    #: Round-trip times of this client's requests to the shard.
+    latencies: policy_server.LatencyHistogram
+
+
+class _ConnectionPool:
+    """Keeps idle connections to one shard for reuse."""
+
+    def __init__(self, address: tuple[str, int], size: int) -> None:
+        self._address = address
+        self._size = size
+        self._idle: list[socket.socket] = []
+
+    def acquire(self) -> socket.socket:
+        """Return an idle connection, or a new one if there is none.
+
+        :return: The connection.
+        """
+        if self._idle:
+            return self._idle.pop()
+
+        connection = socket.create_connection(self._address)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return connection
+
+    def release(self, connection: socket.socket) -> None:
+        """Return a connection to the pool, closing it if the pool is full.
+
+        :param connection: The connection to return.
+        """
+        if len(self._idle) < self._size:
+            self._idle.append(connection)
+        else:
+            connection.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        for connection in self._idle:
+            connection.close()
+        self._idle.clear()
+
+
+def _receive(connection: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("The shard closed the connection.")
+        data += chunk
+
+    return bytes(data)
+
+
+class ParameterClient:
+    """Client of the shards of a parameter server."""
+
+    def __init__(
+        self,
+        addresses: Sequence[tuple[str, int]],
+        action_type: Type[base_game.Action],
+        pool_size: int = 4,
+    ) -> None:
+        """Initialize ParameterClient class.
+
+        :param addresses: The host and port of each shard.
+        :param action_type: The enum of the game's actions.
+        :param pool_size: The maximum number of idle connections kept per shard,
+            defaults to 4.
+        """
+        self._action_type = action_type
+        self._pools = [_ConnectionPool(address, pool_size) for address in addresses]
+        self._latencies = [policy_server.LatencyHistogram() for _ in addresses]
+
+    def get_shard(self, state: str) -> int:
+        """Return the shard holding the given state.
+
+        :param state: The state to locate.
+        :return: The index of the shard.
+        """
+        digest = hashlib.blake2b(state.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little") % len(self._pools)
+
+    def _round_trip(
+        self, requests: Mapping[int, tuple[int, bytes]]
+    ) -> dict[int, bytes]:
+        """Send one request to each given shard, then receive all responses.
+
+        :param requests: Maps shards to the opcode and body of their request.
+        :return: Maps the shards to the bodies of their responses.
+        """
+        connections = {}
+        for shard, (opcode, body) in requests.items():
+            connections[shard] = self._pools[shard].acquire()
+            connections[shard].sendall(_pack_frame(opcode, body))
+        start = time.perf_counter()
+
+        responses = {}
+        for shard, connection in connections.items():
+            length, _ = _FRAME.unpack(_receive(connection, _FRAME.size))
+            responses[shard] = _receive(connection, length)
+            self._latencies[shard].record(time.perf_counter() - start)
+            self._pools[shard].release(connection)
+
+        return responses
+
+    def exchange(
+        self,
+        updates: Updates,
+        queries: Sequence[tuple[str, Sequence[base_game.Action]]],
+        regret_matching_plus: bool = False,
+    ) -> list[dict[base_game.Action, float]]:
+        """Apply updates and query current policies, in one round trip per shard.
+
+        :param updates: Maps states to actions and their cumulative regret and
+            policy increments, already weighted by their reach probabilities.
+        :param queries: Pairs of states and their legal actions.
+        :param regret_matching_plus: Whether to clip cumulative regrets at zero
+            after the updates, defaults to False.
+        :return: The current policy of each queried state.
+        """
+        update_bodies = [bytearray() for _ in self._pools]
+        query_bodies = [bytearray() for _ in self._pools]
+        counts = [[0, 0] for _ in self._pools]
+        for state, row in updates.items():
+            shard = self.get_shard(state)
+            update_bodies[shard] += _pack_state(state) + _NUM_ACTIONS.pack(len(row))
+            update_bodies[shard] += b"".join(
+                _UPDATE.pack(action.value, *values) for action, values in row.items()
+            )
+            counts[shard][0] += 1
+        for state, legal_actions in queries:
+            shard = self.get_shard(state)
+            query_bodies[shard] += _pack_state(state)
+            query_bodies[shard] += _NUM_ACTIONS.pack(len(legal_actions))
+            query_bodies[shard] += b"".join(
+                _ACTION.pack(action.value) for action in legal_actions
+            )
+            counts[shard][1] += 1
+
+        responses = self._round_trip(
+            {
+                shard: (
+                    _EXCHANGE,
+                    _EXCHANGE_HEADER.pack(regret_matching_plus, *counts[shard])
+                    + update_bodies[shard]
+                    + query_bodies[shard],
+                )
+                for shard in range(len(self._pools))
+                if any(counts[shard])
+            }
+        )
+
+        readers = {shard: _Reader(response) for shard, response in responses.items()}
+        return [
+            {
+                action: readers[self.get_shard(state)].read(_VALUE)[0]
+                for action in legal_actions
+            }
+            for state, legal_actions in queries
+        ]
+
+    def get_policy(self) -> dict[str, dict[base_game.Action, float]]:
+        """Return the average policy of all states on all shards.
+
+        :return: The average policy.
+        """
+        policy = {}
+        responses = self._round_trip(
+            {shard: (_DUMP, b"") for shard in range(len(self._pools))}
+        )
+        for response in responses.values():
+            reader = _Reader(response)
+            for _ in range(reader.read(_COUNT)[0]):
+                state = reader.read_state()
+                (num_actions,) = reader.read(_NUM_ACTIONS)
+                policy[state] = {
+                    self._action_type(action): p
+                    for action, p in (reader.read(_AVERAGE) for _ in range(num_actions))
+                }
+
+        return policy
+
+    def get_statistics(self) -> list[ShardStatistics]:
+        """Return the load and latency of each shard.
+
+        :return: The statistics, one per shard.
+        """
+        responses = self._round_trip(
+            {shard: (_STATISTICS, b"") for shard in range(len(self._pools))}
+        )
+        statistics = []
+        for shard, latencies in enumerate(self._latencies):
+            requests, entries, states = _SHARD_STATISTICS.unpack(responses[shard])
+            statistics.append(ShardStatistics(requests, entries, states, latencies))
+
+        return statistics
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        for pool in self._pools:
+            pool.close()
+
+
+class TraversalWorker:
+    """Runs CFR iterations on the tables of a parameter server.
+
+    Each subtree below the root chance node is one traversal, which reads the
+    current policies of all its states at its start and updates their regrets at
+    its end, so policies are fixed within a traversal.
+    """
+
+    def __init__(
+        self, client: ParameterClient, regret_matching_plus: bool = False
+    ) -> None:
+        """Initialize TraversalWorker class.
+
+        :param client: The client of the parameter server.
+        :param regret_matching_plus: Whether to use regret-matching+
+            (https://arxiv.org/abs/1407.5042), defaults to False.
+        """
+        self._client = client
+        self._regret_matching_plus = regret_matching_plus
+
+    def _collect_queries(
+        self, game: base_game.Game, queries: dict[str, Sequence[base_game.Action]]
+    ) -> None:
+        if game.is_terminal():
+            return
+
+        if game.get_active_player() == common.CHANCE_PLAYER:
+            actions: Sequence[base_game.Action] = list(game.get_chance_probabilities())
+        else:
+            actions = game.get_legal_actions()
+            queries.setdefault(game.get_state(), actions)
+
+        for action in actions:
+            self._collect_queries(game.child(action), queries)
+
+    def _traverse(
+        self,
+        game: base_game.Game,
+        reach_probs: Sequence[float],
+        policies: Mapping[str, Mapping[base_game.Action, float]],
+        updates: dict[str, dict[base_game.Action, list[float]]],
+    ) -> Sequence[float]:
+        """Traverse the game tree with fixed policies, collecting regret updates.
+
+        :param game: The game to traverse.
+        :param reach_probs: The current reach probabilities for player 1, player 2, and
+            the chance player.
+        :param policies: The current policies of all states in the tree.
+        :param updates: Collects the regret and policy increments.
+        :return: The expected payoffs for both players.
+        """
+        if game.is_terminal():
+            return game.get_payoffs()
+
+        player = game.get_active_player()
+        policy = (
+            game.get_chance_probabilities()
+            if player == common.CHANCE_PLAYER
+            else policies[game.get_state()]
+        )
+
+        rewards = {}
+        payoffs = [0.0, 0.0]
+        for action, probability in policy.items():
+            next_reach_probs = list(reach_probs)
+            next_reach_probs[player] *= probability
+            rewards[action] = self._traverse(
+                game.child(action), next_reach_probs, policies, updates
+            )
+            for player_id in range(2):
+                payoffs[player_id] += rewards[action][player_id] * probability
+
+        if player != common.CHANCE_PLAYER:
+            reach_prob = (
+                reach_probs[game.get_inactive_player()]
+                * reach_probs[common.CHANCE_PLAYER]
+            )
+            row = updates.setdefault(game.get_state(), {})
+            for action, reward in rewards.items():
+                increments = row.setdefault(action, [0.0, 0.0])
+                increments[0] += (reward[player] - payoffs[player]) * reach_prob
+                increments[1] += policy[action] * reach_prob
+
+        return payoffs
+
+    def solve(self, game: Callable[[], base_game.Game], iterations: int) -> None:
+        """Run CFR iterations on the provided game.
+
+        :param game: The game to solve.
+        :param iterations: Number of iterations.
+        """
+        updates: dict[str, dict[base_game.Action, list[float]]] = {}
+        for _ in range(iterations):
+            root = game()
+            outcomes = (
+                list(root.get_chance_probabilities().items())
+                if root.get_active_player() == common.CHANCE_PLAYER
+                else [(None, 1.0)]
+            )
+            for action, probability in outcomes:
+                subtree = root if action is None else root.child(action)
+                queries: dict[str, Sequence[base_game.Action]] = {}
+                self._collect_queries(subtree, queries)
+                policies = self._client.exchange(
+                    updates, list(queries.items()), self._regret_matching_plus
+                )
+
+                updates = {}
+                self._traverse(
+                    subtree,
+                    (1.0, 1.0, probability),
+                    dict(zip(queries, policies)),
+                    updates,
+                )
+
+        self._client.exchange(updates, [], self._regret_matching_plus)
+
+
+async def _serve(
+    server: ParameterServer,
+    connection: multiprocessing.connection.Connection,
+    host: str,
+    port: int,
+) -> None:
+    connection.send(await server.start(host, port))
+    await asyncio.get_running_loop().run_in_executor(None, connection.recv)
+    await server.stop()
+
+
+def serve_shard(
+    action_type: Type[base_game.Action],
+    connection: multiprocessing.connection.Connection,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> None:
+    """Run a shard until it receives a message, after sending its bound port.
+
+    :param action_type: The enum of the game's actions.
+    :param connection: The connection to send the port to and wait on.
+    :param host: The host to bind to, defaults to ``127.0.0.1``.
+    :param port: The port to bind to, defaults to 0 to pick a free port.
+    """
+    asyncio.run(_serve(ParameterServer(action_type), connection, host, port))
+
+
+class _Shards:
+    """Shards running in subprocesses, stopped when the context exits."""
+
+    def __init__(
+        self, num_shards: int, action_type: Type[base_game.Action], host: str
+    ) -> None:
+        self._host = host
+        self._connections: list[multiprocessing.connection.Connection] = []
+        self._processes: list[multiprocessing.Process] = []
+        for _ in range(num_shards):
+            connection, shard_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=serve_shard,
+                args=(action_type, shard_connection, host),
+                daemon=True,
+            )
+            process.start()
+            self._connections.append(connection)
+            self._processes.append(process)
+
+    def __enter__(self) -> list[tuple[str, int]]:
+        return [(self._host, connection.recv()) for connection in self._connections]
+
+    def __exit__(self, *exc_info: object) -> None:
+        for connection, process in zip(self._connections, self._processes):
+            connection.send(None)
+            process.join()
+            connection.close()
+
+
+def start_shards(
+    num_shards: int, action_type: Type[base_game.Action], host: str = "127.0.0.1"
+) -> ContextManager[list[tuple[str, int]]]:
+    """Run shards in subprocesses of this process.
+
+    :param num_shards: The number of shards.
+    :param action_type: The enum of the game's actions.
+    :param host: The host the shards bind to, defaults to ``127.0.0.1``.
+    :return: A context manager giving the addresses of the shards, which are
+        stopped on exit.
+    """
+    return _Shards(num_shards, action_type, host)
@@ -0,0 +1,320 @@
+"""Asyncio server answering policy queries over a local socket.
+
+Clients send newline-delimited JSON queries of the form ``{"id": 1, "state":
+"KING|CHECK"}`` and receive one response line per query, ``{"id": 1, "policy":
+{"CHECK": 0.7, "BET": 0.3}}``, or ``{"id": 1, "error": "..."}`` for unknown
+states and malformed queries. Responses may arrive out of order, the ``id`` is
+echoed back to match them.
+
+Concurrent queries, across and within connections, are collected into micro
+batches, whose states are looked up in the policy table together.
+"""
+
+import asyncio
+import bisect
+import dataclasses
+import functools
+import json
+import time
+from typing import Any, Mapping, Optional
+
+from dd_cfr.games import base_game
+
+#: Upper bounds of the latency histogram buckets in seconds, from 50us to ~1.6s.
+LATENCY_BUCKETS = tuple(0.00005 * 2**i for i in range(16))
+
+
+class LatencyHistogram:
+    """Counts latencies in exponentially growing buckets."""
+
+    def __init__(self) -> None:
+        """Initialize LatencyHistogram class."""
+        # The last bucket counts latencies above all bounds.
+        self._counts = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, seconds: float) -> None:
+        """Record a single latency.
+
+        :param seconds: The latency to record.
+        """
+        self._counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def get_counts(self) -> dict[float, int]:
+        """Return the number of recorded latencies per bucket.
+
+        :return: Maps each bucket's upper bound in seconds, ``inf`` for the last
+            one, to its count.
+        """
+        return dict(zip(LATENCY_BUCKETS + (float("inf"),), self._counts))
+
+    def get_quantile(self, quantile: float) -> float:
+        """Return an upper bound of the given latency quantile.
+
+        :param quantile: The quantile in ``[0, 1]``, e.g., ``0.99``.
+        :return: The upper bound of the bucket containing the quantile, ``0.0`` if
+            nothing was recorded.
+        """
+        total = sum(self._counts)
+        if not total:
+            return 0.0
+
+        seen = 0
+        for bound, count in self.get_counts().items():
+            seen += count
+            if seen >= quantile * total:
+                return bound
+
+        return float("inf")  # pragma: no cover
+
+
+@dataclasses.dataclass
+class ServerStatistics:
+    """Throughput and latency of a :obj:`PolicyServer`."""
+
+    #: Number of answered queries.
+    queries: int
+    #: Number of batched table lookups.
+    batches: int
+    #: Answered queries per second since the server started.
+    queries_per_second: float
+    #: Time from receiving a query to its lookup.
+    latencies: LatencyHistogram
+
+
+@dataclasses.dataclass
+class _Query:
+    state: str
+    received: float
+    result: "asyncio.Future[Optional[Mapping[str, float]]]"
+
+
+class PolicyServer:
+    """Serves a computed policy to clients over TCP."""
+
+    def __init__(
+        self,
+        policy: Mapping[str, Mapping[base_game.Action, float]],
+        max_batch_size: int = 256,
+        max_batch_delay: float = 0.0005,
+    ) -> None:
+        """Initialize PolicyServer class.
+
+        :param policy: The policy to serve, as returned by
+            ``CFRSolver.get_policy()``.
+        :param max_batch_size: The maximum number of queries per lookup, defaults
+            to 256.
+        :param max_batch_delay: How long to wait in seconds for further queries
+            before looking up a batch, defaults to 0.0005.
+        """
+        self._policy = {
+            state: {action.name: p for action, p in action_probabilities.items()}
+            for state, action_probabilities in policy.items()
+        }
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay = max_batch_delay
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._batcher: Optional["asyncio.Task[None]"] = None
+
+        self._started = 0.0
+        self._queries = 0
+        self._batches = 0
+        self._latencies = LatencyHistogram()
+
+    @classmethod
+    def from_json(
+        cls,
+        path: str,
+        max_batch_size: int = 256,
+        max_batch_delay: float = 0.0005,
+    ) -> "PolicyServer":
+        """Create a server for a policy checkpoint in JSON format.
+
+        :param path: Path to a JSON object mapping states to objects that map
+            action names to probabilities.
+        :param max_batch_size: The maximum number of queries per lookup, defaults
+            to 256.
+        :param max_batch_delay: How long to wait in seconds for further queries
+            before looking up a batch, defaults to 0.0005.
+        :return: The server.
+        """
+        server = cls({}, max_batch_size, max_batch_delay)
+        with open(path, encoding="utf-8") as checkpoint:
+            server._policy = json.load(checkpoint)
+
+        return server
+
+    @classmethod
+    def from_jsonl(
+        cls,
+        path: str,
+        max_batch_size: int = 256,
+        max_batch_delay: float = 0.0005,
+    ) -> "PolicyServer":
+        """Create a server for a policy exported by ``policy_io.write_jsonl``.
+
+        :param path: Path to the JSON lines file.
+        :param max_batch_size: The maximum number of queries per lookup, defaults
+            to 256.
+        :param max_batch_delay: How long to wait in seconds for further queries
+            before looking up a batch, defaults to 0.0005.
+        :return: The server.
+        """
+        server = cls({}, max_batch_size, max_batch_delay)
+        with open(path, encoding="utf-8") as checkpoint:
+            for line in checkpoint:
+                record = json.loads(line)
+                server._policy[record["state"]] = record["policy"]
+
+        return server
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start serving.
+
+        :param host: The host to bind to, defaults to ``127.0.0.1``.
+        :param port: The port to bind to, defaults to 0 to pick a free port.
+        :return: The bound port.
+        """
+        self._started = time.perf_counter()
+        queue: "asyncio.Queue[_Query]" = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._process_batches(queue))
+        self._server = await asyncio.start_server(
+            functools.partial(self._handle_connection, queue), host, port
+        )
+
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop serving and close all connections."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher:
+            self._batcher.cancel()
+
+    def get_statistics(self) -> ServerStatistics:
+        """Return the statistics since the server started.
+
+        :return: The server statistics.
+        """
+        elapsed = time.perf_counter() - self._started
+        return ServerStatistics(
+            queries=self._queries,
+            batches=self._batches,
+            queries_per_second=self._queries / elapsed if self._started else 0.0,
+            latencies=self._latencies,
+        )
+
+    async def _collect_batch(self, queue: "asyncio.Queue[_Query]") -> list[_Query]:
+        batch = [await queue.get()]
+        deadline = time.perf_counter() + self._max_batch_delay
+
+        while len(batch) < self._max_batch_size:
+            if queue.empty():
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(remaining)
+                continue
+            batch.append(queue.get_nowait())
+
+        return batch
+
+    async def _process_batches(self, queue: "asyncio.Queue[_Query]") -> None:
+        while True:
+            batch = await self._collect_batch(queue)
+            results = [self._policy.get(query.state) for query in batch]
+
+            now = time.perf_counter()
+            for query, result in zip(batch, results):
+                self._latencies.record(now - query.received)
+                query.result.set_result(result)
+
+            self._queries += len(batch)
+            self._batches += 1
+
+    async def _answer(
+        self,
+        queue: "asyncio.Queue[_Query]",
+        line: bytes,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            request = json.loads(line)
+            state = request["state"]
+        except (ValueError, TypeError, KeyError):
+            writer.write(json.dumps({"error": "malformed query"}).encode() + b"\n")
+            return
+
+        response: dict[str, Any] = {"id": request.get("id")}
+        if not isinstance(state, str):
+            response["error"] = "malformed query"
+            writer.write(json.dumps(response).encode() + b"\n")
+            return
+
+        query = _Query(
+            state,
+            time.perf_counter(),
+            asyncio.get_running_loop().create_future(),
+        )
+        await queue.put(query)
+        result = await query.result
+
+        if result is None:
+            response["error"] = f"unknown state: {state}"
+        else:
+            response["policy"] = result
+        writer.write(json.dumps(response).encode() + b"\n")
+
+    async def _handle_connection(
+        self,
+        queue: "asyncio.Queue[_Query]",
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        answers = set()
+        while line := await reader.readline():
+            answer = asyncio.create_task(self._answer(queue, line, writer))
+            answers.add(answer)
+            answer.add_done_callback(answers.discard)
+
+        await asyncio.gather(*answers)
+        writer.close()
+
+
+class PolicyClient:
+    """Client for a :obj:`PolicyServer`."""
+
+    def __init__(self, host: str, port: int) -> None:
+        """Initialize PolicyClient class.
+
+        :param host: The server's host.
+        :param port: The server's port.
+        """
+        self._host = host
+        self._port = port
+
+    async def query(self, states: list[str]) -> list[Optional[dict[str, float]]]:
+        """Query the policies of the given states in a single pipelined round trip.
+
+        :param states: The states to query.
+        :return: The action probabilities by action name for each state, ``None``
+            for unknown states.
+        """
+        reader, writer = await asyncio.open_connection(self._host, self._port)
+        writer.write(
+            b"".join(
+                json.dumps({"id": i, "state": state}).encode() + b"\n"
+                for i, state in enumerate(states)
+            )
+        )
+        await writer.drain()
+
+        results: list[Optional[dict[str, float]]] = [None] * len(states)
+        for _ in states:
+            response = json.loads(await reader.readline())
+            results[response["id"]] = response.get("policy")
+
+        writer.close()
+        await writer.wait_closed()
+        return results
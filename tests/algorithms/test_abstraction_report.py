@@ -0,0 +1,23 @@
+"""Abstraction Report Tests."""
+
+import unittest
+
+from dd_cfr.algorithms import abstraction_report
+from dd_cfr.games import abstraction, kuhn_poker
+
+
+class TestAbstractionReport(unittest.TestCase):
+    """Abstraction Report Tests."""
+
+    def test_compare_abstraction(self):
+        """Abstraction trades table size for exploitability."""
+
+        report = abstraction_report.compare_abstraction(
+            kuhn_poker.KuhnPoker, abstraction.HistoryCompressor(1), 200
+        )
+
+        self.assertEqual(report.baseline.states, 12)
+        self.assertEqual(report.abstracted.states, 9)
+        self.assertAlmostEqual(report.get_memory_ratio(), 4 / 3)
+        self.assertGreater(report.get_speedup(), 0)
+        self.assertGreater(report.get_exploitability_loss(), 0)
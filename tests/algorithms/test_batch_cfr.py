@@ -0,0 +1,93 @@
+"""Batch CFR Tests."""
+
+import unittest
+
+from dd_cfr.algorithms import batch_cfr, cfr
+from dd_cfr.games import base_game, kuhn_poker
+
+
+class _KuhnPokerWithoutDealTable(kuhn_poker.KuhnPoker):
+    """Kuhn poker dealing one card after the other, like the batch solver."""
+
+    get_deal_table = base_game.Game.get_deal_table
+
+
+class _HighStakesKuhnPoker(kuhn_poker.KuhnPoker):
+    """Kuhn poker with ten times the stakes."""
+
+    def get_payoffs(self) -> list[float]:
+        return [10 * payoff for payoff in super().get_payoffs()]
+
+    def _create(
+        self, cards: list[base_game.Action], history: list[kuhn_poker.PlayerAction]
+    ) -> kuhn_poker.KuhnPoker:
+        return _HighStakesKuhnPoker(cards, history)
+
+
+class _OneRoundKuhnPoker(kuhn_poker.KuhnPoker):
+    """Kuhn poker ending after the first action."""
+
+    def is_terminal(self) -> bool:
+        return len(self._history) == 1
+
+    def _create(
+        self, cards: list[base_game.Action], history: list[kuhn_poker.PlayerAction]
+    ) -> kuhn_poker.KuhnPoker:
+        return _OneRoundKuhnPoker(cards, history)
+
+
+class TestBatchCfr(unittest.TestCase):
+    """Batch CFR Tests."""
+
+    def test_matches_cfr_solver(self):
+        """Each configuration computes the policy of its own CFRSolver."""
+
+        configurations = [
+            batch_cfr.Configuration(50),
+            batch_cfr.Configuration(30, regret_matching_plus=True),
+            batch_cfr.Configuration(0),
+        ]
+        batch_solver = batch_cfr.BatchCFRSolver(configurations)
+        self.assertEqual(batch_solver.get_policies(), [])
+        batch_solver.solve(_KuhnPokerWithoutDealTable)
+
+        policies = batch_solver.get_policies()
+        for configuration, policy in zip(configurations[:2], policies):
+            cfr_solver = cfr.CFRSolver(
+                regret_matching_plus=configuration.regret_matching_plus
+            )
+            cfr_solver.solve(_KuhnPokerWithoutDealTable, configuration.iterations)
+            self.assertEqual(policy, cfr_solver.get_policy())
+
+        # Configurations without iterations keep the uniform policy.
+        self.assertEqual(
+            policies[2]["KING"],
+            {kuhn_poker.Action.CHECK: 0.5, kuhn_poker.Action.BET: 0.5},
+        )
+
+    def test_payoff_variants(self):
+        """Configurations solve variants of the game with other payoffs."""
+
+        batch_solver = batch_cfr.BatchCFRSolver(
+            [
+                batch_cfr.Configuration(100),
+                batch_cfr.Configuration(100, game=_HighStakesKuhnPoker),
+            ]
+        )
+        batch_solver.solve(kuhn_poker.KuhnPoker)
+
+        policies = batch_solver.get_policies()
+        self.assertEqual(len(policies[1]), 12)
+        for state, policy in policies[0].items():
+            for action, probability in policy.items():
+                self.assertAlmostEqual(policies[1][state][action], probability)
+
+    def test_other_tree(self):
+        """Variants must have the same game tree."""
+
+        batch_solver = batch_cfr.BatchCFRSolver(
+            [batch_cfr.Configuration(1, game=_OneRoundKuhnPoker)]
+        )
+
+        with self.assertRaises(ValueError):
+            batch_solver.solve(kuhn_poker.KuhnPoker)
@@ -0,0 +1,43 @@
+"""Benchmark Tests."""
+
+import unittest
+
+from dd_cfr.algorithms import benchmark
+from dd_cfr.games import kuhn_poker
+
+
+class TestBenchmark(unittest.TestCase):
+    """Benchmark Tests."""
+
+    def test_benchmark_thread_scaling(self):
+        """Every thread count is measured."""
+
+        seconds_per_iteration = benchmark.benchmark_thread_scaling(
+            kuhn_poker.KuhnPoker, 2, (1, 2)
+        )
+
+        self.assertEqual(list(seconds_per_iteration), [1, 2])
+        self.assertTrue(all(seconds > 0 for seconds in seconds_per_iteration.values()))
+
+    def test_benchmark_process_scaling(self):
+        """Every worker count is measured."""
+
+        seconds_per_iteration = benchmark.benchmark_process_scaling(
+            kuhn_poker.KuhnPoker, 20, (1, 2)
+        )
+
+        self.assertEqual(list(seconds_per_iteration), [1, 2])
+        self.assertTrue(all(seconds > 0 for seconds in seconds_per_iteration.values()))
+
+    def test_benchmark_kuhn_payoffs(self):
+        """Table lookups and rule computations are measured."""
+
+        seconds_per_terminal = benchmark.benchmark_kuhn_payoffs(kuhn_poker.KuhnPoker, 2)
+
+        self.assertEqual(list(seconds_per_terminal), ["table", "rules"])
+        self.assertTrue(all(seconds > 0 for seconds in seconds_per_terminal.values()))
+
+    def test_is_free_threaded(self):
+        """The check returns a boolean on every build."""
+
+        self.assertIsInstance(benchmark.is_free_threaded(), bool)
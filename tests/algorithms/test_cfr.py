@@ -1,9 +1,166 @@
 """CFR Tests."""
 
+import functools
+import sys
+from typing import Mapping, Optional, Sequence
 import unittest
 
-from dd_cfr.algorithms import cfr
-from dd_cfr.games import kuhn_poker
+from dd_cfr.algorithms import cfr, exploitability, quantization
+from dd_cfr.algorithms import policy as policy_lib
+from dd_cfr.games import (
+    abstraction,
+    base_game,
+    generalized_kuhn_poker,
+    kuhn_poker,
+)
+
+# Longer than the recursion limit.
+_RACE_LENGTH = sys.getrecursionlimit() + 10
+
+
+class _RaceAction(base_game.Action):
+    """Actions of the race game."""
+
+    STOP = 0
+    CONTINUE = 1
+
+
+class _Race(base_game.Game):
+    """Players alternately continue or stop, whoever stops first loses."""
+
+    def __init__(self, length: int = _RACE_LENGTH, loser: Optional[int] = None):
+        """Initialize _Race class.
+
+        :param length: The number of remaining turns, defaults to _RACE_LENGTH.
+        :param loser: The player who stopped, if any, defaults to None.
+        """
+        self._length = length
+        self._loser = loser
+
+    def get_state(self) -> str:
+        return str(self._length)
+
+    def is_terminal(self) -> bool:
+        return self._loser is not None or not self._length
+
+    def get_payoffs(self) -> list[float]:
+        if self._loser is None:
+            return [0.0, 0.0]
+
+        return [-1.0, 1.0] if self._loser == 0 else [1.0, -1.0]
+
+    def get_legal_actions(self) -> list[base_game.Action]:
+        return list(_RaceAction)
+
+    def get_chance_probabilities(self) -> dict[base_game.Action, float]:
+        return {}  # pragma: no cover
+
+    def get_active_player(self) -> int:
+        return self._length % 2
+
+    def child(self, action: base_game.Action) -> base_game.Game:
+        if action == _RaceAction.STOP:
+            return _Race(self._length, self.get_active_player())
+
+        return _Race(self._length - 1)
+
+
+class _BidAction(base_game.Action):
+    """Actions of the bidding game."""
+
+    LOW = 0
+    HIGH = 1
+
+
+class _Bidding(base_game.Game):
+    """Three players bid in turn without seeing the other bids.
+
+    Bidding high earns one, and every other player bidding low earns a half.
+    """
+
+    def __init__(self, bids: tuple[base_game.Action, ...] = ()) -> None:
+        """Initialize _Bidding class.
+
+        :param bids: The bids so far, defaults to none.
+        """
+        self._bids = bids
+
+    def get_state(self) -> str:
+        return str(len(self._bids))
+
+    def is_terminal(self) -> bool:
+        return len(self._bids) == 3
+
+    def get_payoffs(self) -> list[float]:
+        num_low = self._bids.count(_BidAction.LOW)
+        return [
+            1.0 + num_low / 2 if bid == _BidAction.HIGH else (num_low - 1) / 2
+            for bid in self._bids
+        ]
+
+    def get_legal_actions(self) -> list[base_game.Action]:
+        return list(_BidAction)
+
+    def get_chance_probabilities(self) -> dict[base_game.Action, float]:
+        return {}  # pragma: no cover
+
+    def get_active_player(self) -> int:
+        return len(self._bids)
+
+    def get_num_players(self) -> int:
+        return 3
+
+    def child(self, action: base_game.Action) -> base_game.Game:
+        return _Bidding(self._bids + (action,))
+
+
+class _PassAction(base_game.Action):
+    """The only action of the observer."""
+
+    PASS = 0
+
+
+class _ObservedKuhnPoker(base_game.Game):
+    """Kuhn poker with a third player, who passes before the deal."""
+
+    def __init__(self, game: Optional[base_game.Game] = None) -> None:
+        """Initialize _ObservedKuhnPoker class.
+
+        :param game: The Kuhn poker game after the pass, defaults to None.
+        """
+        self._game = game
+
+    def get_state(self) -> str:
+        return self._game.get_state() if self._game else "OBSERVER"
+
+    def is_terminal(self) -> bool:
+        return bool(self._game and self._game.is_terminal())
+
+    def get_payoffs(self) -> list[float]:
+        return self._game.get_payoffs() + [0.0] if self._game else []
+
+    def get_legal_actions(self) -> Sequence[base_game.Action]:
+        return self._game.get_legal_actions() if self._game else [_PassAction.PASS]
+
+    def get_chance_probabilities(self) -> Mapping[base_game.Action, float]:
+        return self._game.get_chance_probabilities() if self._game else {}
+
+    def get_deal_table(
+        self,
+    ) -> Optional[Sequence[tuple[Sequence[base_game.Action], float]]]:
+        return self._game.get_deal_table() if self._game else None
+
+    def get_active_player(self) -> int:
+        return self._game.get_active_player() if self._game else 2
+
+    def get_num_players(self) -> int:
+        return 3
+
+    def child(self, action: base_game.Action) -> base_game.Game:
+        if self._game:
+            return _ObservedKuhnPoker(self._game.child(action))
+
+        return _ObservedKuhnPoker(kuhn_poker.KuhnPoker())
 
 
 class TestCfr(unittest.TestCase):
@@ -79,3 +236,331 @@ class TestCfr(unittest.TestCase):
                     1,
                     delta=delta,
                 )
+
+    def test_state_abstraction(self):
+        """Abstract states replace states in the tables."""
+
+        cfr_solver = cfr.CFRSolver(state_abstraction=abstraction.HistoryCompressor(1))
+        cfr_solver.solve(kuhn_poker.KuhnPoker, 10)
+
+        self.assertEqual(cfr_solver.get_table().get_number_of_states(), 9)
+        self.assertEqual(cfr_solver.get_table().get_number_of_entries(), 36)
+        self.assertIn("KING|BET", cfr_solver.get_policy())
+        self.assertNotIn("KING|CHECK, BET", cfr_solver.get_policy())
+
+    def test_regret_based_pruning(self):
+        """Pruning skips dominated actions except on full passes."""
+
+        for regret_matching_plus, full_pass_interval in [(False, 5), (True, 10)]:
+            with self.subTest(
+                regret_matching_plus=regret_matching_plus,
+                full_pass_interval=full_pass_interval,
+            ):
+                cfr_solver = cfr.CFRSolver(
+                    regret_matching_plus=regret_matching_plus,
+                    regret_based_pruning=True,
+                    full_pass_interval=full_pass_interval,
+                )
+                cfr_solver.solve(kuhn_poker.KuhnPoker, 1000)
+                pruned_actions = cfr_solver.get_pruned_actions()
+
+                self.assertEqual(len(pruned_actions), 1000)
+                self.assertGreater(sum(pruned_actions), 0)
+                self.assertEqual(sum(pruned_actions[::full_pass_interval]), 0)
+
+                self.assertLess(
+                    exploitability.get_exploitability(
+                        kuhn_poker.KuhnPoker,
+                        policy_lib.TabularPolicy(cfr_solver.get_policy()),
+                    ),
+                    0.02,
+                )
+
+    def test_no_pruning(self):
+        """Without pruning, all actions are traversed."""
+
+        cfr_solver = cfr.CFRSolver()
+        cfr_solver.solve(kuhn_poker.KuhnPoker, 10)
+
+        self.assertEqual(cfr_solver.get_pruned_actions(), [0] * 10)
+
+    def test_iter_policy(self):
+        """The streamed policy equals the materialized one."""
+
+        cfr_solver = cfr.CFRSolver()
+        cfr_solver.solve(kuhn_poker.KuhnPoker, 10)
+
+        self.assertEqual(dict(cfr_solver.iter_policy()), cfr_solver.get_policy())
+
+    def test_precision(self):
+        """Single precision tables barely change the policy."""
+
+        cfr_solver_64 = cfr.CFRSolver()
+        cfr_solver_64.solve(kuhn_poker.KuhnPoker, 100)
+        cfr_solver_32 = cfr.CFRSolver(precision=cfr.Precision.FLOAT32)
+        cfr_solver_32.solve(kuhn_poker.KuhnPoker, 100)
+
+        self.assertLess(
+            quantization.get_policy_drift(
+                cfr_solver_32.get_policy(), cfr_solver_64.get_policy()
+            ),
+            1e-5,
+        )
+
+    def test_renormalize_interval(self):
+        """Renormalizing does not change the linearly averaged policy."""
+
+        for regret_matching_plus in [False, True]:
+            with self.subTest(regret_matching_plus=regret_matching_plus):
+                cfr_solvers = [
+                    cfr.CFRSolver(
+                        regret_matching_plus=regret_matching_plus,
+                        linear_averaging=True,
+                        renormalize_interval=renormalize_interval,
+                    )
+                    for renormalize_interval in [None, 10]
+                ]
+                for cfr_solver in cfr_solvers:
+                    cfr_solver.solve(kuhn_poker.KuhnPoker, 100)
+
+                self.assertLess(
+                    quantization.get_policy_drift(
+                        cfr_solvers[0].get_policy(), cfr_solvers[1].get_policy()
+                    ),
+                    1e-12,
+                )
+                self.assertAlmostEqual(
+                    max(
+                        sum(policy.values())
+                        for policy in cfr_solvers[1]
+                        .get_table()
+                        .cumulative_policies.values()
+                    ),
+                    1.0,
+                )
+
+    def test_renormalize_empty_policies(self):
+        """Renormalizing empty tables does nothing."""
+
+        cfr_table = cfr.CFR()
+        cfr_table.renormalize_policies()
+
+        self.assertEqual(cfr_table.get_policy(), {})
+
+    def test_array_row(self):
+        """Array rows behave like a defaultdict(float)."""
+
+        cfr_table = cfr.CFR(cfr.Precision.FLOAT32)
+        row = cfr_table.cumulative_regrets["KING"]
+        other_row = cfr_table.cumulative_regrets["QUEEN"]
+
+        self.assertEqual(row[kuhn_poker.Action.BET], 0.0)
+        self.assertNotIn(kuhn_poker.Action.BET, row)
+
+        row[kuhn_poker.Action.BET] += 0.5
+        row[kuhn_poker.Action.CHECK] = 0.25
+        row[kuhn_poker.Action.BET] += 0.5
+        other_row[kuhn_poker.Action.BET] = 1.0
+        other_row[kuhn_poker.Action.CHECK] = 0.0
+
+        self.assertEqual(
+            dict(row), {kuhn_poker.Action.BET: 1.0, kuhn_poker.Action.CHECK: 0.25}
+        )
+
+        del row[kuhn_poker.Action.BET]
+        self.assertEqual(dict(row), {kuhn_poker.Action.CHECK: 0.25})
+        self.assertEqual(len(row), 1)
+
+    def test_num_threads(self):
+        """Threads sharing the tables still converge."""
+
+        cfr_solver = cfr.CFRSolver(num_threads=3)
+        cfr_solver.solve(kuhn_poker.KuhnPoker, 1000)
+
+        # The interleaving of updates varies between runs.
+        self.assertLess(
+            exploitability.get_exploitability(
+                kuhn_poker.KuhnPoker, policy_lib.TabularPolicy(cfr_solver.get_policy())
+            ),
+            0.05,
+        )
+
+    def test_generalized_kuhn_poker(self):
+        """Threads traverse the larger deals of generalized Kuhn poker."""
+
+        cfr_solver = cfr.CFRSolver(num_threads=4)
+        cfr_solver.solve(
+            functools.partial(generalized_kuhn_poker.GeneralizedKuhnPoker, 5), 10
+        )
+
+        self.assertEqual(len(cfr_solver.get_policy()), 20)
+
+    def test_compiled_kuhn_poker(self):
+        """Solving the compiled game matches solving the original game."""
+
+        cfr_solvers = [cfr.CFRSolver(), cfr.CFRSolver()]
+        cfr_solvers[0].solve(kuhn_poker.KuhnPoker, 100)
+        cfr_solvers[1].solve(kuhn_poker.CompiledKuhnPoker, 100)
+
+        self.assertLess(
+            quantization.get_policy_drift(
+                cfr_solvers[0].get_policy(), cfr_solvers[1].get_policy()
+            ),
+            1e-9,
+        )
+
+    def test_deal_table(self):
+        """Iterating the deal table matches expanding chance nodes one by one."""
+
+        class KuhnPokerWithoutDealTable(kuhn_poker.KuhnPoker):
+            get_deal_table = base_game.Game.get_deal_table
+
+        cfr_solvers = [cfr.CFRSolver(), cfr.CFRSolver()]
+        cfr_solvers[0].solve(kuhn_poker.KuhnPoker, 100)
+        cfr_solvers[1].solve(KuhnPokerWithoutDealTable, 100)
+
+        self.assertLess(
+            quantization.get_policy_drift(
+                cfr_solvers[0].get_policy(), cfr_solvers[1].get_policy()
+            ),
+            1e-9,
+        )
+
+    def test_iterative_traversal(self):
+        """The iterative traversal computes the same tables as the recursive one."""
+
+        configurations = [
+            {},
+            {"regret_matching_plus": True, "linear_averaging": True},
+            {"regret_based_pruning": True},
+            {"state_abstraction": abstraction.HistoryCompressor(1)},
+        ]
+        for configuration in configurations:
+            with self.subTest(configuration=configuration):
+                cfr_solvers = [
+                    cfr.CFRSolver(traversal=traversal, **configuration)
+                    for traversal in cfr.Traversal
+                ]
+                for cfr_solver in cfr_solvers:
+                    cfr_solver.solve(kuhn_poker.KuhnPoker, 50)
+
+                tables = [cfr_solver.get_table() for cfr_solver in cfr_solvers]
+                self.assertEqual(
+                    tables[0].cumulative_regrets, tables[1].cumulative_regrets
+                )
+                self.assertEqual(
+                    tables[0].cumulative_policies, tables[1].cumulative_policies
+                )
+                self.assertEqual(
+                    cfr_solvers[0].get_pruned_actions(),
+                    cfr_solvers[1].get_pruned_actions(),
+                )
+
+    def test_iterative_traversal_threads(self):
+        """Threads traverse their subtrees on their own stacks."""
+
+        cfr_solver = cfr.CFRSolver(num_threads=4, traversal=cfr.Traversal.ITERATIVE)
+        cfr_solver.solve(
+            functools.partial(generalized_kuhn_poker.GeneralizedKuhnPoker, 5), 10
+        )
+
+        self.assertEqual(len(cfr_solver.get_policy()), 20)
+
+    def test_iterative_traversal_depth(self):
+        """The iterative traversal solves games deeper than the recursion limit."""
+
+        cfr_solver = cfr.CFRSolver(traversal=cfr.Traversal.ITERATIVE)
+        cfr_solver.solve(_Race, 2)
+        self.assertEqual(len(cfr_solver.get_policy()), _RACE_LENGTH)
+
+        cfr_solver.solve(functools.partial(_Race, 0), 1)
+        self.assertEqual(len(cfr_solver.get_policy()), _RACE_LENGTH)
+
+    def test_warm_start(self):
+        """Starting from a solution converges faster than starting from scratch."""
+
+        cfr_solver = cfr.CFRSolver()
+        cfr_solver.solve(kuhn_poker.KuhnPoker, 300)
+        initial_policy = cfr_solver.get_policy()
+
+        cfr_solvers = [cfr.CFRSolver() for _ in range(3)]
+        cfr_solvers[1].warm_start(initial_policy, weight=100)
+        cfr_solvers[2].warm_start(cfr_solver.iter_policy(), weight=100)
+        for cfr_solver in cfr_solvers:
+            cfr_solver.solve(kuhn_poker.KuhnPoker, 10)
+
+        cold, warm, checkpoint = (
+            exploitability.get_exploitability(
+                kuhn_poker.KuhnPoker, policy_lib.TabularPolicy(cfr_solver.get_policy())
+            )
+            for cfr_solver in cfr_solvers
+        )
+        self.assertLess(warm, 0.02)
+        self.assertLess(warm, cold / 2)
+        self.assertEqual(warm, checkpoint)
+
+    def test_warm_start_state_mapping(self):
+        """Solutions of smaller games seed larger games through a state mapping."""
+
+        # Maps the lowest, middle and highest ranks to Kuhn's cards.
+        cards = {"TWO": "JACK", "THREE": "QUEEN", "FOUR": "QUEEN", "FIVE": "KING"}
+
+        def get_kuhn_state(state):
+            card, separator, history = state.partition("|")
+            return cards[card] + separator + history
+
+        cfr_solver = cfr.CFRSolver()
+        cfr_solver.solve(kuhn_poker.KuhnPoker, 300)
+        game = functools.partial(generalized_kuhn_poker.GeneralizedKuhnPoker, 4)
+
+        cfr_solvers = [cfr.CFRSolver() for _ in range(2)]
+        cfr_solvers[1].warm_start(
+            cfr_solver.get_policy(), weight=0.5, state_mapping=get_kuhn_state
+        )
+        for cfr_solver in cfr_solvers:
+            cfr_solver.solve(game, 20)
+
+        cold, warm = (
+            exploitability.get_exploitability(
+                game, policy_lib.TabularPolicy(cfr_solver.get_policy())
+            )
+            for cfr_solver in cfr_solvers
+        )
+        self.assertLess(warm, cold)
+        self.assertEqual(len(cfr_solvers[1].get_policy()), 16)
+
+    def test_three_players(self):
+        """Each player's regrets weigh the reach of all other players."""
+
+        for traversal in cfr.Traversal:
+            with self.subTest(traversal=traversal):
+                cfr_solver = cfr.CFRSolver(traversal=traversal)
+                cfr_solver.solve(_Bidding, 100)
+
+                for player in range(3):
+                    self.assertGreater(
+                        cfr_solver.get_policy()[str(player)][_BidAction.HIGH], 0.9
+                    )
+
+    def test_observer(self):
+        """A third player who cannot act leaves the tables of Kuhn poker unchanged."""
+
+        for traversal in cfr.Traversal:
+            with self.subTest(traversal=traversal):
+                cfr_solvers = [cfr.CFRSolver(traversal=traversal) for _ in range(2)]
+                cfr_solvers[0].solve(kuhn_poker.KuhnPoker, 50)
+                cfr_solvers[1].solve(_ObservedKuhnPoker, 50)
+
+                tables = [cfr_solver.get_table() for cfr_solver in cfr_solvers]
+                regrets = dict(tables[1].cumulative_regrets)
+                self.assertEqual(regrets.pop("OBSERVER"), {_PassAction.PASS: 0.0})
+                self.assertEqual(regrets, tables[0].cumulative_regrets)
+
+    def test_iterative_traversal_players(self):
+        """Iterative traversals rebuild their stack for other numbers of players."""
+
+        cfr_solver = cfr.CFRSolver(traversal=cfr.Traversal.ITERATIVE)
+        cfr_solver.solve(kuhn_poker.KuhnPoker, 1)
+        cfr_solver.solve(_ObservedKuhnPoker, 1)
+
+        self.assertEqual(len(cfr_solver.get_policy()), 13)
@@ -0,0 +1,52 @@
+"""Exploitability Tests."""
+
+import unittest
+
+from dd_cfr.algorithms import cfr, exploitability, policy
+from dd_cfr.games import kuhn_poker
+
+
+class TestExploitability(unittest.TestCase):
+    """Exploitability Tests."""
+
+    def test_uniform_policy(self):
+        """See https://arxiv.org/abs/1908.09453 for the reference value."""
+
+        self.assertAlmostEqual(
+            exploitability.get_exploitability(
+                kuhn_poker.KuhnPoker, policy.get_uniform_policy
+            ),
+            0.4583,
+            places=4,
+        )
+
+    def test_best_response_value(self):
+        """Always betting or calling is exploitable by both players."""
+
+        def always_bet(game):
+            legal_actions = game.get_legal_actions()
+            return {
+                action: float(action == legal_actions[0]) for action in legal_actions
+            }
+
+        for player in range(2):
+            with self.subTest(player=player):
+                self.assertGreater(
+                    exploitability.get_best_response_value(
+                        kuhn_poker.KuhnPoker, player, always_bet
+                    ),
+                    0,
+                )
+
+    def test_nash_equilibrium(self):
+        """The CFR policy is barely exploitable."""
+
+        cfr_solver = cfr.CFRSolver()
+        cfr_solver.solve(kuhn_poker.KuhnPoker, 1000)
+
+        self.assertLess(
+            exploitability.get_exploitability(
+                kuhn_poker.KuhnPoker, policy.TabularPolicy(cfr_solver.get_policy())
+            ),
+            0.01,
+        )
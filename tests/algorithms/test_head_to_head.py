@@ -0,0 +1,74 @@
+"""Head-to-Head Tests."""
+
+import unittest
+
+from dd_cfr.algorithms import cfr, head_to_head, policy
+from dd_cfr.games import kuhn_poker
+
+
+class TestHeadToHead(unittest.TestCase):
+    """Head-to-Head Tests."""
+
+    def setUp(self):
+        """Solve Kuhn poker."""
+
+        self.cfr_solver = cfr.CFRSolver()
+        self.cfr_solver.solve(kuhn_poker.KuhnPoker, 100)
+
+    def test_equilibrium_beats_uniform(self):
+        """An approximate equilibrium wins against uniformly random play."""
+
+        result = head_to_head.play_match(
+            kuhn_poker.KuhnPoker,
+            self.cfr_solver.get_policy(),
+            policy.get_uniform_policy,
+            2000,
+            chunk_size=300,
+        )
+
+        self.assertEqual(result.hands, 4000)
+        self.assertGreater(result.hands_per_second, 0)
+        low, high = result.get_confidence_interval()
+        self.assertLess(low, result.mean_payoff)
+        self.assertGreater(high, result.mean_payoff)
+        self.assertGreater(low, 0)
+
+    def test_reproducible_across_processes(self):
+        """Results only depend on the seed, not on the number of processes."""
+
+        results = [
+            head_to_head.play_match(
+                kuhn_poker.KuhnPoker,
+                self.cfr_solver.get_policy(),
+                policy.TabularPolicy({}),
+                200,
+                seed=7,
+                num_processes=num_processes,
+                chunk_size=50,
+            )
+            for num_processes in (1, 2)
+        ]
+
+        self.assertEqual(results[0].mean_payoff, results[1].mean_payoff)
+        self.assertEqual(results[0].standard_error, results[1].standard_error)
+
+    def test_no_deals(self):
+        """Matches need at least one deal."""
+
+        with self.assertRaises(ValueError):
+            head_to_head.play_match(
+                kuhn_poker.KuhnPoker,
+                self.cfr_solver.get_policy(),
+                policy.get_uniform_policy,
+                0,
+            )
+
+    def test_summarize_deals(self):
+        """Chunks are merged into the mean and standard error across deals."""
+
+        result = head_to_head.summarize_deals([(1.0, 1.0), (3.0, 4.0)], 4, 0.5)
+
+        self.assertEqual(result.hands, 8)
+        self.assertEqual(result.mean_payoff, 1.0)
+        self.assertEqual(result.standard_error, 0.25)
+        self.assertEqual(result.hands_per_second, 16)
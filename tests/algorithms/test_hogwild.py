@@ -0,0 +1,82 @@
+"""Hogwild Tests."""
+
+import functools
+import unittest
+
+from dd_cfr.algorithms import cfr, exploitability, hogwild, policy
+from dd_cfr.games import generalized_kuhn_poker, kuhn_poker
+
+
+def get_exploitability(policy_table):
+    # Returns the exploitability of a policy table in Kuhn poker.
+    return exploitability.get_exploitability(
+        kuhn_poker.KuhnPoker, policy.TabularPolicy(policy_table)
+    )
+
+
+class TestHogwild(unittest.TestCase):
+    """Hogwild Tests."""
+
+    def test_convergence(self):
+        """Workers sharing the tables converge like the single-process solver."""
+
+        cfr_solver = cfr.CFRSolver()
+        cfr_solver.solve(kuhn_poker.KuhnPoker, 300)
+        hogwild_solver = hogwild.HogwildCFRSolver(num_workers=2)
+        hogwild_solver.solve(kuhn_poker.KuhnPoker, 2000)
+        hogwild_solver.solve(kuhn_poker.KuhnPoker, 2000)
+
+        expected = cfr_solver.get_policy()
+        actual = hogwild_solver.get_policy()
+        self.assertEqual(actual.keys(), expected.keys())
+        self.assertLess(get_exploitability(actual), 0.03)
+        self.assertLess(get_exploitability(expected), 0.03)
+
+        # Always call with a king and fold a jack facing a bet.
+        for state, action in [
+            ("KING|CHECK, BET", kuhn_poker.Action.CALL),
+            ("JACK|BET", kuhn_poker.Action.FOLD),
+        ]:
+            self.assertAlmostEqual(
+                actual[state][action], expected[state][action], delta=0.05
+            )
+
+    def test_single_worker(self):
+        """A single worker runs in process and is reproducible."""
+
+        policies = []
+        for _ in range(2):
+            solver = hogwild.HogwildCFRSolver(
+                num_workers=1, regret_matching_plus=True, seed=5
+            )
+            self.assertEqual(solver.get_policy(), {})
+            solver.solve(kuhn_poker.KuhnPoker, 500)
+            policies.append(solver.get_policy())
+
+        self.assertEqual(policies[0], policies[1])
+        self.assertLess(get_exploitability(policies[0]), 0.1)
+
+    def test_unvisited_states(self):
+        """States never reached yet are played uniformly."""
+
+        solver = hogwild.HogwildCFRSolver(num_workers=1)
+        solver.solve(
+            functools.partial(generalized_kuhn_poker.GeneralizedKuhnPoker, 5), 1
+        )
+
+        self.assertEqual(len(solver.get_policy()), 20)
+        self.assertIn(
+            {action: 0.5 for action in kuhn_poker.Action if action.value < 2},
+            list(solver.get_policy().values()),
+        )
+
+    def test_other_game(self):
+        """Solving another game of the same size starts over."""
+
+        game = functools.partial(generalized_kuhn_poker.GeneralizedKuhnPoker, 3)
+        solvers = [hogwild.HogwildCFRSolver(num_workers=1) for _ in range(2)]
+        solvers[0].solve(kuhn_poker.KuhnPoker, 100)
+        for solver in solvers:
+            solver.solve(game, 100)
+
+        self.assertEqual(solvers[0].get_policy(), solvers[1].get_policy())
@@ -0,0 +1,210 @@
+"""Local Best Response Tests."""
+
+from typing import Mapping
+import unittest
+
+from dd_cfr import common
+from dd_cfr.algorithms import cfr, exploitability, local_best_response, policy
+from dd_cfr.games import base_game, kuhn_poker
+
+
+def _bet_kings(game: base_game.Game) -> Mapping[base_game.Action, float]:
+    # Bets and calls only with a king, which never bluffs.
+    action = (
+        kuhn_poker.Action.BET
+        if kuhn_poker.Action.BET in game.get_legal_actions()
+        else kuhn_poker.Action.CALL
+    )
+    other = next(a for a in game.get_legal_actions() if a != action)
+    probability = float(game.get_state().startswith("KING"))
+    return {action: probability, other: 1 - probability}
+
+
+class _CoinAction(base_game.Action):
+    """Actions of the coin game."""
+
+    HEADS = 0
+    TAILS = 1
+    GUESS_HEADS = 2
+    GUESS_TAILS = 3
+
+
+class _CoinGame(base_game.Game):
+    """Player 2 guesses a coin, which is tossed again after tails.
+
+    Player 2 does not see the coin, but how often it was tossed.
+    """
+
+    def __init__(self, history: tuple[base_game.Action, ...] = ()) -> None:
+        """Initialize _CoinGame class.
+
+        :param history: The actions so far, defaults to none.
+        """
+        self._history = history
+
+    def get_state(self) -> str:
+        return f"{self.get_active_player()}|{len(self._history)}"
+
+    def is_terminal(self) -> bool:
+        return self._history[-1:] in [
+            (_CoinAction.GUESS_HEADS,),
+            (_CoinAction.GUESS_TAILS,),
+        ]
+
+    def get_payoffs(self) -> list[float]:
+        first = self._history[0] == _CoinAction.HEADS
+        guess = self._history[-1] == _CoinAction.GUESS_HEADS
+        return [-1.0, 1.0] if first == guess else [1.0, -1.0]
+
+    def get_legal_actions(self) -> list[base_game.Action]:
+        return list(self.get_chance_probabilities() or _CoinAction)[-2:]
+
+    def get_chance_probabilities(self) -> dict[base_game.Action, float]:
+        if self.get_active_player() != common.CHANCE_PLAYER:
+            return {}
+
+        return {_CoinAction.HEADS: 0.5, _CoinAction.TAILS: 0.5}
+
+    def get_active_player(self) -> int:
+        if self._history in [(), (_CoinAction.TAILS,)]:
+            return common.CHANCE_PLAYER
+
+        return 1
+
+    def child(self, action: base_game.Action) -> base_game.Game:
+        return _CoinGame(self._history + (action,))
+
+
+class _TossesGame(base_game.Game):
+    """Player 2 sees ten coin tosses and guesses the first one."""
+
+    def __init__(self, history: tuple[base_game.Action, ...] = ()) -> None:
+        """Initialize _TossesGame class.
+
+        :param history: The actions so far, defaults to none.
+        """
+        self._history = history
+
+    def get_state(self) -> str:
+        return "|".join(action.name for action in self._history)
+
+    def is_terminal(self) -> bool:
+        return len(self._history) == 11
+
+    def get_payoffs(self) -> list[float]:
+        first = self._history[0] == _CoinAction.HEADS
+        guess = self._history[-1] == _CoinAction.GUESS_HEADS
+        return [-1.0, 1.0] if first == guess else [1.0, -1.0]
+
+    def get_legal_actions(self) -> list[base_game.Action]:
+        return list(self.get_chance_probabilities() or _CoinAction)[-2:]
+
+    def get_chance_probabilities(self) -> dict[base_game.Action, float]:
+        if self.get_active_player() != common.CHANCE_PLAYER:
+            return {}
+
+        return {_CoinAction.HEADS: 0.5, _CoinAction.TAILS: 0.5}
+
+    def get_active_player(self) -> int:
+        return 1 if len(self._history) == 10 else common.CHANCE_PLAYER
+
+    def child(self, action: base_game.Action) -> base_game.Game:
+        return _TossesGame(self._history + (action,))
+
+
+class TestLocalBestResponse(unittest.TestCase):
+    """Local Best Response Tests."""
+
+    def test_uniform_policy(self):
+        """LBR exploits uniform play, without exceeding its exploitability."""
+
+        result = local_best_response.get_local_best_response(
+            kuhn_poker.KuhnPoker, policy.get_uniform_policy, 300
+        )
+        exact = exploitability.get_exploitability(
+            kuhn_poker.KuhnPoker, policy.get_uniform_policy
+        )
+
+        self.assertEqual(result.hands, 600)
+        self.assertGreater(result.hands_per_second, 0)
+        low, high = result.get_confidence_interval()
+        self.assertGreater(low, 0.2)
+        self.assertLess(low, exact)
+        self.assertGreater(high, result.mean_payoff)
+
+    def test_equilibrium(self):
+        """LBR gains little against an approximate equilibrium."""
+
+        cfr_solver = cfr.CFRSolver()
+        cfr_solver.solve(kuhn_poker.KuhnPoker, 300)
+        result = local_best_response.get_local_best_response(
+            kuhn_poker.KuhnPoker, policy.TabularPolicy(cfr_solver.get_policy()), 300
+        )
+
+        self.assertLess(result.get_confidence_interval()[0], 0.05)
+
+    def test_exploits_ranges(self):
+        """LBR infers the opponent's cards from their actions."""
+
+        result = local_best_response.get_local_best_response(
+            kuhn_poker.KuhnPoker, _bet_kings, 200, num_rollouts=2
+        )
+
+        self.assertGreater(result.get_confidence_interval()[0], 0)
+
+    def test_particles(self):
+        """Particles only replay histories with the same chance nodes."""
+
+        results = [
+            local_best_response.get_local_best_response(
+                _CoinGame, policy.get_uniform_policy, 100, num_particles=num_particles
+            )
+            for num_particles in (1, 10)
+        ]
+
+        # LBR infers the coin from the number of tosses, as all particles of two
+        # tosses start with tails, and wins every guess with any number of them.
+        self.assertEqual(results[0].mean_payoff, results[1].mean_payoff)
+        self.assertGreater(results[1].get_confidence_interval()[0], 0.3)
+
+    def test_no_particles(self):
+        """Without consistent particles, LBR plays the policy's action."""
+
+        result = local_best_response.get_local_best_response(
+            _TossesGame, policy.get_uniform_policy, 200, num_particles=1
+        )
+
+        # Particles rarely match all tosses, and guessing with knowledge of the
+        # actual tosses would win every hand of the second seat.
+        self.assertLess(result.get_confidence_interval()[0], 0.1)
+
+        with self.assertRaises(ValueError):
+            local_best_response.get_local_best_response(
+                _CoinGame, policy.get_uniform_policy, 100, num_particles=0
+            )
+
+    def test_no_deals(self):
+        """Evaluations need at least one deal."""
+
+        with self.assertRaises(ValueError):
+            local_best_response.get_local_best_response(
+                kuhn_poker.KuhnPoker, policy.get_uniform_policy, 0
+            )
+
+    def test_reproducible_across_processes(self):
+        """Results only depend on the seed, not on the number of processes."""
+
+        results = [
+            local_best_response.get_local_best_response(
+                kuhn_poker.KuhnPoker,
+                policy.get_uniform_policy,
+                40,
+                seed=3,
+                num_processes=num_processes,
+                chunk_size=10,
+            )
+            for num_processes in (1, 2)
+        ]
+
+        self.assertEqual(results[0].mean_payoff, results[1].mean_payoff)
+        self.assertEqual(results[0].standard_error, results[1].standard_error)
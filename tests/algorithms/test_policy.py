@@ -0,0 +1,42 @@
+"""Policy Tests."""
+
+import unittest
+
+from dd_cfr.algorithms import policy
+from dd_cfr.games import kuhn_poker
+
+
+class TestPolicy(unittest.TestCase):
+    """Policy Tests."""
+
+    def setUp(self):
+        """Deal a king to player 1 and a jack to player 2."""
+
+        self.game = kuhn_poker.KuhnPoker(
+            [kuhn_poker.ChanceAction.KING, kuhn_poker.ChanceAction.JACK]
+        )
+
+    def test_get_uniform_policy(self):
+        """All legal actions are equally likely."""
+
+        self.assertEqual(
+            policy.get_uniform_policy(self.game),
+            {kuhn_poker.Action.CHECK: 0.5, kuhn_poker.Action.BET: 0.5},
+        )
+
+    def test_tabular_policy(self):
+        """Table lookups fall back to the uniform policy."""
+
+        table = {"KING": {kuhn_poker.Action.CHECK: 0.0, kuhn_poker.Action.BET: 1.0}}
+
+        self.assertEqual(policy.TabularPolicy(table)(self.game), table["KING"])
+        self.assertEqual(
+            policy.TabularPolicy(table)(self.game.child(kuhn_poker.Action.CHECK)),
+            policy.get_uniform_policy(self.game),
+        )
+        self.assertEqual(
+            policy.TabularPolicy(table, lambda game: "KING")(
+                self.game.child(kuhn_poker.Action.CHECK)
+            ),
+            table["KING"],
+        )
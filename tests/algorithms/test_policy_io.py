@@ -0,0 +1,63 @@
+"""Policy IO Tests."""
+
+import io
+import unittest
+
+from dd_cfr.algorithms import cfr, policy_io
+from dd_cfr.games import kuhn_poker
+
+
+class TestPolicyIo(unittest.TestCase):
+    """Policy IO Tests."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Solve Kuhn poker once for all tests."""
+
+        cls.solver = cfr.CFRSolver()
+        cls.solver.solve(kuhn_poker.KuhnPoker, 10)
+
+    def test_jsonl(self):
+        """JSON lines round trip exactly."""
+
+        file = io.StringIO()
+        self.assertEqual(policy_io.write_jsonl(self.solver.iter_policy(), file), 12)
+
+        file.seek(0)
+        self.assertEqual(
+            dict(policy_io.read_jsonl(file, kuhn_poker.Action)),
+            self.solver.get_policy(),
+        )
+
+    def test_csv(self):
+        """CSV round trips exactly."""
+
+        file = io.StringIO(newline="")
+        self.assertEqual(policy_io.write_csv(self.solver.iter_policy(), file), 12)
+
+        file.seek(0)
+        self.assertEqual(
+            dict(policy_io.read_csv(file, kuhn_poker.Action)),
+            self.solver.get_policy(),
+        )
+
+        self.assertEqual(
+            list(policy_io.read_csv(io.StringIO(""), kuhn_poker.Action)),
+            [],
+        )
+
+    def test_binary(self):
+        """The binary format round trips with single precision."""
+
+        file = io.BytesIO()
+        self.assertEqual(policy_io.write_binary(self.solver.iter_policy(), file), 12)
+
+        file.seek(0)
+        policy = dict(policy_io.read_binary(file, kuhn_poker.Action))
+        self.assertEqual(policy.keys(), self.solver.get_policy().keys())
+        for state, action_probabilities in self.solver.iter_policy():
+            for action, p in action_probabilities.items():
+                self.assertAlmostEqual(policy[state][action], p, places=6)
+
+        with self.assertRaises(ValueError):
+            next(policy_io.read_binary(io.BytesIO(b"invalid"), kuhn_poker.Action))
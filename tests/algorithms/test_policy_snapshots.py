@@ -0,0 +1,130 @@
+"""Policy Snapshots Tests."""
+
+import os
+import random
+import tempfile
+import unittest
+
+from dd_cfr.algorithms import cfr, exploitability, policy_snapshots, quantization
+from dd_cfr.algorithms import policy as policy_lib
+from dd_cfr.games import kuhn_poker
+
+
+class TestPolicySnapshots(unittest.TestCase):
+    """Policy Snapshots Tests."""
+
+    def test_all_iterations(self):
+        """Keeping a snapshot of every iteration reproduces the exact average."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            snapshots = policy_snapshots.PolicySnapshots(
+                directory, 50, random.Random(0)
+            )
+            cfr_solvers = [cfr.CFRSolver(), cfr.CFRSolver(snapshots=snapshots)]
+            for cfr_solver in cfr_solvers:
+                cfr_solver.solve(kuhn_poker.KuhnPoker, 50)
+
+            self.assertEqual(snapshots.get_number_of_snapshots(), 50)
+            self.assertEqual(snapshots.get_number_of_states(), 12)
+            self.assertEqual(
+                cfr_solvers[1].get_table().get_average_policy("KING"),
+                snapshots.get_average_policy("KING"),
+            )
+            self.assertFalse(cfr_solvers[1].get_table().cumulative_policies)
+            self.assertLess(
+                quantization.get_policy_drift(
+                    cfr_solvers[1].get_policy(), cfr_solvers[0].get_policy()
+                ),
+                1e-5,
+            )
+
+    def test_sampled_iterations(self):
+        """A sample of iterations approximates the average policy."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            snapshots = policy_snapshots.PolicySnapshots(
+                directory, 20, random.Random(0)
+            )
+            cfr_solver = cfr.CFRSolver(snapshots=snapshots)
+            cfr_solver.solve(kuhn_poker.KuhnPoker, 200)
+
+            self.assertEqual(snapshots.get_number_of_snapshots(), 20)
+            self.assertEqual(len(os.listdir(directory)), 20)
+            self.assertLess(
+                exploitability.get_exploitability(
+                    kuhn_poker.KuhnPoker,
+                    policy_lib.TabularPolicy(dict(cfr_solver.iter_policy())),
+                ),
+                0.05,
+            )
+
+    def test_growing_layout(self):
+        """States missing from older snapshots read as zero contributions."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            snapshots = policy_snapshots.PolicySnapshots(directory, 2, random.Random(0))
+            policy = {kuhn_poker.Action.CHECK: 0.25, kuhn_poker.Action.BET: 0.75}
+
+            self.assertTrue(snapshots.begin_iteration())
+            snapshots.add("JACK", policy, 1.0)
+            snapshots.end_iteration()
+            self.assertTrue(snapshots.begin_iteration())
+            snapshots.add("KING", policy, 0.5)
+            snapshots.add("QUEEN", policy, 0.0)
+            snapshots.end_iteration()
+
+            self.assertEqual(snapshots.get_average_policy("KING"), policy)
+            self.assertEqual(
+                snapshots.get_average_policy("QUEEN"),
+                {kuhn_poker.Action.CHECK: 0.5, kuhn_poker.Action.BET: 0.5},
+            )
+            self.assertEqual(snapshots.get_average_policy("ACE"), {})
+
+            while snapshots.begin_iteration():
+                snapshots.end_iteration()
+            snapshots.add("ACE", policy, 1.0)
+            snapshots.end_iteration()
+            self.assertEqual(snapshots.get_number_of_states(), 3)
+
+    def test_replaced_snapshots(self):
+        """Queries read the snapshots that replaced those read before."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            snapshots = policy_snapshots.PolicySnapshots(directory, 1, random.Random(0))
+            first = {kuhn_poker.Action.CHECK: 0.25, kuhn_poker.Action.BET: 0.75}
+            second = {kuhn_poker.Action.CHECK: 1.0, kuhn_poker.Action.BET: 0.0}
+
+            self.assertTrue(snapshots.begin_iteration())
+            snapshots.add("KING", first, 1.0)
+            snapshots.end_iteration()
+            self.assertEqual(snapshots.get_average_policy("KING"), first)
+
+            while not snapshots.begin_iteration():
+                snapshots.end_iteration()
+            snapshots.add("KING", second, 1.0)
+            snapshots.end_iteration()
+            self.assertEqual(snapshots.get_average_policy("KING"), second)
+
+            snapshots.close()
+            self.assertEqual(snapshots.get_average_policy("KING"), second)
+            snapshots.close()
+
+    def test_warm_start(self):
+        """Warm starts only seed the regrets, the snapshots hold the policies."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            snapshots = policy_snapshots.PolicySnapshots(
+                directory, 10, random.Random(0)
+            )
+            cfr_solver = cfr.CFRSolver(snapshots=snapshots)
+            policy = {kuhn_poker.Action.CHECK: 0.25, kuhn_poker.Action.BET: 0.75}
+            cfr_solver.warm_start({"KING": policy}, weight=4)
+            cfr_solver.solve(kuhn_poker.KuhnPoker, 1)
+
+            self.assertFalse(cfr_solver.get_table().cumulative_policies)
+            # Later deals of the same iteration play the updated regrets.
+            self.assertAlmostEqual(
+                snapshots.get_average_policy("KING")[kuhn_poker.Action.BET],
+                0.75,
+                places=1,
+            )
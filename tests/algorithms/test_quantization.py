@@ -0,0 +1,58 @@
+"""Quantization Tests."""
+
+import unittest
+
+from dd_cfr.algorithms import cfr, quantization
+from dd_cfr.games import kuhn_poker
+
+
+class TestQuantization(unittest.TestCase):
+    """Quantization Tests."""
+
+    def test_quantized_policy(self):
+        """Quantization error is bounded by half a step."""
+
+        cfr_solver = cfr.CFRSolver()
+        cfr_solver.solve(kuhn_poker.KuhnPoker, 100)
+
+        for bits, max_drift in [(8, 0.5 / 255), (16, 0.5 / 65535)]:
+            with self.subTest(bits=bits):
+                policy = quantization.QuantizedPolicy(cfr_solver.iter_policy(), bits)
+
+                self.assertEqual(len(policy), 12)
+                self.assertLessEqual(
+                    quantization.get_policy_drift(
+                        policy.get_policy(), cfr_solver.get_policy()
+                    ),
+                    max_drift,
+                )
+
+    def test_zero_policy(self):
+        """States without probability mass stay at zero."""
+
+        policy = quantization.QuantizedPolicy(
+            [("KING", {kuhn_poker.Action.CHECK: 0.0, kuhn_poker.Action.BET: 0.0})]
+        )
+
+        self.assertEqual(
+            policy.get_average_policy("KING"),
+            {kuhn_poker.Action.CHECK: 0.0, kuhn_poker.Action.BET: 0.0},
+        )
+
+    def test_unsupported_bits(self):
+        """Only 8 and 16 bits are supported."""
+
+        with self.assertRaises(ValueError):
+            quantization.QuantizedPolicy([], bits=4)
+
+    def test_get_policy_drift(self):
+        """Drift is the largest absolute difference."""
+
+        self.assertEqual(quantization.get_policy_drift({}, {}), 0.0)
+        self.assertAlmostEqual(
+            quantization.get_policy_drift(
+                {"KING": {kuhn_poker.Action.CHECK: 0.25, kuhn_poker.Action.BET: 0.75}},
+                {"KING": {kuhn_poker.Action.CHECK: 0.5, kuhn_poker.Action.BET: 0.5}},
+            ),
+            0.25,
+        )
@@ -0,0 +1,127 @@
+"""Tiered Table Tests."""
+
+import os
+import tempfile
+import unittest
+
+from dd_cfr.algorithms import cfr, quantization, tiered_table
+from dd_cfr.games import kuhn_poker
+
+
+class TestTieredTable(unittest.TestCase):
+    """Tiered Table Tests."""
+
+    def test_spill_and_reload(self):
+        """Evicted rows are written back to disk and reloaded unchanged."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            table = tiered_table.TieredTable(
+                os.path.join(directory, "table"),
+                kuhn_poker.Action,
+                hot_capacity=2,
+                disk_capacity=2,
+            )
+            self.addCleanup(table.close)
+
+            for i in range(10):
+                table[f"state {i}"][kuhn_poker.Action.BET] += i
+            table["state 0"][kuhn_poker.Action.CHECK] += 0.5
+            table["state 9"] = {kuhn_poker.Action.FOLD: 9.0}
+
+            self.assertEqual(len(table), 10)
+            self.assertIn("state 5", table)
+            self.assertNotIn("state 10", table)
+            self.assertNotIn(5, table)
+
+            self.assertEqual(
+                table["state 0"],
+                {kuhn_poker.Action.BET: 0.0, kuhn_poker.Action.CHECK: 0.5},
+            )
+            self.assertEqual(table["state 5"], {kuhn_poker.Action.BET: 5.0})
+            self.assertEqual(table["state 9"], {kuhn_poker.Action.FOLD: 9.0})
+            table["state 0"] = {}
+            self.assertEqual(table["state 0"], {})
+
+            self.assertEqual(set(table), {f"state {i}" for i in range(10)})
+            self.assertEqual(len(table), 10)
+
+            statistics = table.get_statistics()
+            self.assertEqual(statistics.hot_rows, 2)
+            self.assertEqual(statistics.disk_rows, 10)
+            self.assertGreater(statistics.evictions, 0)
+            self.assertGreater(statistics.hits, 0)
+            self.assertLess(statistics.get_hit_rate(), 1.0)
+
+    def test_invalid_rows(self):
+        """States and rows that do not fit into a record are rejected."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            table = tiered_table.TieredTable(
+                os.path.join(directory, "table"),
+                kuhn_poker.Action,
+                max_key_length=4,
+                max_actions=1,
+            )
+            self.addCleanup(table.close)
+
+            self.assertEqual(table.get_statistics().get_hit_rate(), 0.0)
+            with self.assertRaises(ValueError):
+                table.get("too long")
+
+            table["ok"] = dict.fromkeys(kuhn_poker.Action, 0.0)
+            with self.assertRaises(ValueError):
+                table.flush()
+
+            with self.assertRaises(NotImplementedError):
+                del table["ok"]
+
+    def test_solver(self):
+        """Solving with rows spilled to disk matches solving in memory."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            tables = []
+
+            def create_table(name):
+                table = tiered_table.TieredTable(
+                    os.path.join(directory, name),
+                    kuhn_poker.Action,
+                    hot_capacity=4,
+                    precision=cfr.Precision.FLOAT32,
+                )
+                tables.append(table)
+                return table
+
+            cfr_solvers = [cfr.CFRSolver(), cfr.CFRSolver(table_factory=create_table)]
+            for cfr_solver in cfr_solvers:
+                cfr_solver.solve(kuhn_poker.KuhnPoker, 50)
+
+            self.assertEqual(cfr_solvers[1].get_table().get_number_of_states(), 12)
+            self.assertLess(
+                quantization.get_policy_drift(
+                    cfr_solvers[1].get_policy(), cfr_solvers[0].get_policy()
+                ),
+                1e-5,
+            )
+            self.assertGreater(tables[0].get_statistics().evictions, 0)
+
+            for table in tables:
+                table.close()
+
+    def test_threads(self):
+        """Threads cannot share tables whose rows may be replaced."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            tables = []
+
+            def create_table(name):
+                table = tiered_table.TieredTable(
+                    os.path.join(directory, name), kuhn_poker.Action
+                )
+                tables.append(table)
+                return table
+
+            with self.assertRaises(ValueError):
+                cfr.CFRSolver(num_threads=2, table_factory=create_table)
+
+            for table in tables:
+                table.close()
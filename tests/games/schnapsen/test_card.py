@@ -77,3 +77,22 @@ def test_Card___eq__():
 
     assert not ace_of_spades == (card.Suit.HEARTS, card.Value.ACE)
     assert ace_of_spades != (card.Suit.HEARTS, card.Value.ACE)
+
+
+# Tests for the card index helpers:
+
+
+def test_get_card_index():
+    indices = [
+        card.get_card_index(card.Card(suit, value))
+        for suit in card.Suit
+        for value in card.Value
+    ]
+
+    assert indices == list(range(card.NUMBER_OF_CARDS))
+    for index in indices:
+        assert card.get_card_index(card.get_card(index)) == index
+
+
+def test_get_suit_index():
+    assert [card.get_suit_index(suit) for suit in card.Suit] == [0, 1, 2, 3]
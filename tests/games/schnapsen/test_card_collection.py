@@ -1,3 +1,4 @@
+import itertools
 import random
 import typing
 
@@ -8,6 +9,10 @@ from dd_cfr.games.schnapsen import card, card_collection
 # Tests for the :obj:`Deck` class:
 
 
+def get_remaining_cards(deck: card_collection.Deck) -> typing.List[card.Card]:
+    return list(itertools.islice(deck._cards, deck._cursor, None))
+
+
 def assert_all_cards_exist_once(list_of_cards: typing.List[card.Card]):
     all_cards = card_collection.Deck._get_list_of_all_cards()
     assert len(all_cards) == len(list_of_cards)
@@ -82,7 +87,7 @@ def test_Deck_deal_top_card():
     deck = card_collection.Deck()
 
     for i in range(deck.get_maximum_number_of_cards()):
-        expected = deck._cards[0]
+        expected = deck._cards[deck._cursor]
         assert deck.get_number_of_cards() == deck.get_maximum_number_of_cards() - i
         assert deck.deal_top_card() == expected
 
@@ -118,6 +123,21 @@ def test_Hand___init__():
                 )
 
 
+def test_Hand_from_partial():
+    for number_of_cards in range(10):
+        deck = card_collection.Deck()
+        cards = [deck.deal_top_card() for _ in range(number_of_cards)]
+
+        if number_of_cards <= 5:
+            hand = card_collection.Hand.from_partial(cards)
+            assert [hand.get_card(i) for i in range(len(cards))] == cards
+            assert all(my_card in hand for my_card in cards)
+            assert hand.get_number_of_cards() == number_of_cards
+        else:
+            with pytest.raises(ValueError):
+                card_collection.Hand.from_partial(cards)
+
+
 def test_Hand_get_number_of_cards():
     deck = card_collection.Deck()
     hand = card_collection.Hand([deck.deal_top_card() for _ in range(5)])
@@ -208,7 +228,7 @@ def test_Hand_draw():
 
     hand.play(0)
     expected.pop(0)
-    expected.append(deck._cards[0])
+    expected.append(deck._cards[deck._cursor])
     hand.draw(deck)
 
     for i in range(5):
@@ -216,7 +236,7 @@ def test_Hand_draw():
 
     hand.play(3)
     expected.pop(3)
-    expected.append(deck._cards[0])
+    expected.append(deck._cards[deck._cursor])
     hand.draw(deck)
 
     for i in range(5):
@@ -252,7 +272,7 @@ def test_Hand___contains__():
     for my_card in initial_cards:
         assert my_card in hand
 
-    for my_card in deck._cards:
+    for my_card in get_remaining_cards(deck):
         assert my_card not in hand
 
     hand.play(3)
@@ -262,16 +282,29 @@ def test_Hand___contains__():
             continue
         assert my_card in hand
 
-    for my_card in deck._cards:
+    for my_card in get_remaining_cards(deck):
         assert my_card not in hand
 
     for _ in range(4):
         hand.play(0)
 
-    for my_card in initial_cards + deck._cards:
+    for my_card in initial_cards + get_remaining_cards(deck):
         assert my_card not in hand
 
 
+def test_Hand_get_mask():
+    deck = card_collection.Deck()
+    hand = card_collection.Hand([deck.deal_top_card() for _ in range(5)])
+
+    played = hand.play(2)
+    hand.draw(deck)
+
+    assert hand.get_mask() == sum(
+        1 << card.get_card_index(hand.get_card(i)) for i in range(5)
+    )
+    assert not hand.get_mask() & 1 << card.get_card_index(played)
+
+
 # Tests for the :obj:`WonCards` class:
 
 
@@ -341,3 +374,12 @@ def test_WonCards___contains__():
     assert card.Card(card.Suit.HEARTS, card.Value.TEN) in won_cards
     assert card.Card(card.Suit.HEARTS, card.Value.JACK) in won_cards
     assert card.Card(card.Suit.DIAMONDS, card.Value.JACK) in won_cards
+
+
+def test_WonCards_get_mask():
+    won_cards = card_collection.WonCards()
+    assert won_cards.get_mask() == 0
+
+    ten = card.Card(card.Suit.HEARTS, card.Value.TEN)
+    won_cards.add_card(ten)
+    assert won_cards.get_mask() == 1 << card.get_card_index(ten)
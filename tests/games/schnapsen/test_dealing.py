@@ -0,0 +1,51 @@
+import hashlib
+import math
+import struct
+
+from dd_cfr.games.schnapsen import card_collection, dealing
+
+NUM_CARDS = card_collection.Deck.get_maximum_number_of_cards()
+
+
+def test_DealingEngine_get_permutation():
+    engine = dealing.DealingEngine(seed=42)
+
+    permutation = engine.get_permutation(7)
+    assert sorted(permutation) == list(range(NUM_CARDS))
+    assert engine.get_permutation(7) == permutation
+    assert dealing.DealingEngine(seed=42).get_permutation(7) == permutation
+
+    assert engine.get_permutation(8) != permutation
+    assert dealing.DealingEngine(seed=43).get_permutation(7) != permutation
+
+
+def test_DealingEngine_get_permutation_rejected_hash():
+    # The first hash of game 2 with seed 0 lies above the largest multiple of 20!
+    # below 2**64, so the engine has to hash the game again.
+    digest = hashlib.blake2b(struct.pack("<QQI", 0, 2, 0), digest_size=8).digest()
+    bound = (2**64 // math.factorial(NUM_CARDS)) * math.factorial(NUM_CARDS)
+    assert int.from_bytes(digest, "little") >= bound
+
+    permutation = dealing.DealingEngine(seed=0).get_permutation(2)
+    assert sorted(permutation) == list(range(NUM_CARDS))
+    assert dealing.DealingEngine(seed=0).get_permutation(2) == permutation
+    assert dealing.DealingEngine(seed=0).get_permutation(3) != permutation
+
+
+def test_DealingEngine_get_permutations():
+    engine = dealing.DealingEngine(seed=1)
+
+    permutations = engine.get_permutations(100, 5)
+    assert len(permutations) == 5 * NUM_CARDS
+    assert permutations == b"".join(engine.get_permutation(100 + i) for i in range(5))
+
+
+def test_DealingEngine_get_deck():
+    engine = dealing.DealingEngine(seed=3)
+    deck = engine.get_deck(0)
+
+    assert deck.get_number_of_cards() == NUM_CARDS
+    expected = [card_collection.ALL_CARDS[i] for i in engine.get_permutation(0)]
+    assert deck.get_turn_up_card() == expected[-1]
+    assert [deck.deal_top_card() for _ in range(NUM_CARDS)] == expected
+    assert deck.get_number_of_cards() == 0
@@ -0,0 +1,82 @@
+import array
+
+import pytest
+
+from dd_cfr.games.schnapsen import card, card_collection, encoding, endgame, pimc
+
+
+def get_observation(player: int) -> pimc.Observation:
+    # The opponent led the queen of clubs after drawing the turn-up ten of clubs,
+    # and each player won one trick and announced a marriage.
+    hand = card_collection.Hand(list(card_collection.ALL_CARDS[:5]))
+    won_cards = [card_collection.WonCards(), card_collection.WonCards()]
+    won_cards[player].add_card(card.Card(card.Suit.SPADES, card.Value.ACE))
+    won_cards[player].add_card(card.Card(card.Suit.SPADES, card.Value.TEN))
+    won_cards[1 - player].add_card(card.Card(card.Suit.SPADES, card.Value.JACK))
+    won_cards[1 - player].add_card(card.Card(card.Suit.DIAMONDS, card.Value.JACK))
+    marriage_points = [20, 20]
+    marriage_points[player] = 40
+
+    return pimc.Observation(
+        player=player,
+        hand=hand,
+        won_cards=won_cards,
+        trump=card.Suit.CLUBS,
+        opponent_hand_size=4,
+        leader=1 - player,
+        lead=card.Card(card.Suit.CLUBS, card.Value.QUEEN),
+        known_opponent_cards=[card.Card(card.Suit.CLUBS, card.Value.TEN)],
+        marriage_points=marriage_points,
+    )
+
+
+def get_plane(row: array.array, plane: int) -> int:
+    # Returns the cards set in one plane of an encoding as a mask.
+    start = plane * card.NUMBER_OF_CARDS
+    return sum(
+        int(row[start + index]) << index for index in range(card.NUMBER_OF_CARDS)
+    )
+
+
+@pytest.mark.parametrize("player", [0, 1])
+def test_encode_observation(player: int) -> None:
+    observation = get_observation(player)
+    out = array.array("f", [-1.0] * (encoding.OBSERVATION_SIZE + 1))
+    encoding.encode_observation(observation, out, 1)
+    row = out[1:]
+
+    assert out[0] == -1.0
+    assert get_plane(row, 0) == observation.hand.get_mask()
+    assert get_plane(row, 1) == observation.won_cards[player].get_mask()
+    assert get_plane(row, 2) == observation.won_cards[1 - player].get_mask()
+    assert get_plane(row, 3) == 1 << card.get_card_index(
+        card.Card(card.Suit.CLUBS, card.Value.TEN)
+    )
+    assert get_plane(row, 4) == 1 << card.get_card_index(
+        card.Card(card.Suit.CLUBS, card.Value.QUEEN)
+    )
+
+    trump_start = 5 * card.NUMBER_OF_CARDS
+    trump_end = trump_start + len(card.Suit)
+    assert list(row[trump_start:trump_end]) == [0.0, 0.0, 0.0, 1.0]
+    assert list(row[-4:]) == pytest.approx(
+        [0.8, 0.0, 61 / endgame.WINNING_POINTS, 24 / endgame.WINNING_POINTS]
+    )
+
+
+def test_encode_observations() -> None:
+    observations = [get_observation(0), get_observation(1)]
+    batch = encoding.encode_observations(observations)
+
+    assert len(batch) == 2 * encoding.OBSERVATION_SIZE
+    size = encoding.OBSERVATION_SIZE
+    for i, observation in enumerate(observations):
+        row = array.array("f", bytes(4 * size))
+        encoding.encode_observation(observation, row)
+        start, end = i * size, (i + 1) * size
+        assert batch[start:end] == row
+
+    # Rows are overwritten entirely, e.g., the lead is cleared.
+    observations[0].lead = None
+    assert encoding.encode_observations(observations[::-1], batch) is batch
+    assert get_plane(batch[size:], 4) == 0
@@ -0,0 +1,134 @@
+import random
+import typing
+
+from dd_cfr.games.schnapsen import card, card_collection, endgame
+
+HEARTS, SPADES = card.Suit.HEARTS, card.Suit.SPADES
+
+
+def get_legal_cards(
+    hand: typing.List[card.Card], lead: card.Card, trump: card.Suit
+) -> typing.List[card.Card]:
+    same_suit = [c for c in hand if c.suit == lead.suit]
+    if same_suit:
+        higher = [c for c in same_suit if c.value > lead.value]
+        return higher or same_suit
+
+    return [c for c in hand if c.suit == trump] or hand
+
+
+def get_game_value(points, tricks, winner) -> int:
+    loser = 1 - winner
+    game_points = 3 if not tricks[loser] else 2 if points[loser] < 33 else 1
+    return game_points if winner == 0 else -game_points
+
+
+def minimax(hands, points, tricks, leader, trump) -> int:
+    # Plain minimax over whole tricks, for comparison.
+    lead_values = []
+    follower = 1 - leader
+    for lead in hands[leader]:
+        values = []
+        for response in get_legal_cards(hands[follower], lead, trump):
+            response_wins = (
+                response.suit == lead.suit and response.value > lead.value
+            ) or (response.suit == trump and lead.suit != trump)
+            winner = follower if response_wins else leader
+
+            new_hands = [list(hands[0]), list(hands[1])]
+            new_hands[leader].remove(lead)
+            new_hands[follower].remove(response)
+            new_points = list(points)
+            new_points[winner] += lead.value.get_points() + response.value.get_points()
+            new_tricks = list(tricks)
+            new_tricks[winner] = True
+
+            if new_points[winner] >= 66 or not new_hands[leader]:
+                values.append(get_game_value(new_points, new_tricks, winner))
+            else:
+                values.append(minimax(new_hands, new_points, new_tricks, winner, trump))
+
+        # The follower picks the best response to each lead.
+        lead_values.append((min if leader == 0 else max)(values))
+
+    return (max if leader == 0 else min)(lead_values)
+
+
+def test_EndgameSolver_last_trick():
+    solver = endgame.EndgameSolver(HEARTS)
+    won_cards = [card_collection.WonCards(), card_collection.WonCards()]
+    won_cards[1].add_card(card.Card(SPADES, card.Value.TEN))
+
+    hands = [
+        card_collection.Hand.from_partial([card.Card(HEARTS, card.Value.ACE)]),
+        card_collection.Hand.from_partial([card.Card(SPADES, card.Value.JACK)]),
+    ]
+
+    assert solver.solve(hands, won_cards, 0, marriage_points=(60, 30)) == 1
+    assert solver.solve(hands, won_cards, 0) == 2
+    no_tricks = [card_collection.WonCards(), card_collection.WonCards()]
+    assert solver.solve([hands[1], hands[0]], no_tricks, 1) == -3
+
+    lead = card.Card(SPADES, card.Value.JACK)
+    hands[1].play(0)
+    assert solver.get_card_values(hands, won_cards, 1, lead) == [
+        (card.Card(HEARTS, card.Value.ACE), 2)
+    ]
+
+
+def test_EndgameSolver_matches_minimax():
+    rng = random.Random(0)
+    for _ in range(20):
+        cards = rng.sample(card_collection.ALL_CARDS, 8)
+        trump = rng.choice(list(card.Suit))
+        hands = [cards[:4], cards[4:]]
+        points = [rng.randrange(0, 40), rng.randrange(0, 40)]
+        won_cards = [card_collection.WonCards(), card_collection.WonCards()]
+        leader = rng.randrange(2)
+
+        solver = endgame.EndgameSolver(trump)
+        value = solver.solve(
+            [
+                card_collection.Hand.from_partial(hands[0]),
+                card_collection.Hand.from_partial(hands[1]),
+            ],
+            won_cards,
+            leader,
+            marriage_points=points,
+        )
+        assert value == minimax(hands, points, [False, False], leader, trump)
+
+        card_values = solver.get_card_values(
+            [
+                card_collection.Hand.from_partial(hands[0]),
+                card_collection.Hand.from_partial(hands[1]),
+            ],
+            won_cards,
+            leader,
+            marriage_points=points,
+        )
+        assert (max if leader == 0 else min)(v for _, v in card_values) == value
+
+
+def test_EndgameSolver_statistics():
+    solver = endgame.EndgameSolver(SPADES)
+    assert solver.get_statistics().get_nodes_per_second() == 0.0
+    assert solver.get_statistics().get_hit_rate() == 0.0
+
+    cards = list(card_collection.ALL_CARDS)
+    hands = [
+        card_collection.Hand.from_partial(cards[0:20:2][:5]),
+        card_collection.Hand.from_partial(cards[1:20:2][:5]),
+    ]
+    won_cards = [card_collection.WonCards(), card_collection.WonCards()]
+
+    value = solver.solve(hands, won_cards, 0)
+    assert solver.solve(hands, won_cards, 0) == value
+
+    statistics = solver.get_statistics()
+    assert statistics.nodes > 1
+    assert statistics.get_nodes_per_second() > 0
+    assert 0 < statistics.get_hit_rate() < 1
+
+    solver.clear()
+    assert solver.solve(hands, won_cards, 0) == value
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from dd_cfr.games.schnapsen import card, card_collection, hand_abstraction
+
+
+def make_hand(*cards):
+    return card_collection.Hand([card.Card(suit, value) for suit, value in cards])
+
+
+STRONG_HAND = make_hand(
+    (card.Suit.HEARTS, card.Value.ACE),
+    (card.Suit.HEARTS, card.Value.TEN),
+    (card.Suit.HEARTS, card.Value.KING),
+    (card.Suit.HEARTS, card.Value.QUEEN),
+    (card.Suit.SPADES, card.Value.ACE),
+)
+
+WEAK_HAND = make_hand(
+    (card.Suit.CLUBS, card.Value.JACK),
+    (card.Suit.CLUBS, card.Value.QUEEN),
+    (card.Suit.SPADES, card.Value.JACK),
+    (card.Suit.DIAMONDS, card.Value.JACK),
+    (card.Suit.DIAMONDS, card.Value.QUEEN),
+)
+
+
+def test_get_hand_features():
+    assert hand_abstraction.get_hand_features(STRONG_HAND, card.Suit.HEARTS) == [
+        3.9,
+        4,
+        2.8,
+        3,
+        1,
+        1.0,
+    ]
+    assert hand_abstraction.get_hand_features(STRONG_HAND, card.Suit.CLUBS) == [
+        3.9,
+        0,
+        0.0,
+        3,
+        1,
+        0.0,
+    ]
+
+
+def test_HandBucketing():
+    bucketing = hand_abstraction.HandBucketing(4, random.Random(0))
+
+    with pytest.raises(ValueError):
+        bucketing.get_bucket(STRONG_HAND, card.Suit.HEARTS)
+
+    hands = []
+    for _ in range(50):
+        deck = card_collection.Deck(random.Random(len(hands)))
+        hands.append(card_collection.Hand([deck.deal_top_card() for _ in range(5)]))
+    bucketing.fit(hands + [STRONG_HAND, WEAK_HAND], card.Suit.HEARTS)
+
+    assert all(0 <= bucketing.get_bucket(hand, card.Suit.HEARTS) < 4 for hand in hands)
+    assert bucketing.get_bucket(STRONG_HAND, card.Suit.HEARTS) != bucketing.get_bucket(
+        WEAK_HAND, card.Suit.HEARTS
+    )
@@ -0,0 +1,123 @@
+import concurrent.futures
+import itertools
+import typing
+from unittest import mock
+
+import pytest
+
+from dd_cfr.games.schnapsen import card, card_collection, endgame, pimc
+
+
+def get_observation(num_unseen: int, player: int = 0) -> pimc.Observation:
+    # The player holds the first two cards and the opponent two of the last
+    # ``num_unseen`` cards, all others were won alternately by both players.
+    hand = card_collection.Hand(list(card_collection.ALL_CARDS[:5]))
+    for _ in range(3):
+        hand.play(2)
+
+    won_cards = [card_collection.WonCards(), card_collection.WonCards()]
+    end = card.NUMBER_OF_CARDS - num_unseen
+    for i, my_card in enumerate(itertools.islice(card_collection.ALL_CARDS, 2, end)):
+        won_cards[i % 2].add_card(my_card)
+
+    return pimc.Observation(
+        player=player,
+        hand=hand,
+        won_cards=won_cards,
+        trump=card.Suit.CLUBS,
+        opponent_hand_size=2,
+        leader=player,
+    )
+
+
+def get_best_cards(observation: pimc.Observation) -> typing.List[card.Card]:
+    # Solves the endgame with the opponent holding the two unseen cards.
+    opponent_hand = card_collection.Hand(list(card_collection.ALL_CARDS[-5:]))
+    for _ in range(3):
+        opponent_hand.play(0)
+    hands = [observation.hand, opponent_hand]
+    if observation.player == 1:
+        hands.reverse()
+
+    card_values = endgame.EndgameSolver(observation.trump).get_card_values(
+        hands, observation.won_cards, observation.leader
+    )
+    sign = 1 if observation.player == 0 else -1
+    best = max(sign * value for _, value in card_values)
+    return [my_card for my_card, value in card_values if sign * value == best]
+
+
+@pytest.mark.parametrize("player", [0, 1])
+def test_determined_endgame(player: int) -> None:
+    observation = get_observation(2, player)
+    decision = pimc.PIMCPlayer(num_determinizations=4, batch_size=3).choose_card(
+        observation
+    )
+
+    assert decision.choice in get_best_cards(observation)
+    assert decision.determinizations == 4
+    assert sum(votes for _, votes in decision.votes) == pytest.approx(4)
+    assert decision.votes[0][0] == decision.choice
+    assert decision.seconds >= 0
+
+
+def test_sampled_endgame() -> None:
+    observation = get_observation(6)
+    decisions = [
+        pimc.PIMCPlayer(num_determinizations=20, seed=3).choose_card(observation)
+        for _ in range(2)
+    ]
+
+    assert decisions[0].choice in card_collection.ALL_CARDS[:2]
+    assert decisions[0].determinizations == 20
+    assert decisions[0].votes == decisions[1].votes
+
+
+def test_response_with_known_cards() -> None:
+    observation = get_observation(4)
+    observation.leader = 1
+    observation.lead = card_collection.ALL_CARDS[-1]
+    observation.known_opponent_cards = [card_collection.ALL_CARDS[-2]]
+    decision = pimc.PIMCPlayer(num_determinizations=6).choose_card(observation)
+
+    assert decision.determinizations == 6
+    assert all(my_card in observation.hand for my_card, _ in decision.votes)
+
+
+def test_too_few_unseen_cards() -> None:
+    observation = get_observation(2)
+    observation.opponent_hand_size = 3
+
+    with pytest.raises(ValueError):
+        pimc.PIMCPlayer().choose_card(observation)
+
+
+def test_time_budget() -> None:
+    observation = get_observation(6)
+    player = pimc.PIMCPlayer(num_determinizations=50, batch_size=5, time_budget=0.0)
+
+    assert player.choose_card(observation).determinizations == 5
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor, mock.patch.object(
+        concurrent.futures, "wait", wraps=concurrent.futures.wait
+    ) as wait:
+        determinizations = player.choose_card(observation, executor).determinizations
+
+    assert determinizations % 5 == 0
+    assert 5 <= determinizations < 50
+    # The first batch is awaited without a timeout instead of polling for it.
+    assert wait.call_args_list[0].args[1] is None
+
+
+def test_process_pool() -> None:
+    observation = get_observation(6)
+    expected = pimc.PIMCPlayer(num_determinizations=20, seed=1).choose_card(observation)
+
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        decision = pimc.PIMCPlayer(num_determinizations=20, seed=1).choose_card(
+            observation, executor
+        )
+
+    assert decision.choice == expected.choice
+    assert decision.votes == expected.votes
+    assert decision.determinizations == 20
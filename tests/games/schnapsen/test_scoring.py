@@ -0,0 +1,27 @@
+from dd_cfr.games.schnapsen import card, card_collection, scoring
+
+
+def get_won_cards(values: list[card.Value]) -> card_collection.WonCards:
+    won_cards = card_collection.WonCards()
+    for suit, value in zip(card.Suit, values):
+        won_cards.add_card(card.Card(suit, value))
+
+    return won_cards
+
+
+def test_get_game_points():
+    assert scoring.get_game_points(card_collection.WonCards()) == 3
+    assert scoring.get_game_points(get_won_cards([card.Value.JACK])) == 2
+    assert (
+        scoring.get_game_points(
+            get_won_cards([card.Value.ACE, card.Value.ACE, card.Value.ACE])
+        )
+        == 1
+    )
+
+
+def test_get_payoffs():
+    losers = [card_collection.WonCards(), get_won_cards([card.Value.TEN])]
+
+    assert scoring.get_payoffs(1, losers[0]) == [-3.0, 3.0]
+    assert scoring.get_batch_payoffs([0, 1], losers) == [[3.0, -3.0], [-2.0, 2.0]]
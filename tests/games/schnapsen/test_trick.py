@@ -0,0 +1,22 @@
+from dd_cfr.games.schnapsen import card, trick
+
+HEARTS, SPADES = card.Suit.HEARTS, card.Suit.SPADES
+
+
+def test_get_trick_winner_same_suit():
+    ace = card.Card(HEARTS, card.Value.ACE)
+    ten = card.Card(HEARTS, card.Value.TEN)
+
+    assert trick.get_trick_winner(ten, ace, SPADES) == trick.RESPONSE
+    assert trick.get_trick_winner(ace, ten, SPADES) == trick.LEAD
+    assert trick.get_trick_winner(ace, ten, HEARTS) == trick.LEAD
+
+
+def test_get_trick_winner_different_suit():
+    ace = card.Card(HEARTS, card.Value.ACE)
+    jack = card.Card(SPADES, card.Value.JACK)
+
+    assert trick.get_trick_winner(ace, jack, SPADES) == trick.RESPONSE
+    assert trick.get_trick_winner(ace, jack, HEARTS) == trick.LEAD
+    assert trick.get_trick_winner(ace, jack, card.Suit.CLUBS) == trick.LEAD
+    assert trick.get_trick_winner(jack, ace, card.Suit.CLUBS) == trick.LEAD
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from dd_cfr.games import abstraction, kuhn_poker
+
+
+def test_HistoryCompressor_get_abstract_state():
+    game = kuhn_poker.KuhnPoker(
+        [kuhn_poker.ChanceAction.KING, kuhn_poker.ChanceAction.JACK]
+    )
+    checked = game.child(kuhn_poker.Action.CHECK)
+    bet_after_check = checked.child(kuhn_poker.Action.BET)
+
+    assert abstraction.HistoryCompressor(1).get_abstract_state(game) == "KING"
+    assert abstraction.HistoryCompressor(1).get_abstract_state(checked) == "JACK|CHECK"
+    assert (
+        abstraction.HistoryCompressor(1).get_abstract_state(bet_after_check)
+        == "KING|BET"
+    )
+    assert (
+        abstraction.HistoryCompressor(2).get_abstract_state(bet_after_check)
+        == "KING|CHECK, BET"
+    )
+    assert abstraction.HistoryCompressor(0).get_abstract_state(checked) == "JACK"
+
+
+def test_get_nearest_centroid():
+    centroids = [[0.0, 0.0], [10.0, 10.0]]
+
+    assert abstraction.get_nearest_centroid([1.0, 2.0], centroids) == 0
+    assert abstraction.get_nearest_centroid([9.0, 7.0], centroids) == 1
+
+
+def test_get_k_means_centroids():
+    points = [[0.0], [1.0], [10.0], [11.0], [20.0], [21.0]]
+
+    centroids = abstraction.get_k_means_centroids(points, 3, random.Random(0))
+    assert sorted(centroids) == [[0.5], [10.5], [20.5]]
+
+    centroids = abstraction.get_k_means_centroids(
+        points, 3, random.Random(0), iterations=0
+    )
+    assert len(centroids) == 3
+
+    # Duplicate points leave no distance to seed further clusters with:
+    centroids = abstraction.get_k_means_centroids([[1.0]] * 3, 2, random.Random(0))
+    assert centroids == [[1.0], [1.0]]
+
+    with pytest.raises(ValueError):
+        abstraction.get_k_means_centroids(points, 7, random.Random(0))
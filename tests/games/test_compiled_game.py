@@ -0,0 +1,66 @@
+import pytest
+
+from dd_cfr import common
+from dd_cfr.games import base_game, compiled_game, kuhn_poker
+
+
+def assert_same_tree(game: base_game.Game, compiled: base_game.Game) -> int:
+    assert compiled.get_active_player() == game.get_active_player()
+    assert compiled.is_terminal() == game.is_terminal()
+    assert compiled.get_deal_table() == game.get_deal_table()
+
+    if game.is_terminal():
+        assert compiled.get_state() == game.get_state()
+        assert compiled.get_payoffs() == game.get_payoffs()
+        assert not compiled.get_legal_actions()
+        return 1
+
+    if game.get_active_player() == common.CHANCE_PLAYER:
+        assert compiled.get_chance_probabilities() == game.get_chance_probabilities()
+        actions = list(game.get_chance_probabilities())
+    else:
+        assert compiled.get_state() == game.get_state()
+        actions = list(game.get_legal_actions())
+
+    assert list(compiled.get_legal_actions()) == actions
+    return 1 + sum(
+        assert_same_tree(game.child(action), compiled.child(action))
+        for action in actions
+    )
+
+
+def test_CompiledKuhnPoker_matches_KuhnPoker():
+    compiled = kuhn_poker.CompiledKuhnPoker()
+
+    number_of_states = assert_same_tree(kuhn_poker.KuhnPoker(), compiled)
+    assert (
+        number_of_states
+        == compiled_game.compile_game(kuhn_poker.KuhnPoker()).get_number_of_states()
+    )
+
+
+def test_CompiledGame_is_hashable():
+    game = kuhn_poker.CompiledKuhnPoker()
+    child = game.child(kuhn_poker.ChanceAction.KING)
+
+    assert isinstance(child, kuhn_poker.CompiledKuhnPoker)
+    assert child == kuhn_poker.CompiledKuhnPoker().child(kuhn_poker.ChanceAction.KING)
+    assert child != game.child(kuhn_poker.ChanceAction.JACK)
+    assert child != kuhn_poker.KuhnPoker()
+    assert len({game, child, kuhn_poker.CompiledKuhnPoker(state_id=0)}) == 2
+    assert child.get_state_id() != game.get_state_id() == 0
+    assert not hasattr(child, "__dict__")
+
+
+def test_CompiledGame_invalid_calls():
+    game = kuhn_poker.CompiledKuhnPoker()
+    with pytest.raises(ValueError):
+        game.get_payoffs()
+
+    for action in (kuhn_poker.ChanceAction.KING, kuhn_poker.ChanceAction.QUEEN):
+        game = game.child(action)
+    with pytest.raises(ValueError):
+        game.get_chance_probabilities()
+
+    with pytest.raises(ValueError):
+        compiled_game.compile_game(kuhn_poker.KuhnPoker(), max_states=10)
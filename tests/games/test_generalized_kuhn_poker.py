@@ -0,0 +1,37 @@
+import pytest
+
+from dd_cfr.games import generalized_kuhn_poker
+
+
+def test_GeneralizedKuhnPoker_get_chance_probabilities():
+    game = generalized_kuhn_poker.GeneralizedKuhnPoker(4)
+
+    assert game.get_chance_probabilities() == {
+        rank: 0.25 for rank in list(generalized_kuhn_poker.Rank)[:4]
+    }
+
+    child = game.child(generalized_kuhn_poker.Rank.THREE)
+    assert list(child.get_chance_probabilities()) == [
+        generalized_kuhn_poker.Rank.TWO,
+        generalized_kuhn_poker.Rank.FOUR,
+        generalized_kuhn_poker.Rank.FIVE,
+    ]
+
+
+def test_GeneralizedKuhnPoker_get_payoffs():
+    game = generalized_kuhn_poker.GeneralizedKuhnPoker()
+    game = game.child(generalized_kuhn_poker.Rank.ACE)
+    game = game.child(generalized_kuhn_poker.Rank.KING)
+
+    assert game.get_state() == "ACE"
+    for action in game.get_legal_actions()[:1] * 2:
+        game = game.child(action)
+
+    assert game.is_terminal()
+    assert game.get_payoffs() == [1, -1]
+
+
+def test_GeneralizedKuhnPoker___init__():
+    for num_cards in [2, 14]:
+        with pytest.raises(ValueError):
+            generalized_kuhn_poker.GeneralizedKuhnPoker(num_cards)
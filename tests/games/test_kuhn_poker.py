@@ -0,0 +1,145 @@
+import array
+
+import pytest
+
+from dd_cfr import common
+from dd_cfr.games import base_game, generalized_kuhn_poker, kuhn_poker
+
+
+def test_KuhnPoker_get_chance_probabilities():
+    game = kuhn_poker.KuhnPoker()
+
+    assert game.get_chance_probabilities() == {
+        card: 1 / 3 for card in kuhn_poker.ChanceAction
+    }
+    assert game.child(kuhn_poker.ChanceAction.QUEEN).get_chance_probabilities() == {
+        kuhn_poker.ChanceAction.JACK: 0.5,
+        kuhn_poker.ChanceAction.KING: 0.5,
+    }
+
+
+def test_KuhnPoker_child():
+    with pytest.raises(ValueError):
+        kuhn_poker.KuhnPoker().child(kuhn_poker.Action.CHECK)
+
+
+def test_KuhnPoker_get_deal_table():
+    game = kuhn_poker.KuhnPoker()
+    deal_table = game.get_deal_table()
+
+    assert len(deal_table) == 6
+    assert sum(probability for _, probability in deal_table) == pytest.approx(1)
+    assert {deal for deal, _ in deal_table} == {
+        (first, second)
+        for first in kuhn_poker.ChanceAction
+        for second in kuhn_poker.ChanceAction
+        if first != second
+    }
+
+    assert game.child(kuhn_poker.ChanceAction.KING).get_deal_table() is None
+
+
+@pytest.mark.parametrize(
+    "game",
+    [kuhn_poker.KuhnPoker(), generalized_kuhn_poker.GeneralizedKuhnPoker(5)],
+)
+def test_KuhnPoker_get_terminal_evaluator(game):
+    evaluator = game.get_terminal_evaluator()
+    assert game.get_terminal_evaluator() is evaluator
+
+    for deal, _ in game.get_deal_table():
+        dealt = game
+        for card in deal:
+            dealt = dealt.child(card)
+
+        for history in [
+            [kuhn_poker.Action.CHECK, kuhn_poker.Action.CHECK],
+            [kuhn_poker.Action.BET, kuhn_poker.Action.FOLD],
+            [kuhn_poker.Action.CHECK, kuhn_poker.Action.BET, kuhn_poker.Action.CALL],
+            [kuhn_poker.Action.CHECK, kuhn_poker.Action.BET, kuhn_poker.Action.FOLD],
+        ]:
+            terminal = dealt
+            for action in history:
+                terminal = terminal.child(action)
+
+            assert terminal.get_payoffs() == terminal.compute_payoffs()
+
+            assert evaluator.get_payoffs(
+                evaluator.get_deal_id(deal), evaluator.get_history_id(history)
+            ) == tuple(terminal.compute_payoffs())
+
+            history_id = evaluator.get_history_id(history)
+            deal_ids = [evaluator.get_deal_id(deal)] * 2
+            assert (
+                evaluator.get_batch_payoffs(deal_ids, history_id)
+                == [tuple(terminal.compute_payoffs())] * 2
+            )
+
+
+def test_TerminalEvaluator_get_batch_payoffs():
+    class Evaluator(base_game.TerminalEvaluator):
+        def get_payoffs(self, deal_id, history_id):
+            return [deal_id, history_id]
+
+    assert Evaluator().get_batch_payoffs([1, 2], 3) == [[1, 3], [2, 3]]
+    assert base_game.Game.get_terminal_evaluator(kuhn_poker.KuhnPoker()) is None
+
+
+def get_player_nodes(game):
+    # Yields all nodes of the game tree at which a player acts or which are terminal.
+    if game.get_active_player() != common.CHANCE_PLAYER:
+        yield game
+    if game.is_terminal():
+        return
+
+    if game.get_active_player() == common.CHANCE_PLAYER:
+        actions = list(game.get_chance_probabilities())
+    else:
+        actions = game.get_legal_actions()
+    for action in actions:
+        yield from get_player_nodes(game.child(action))
+
+
+@pytest.mark.parametrize(
+    "game",
+    [kuhn_poker.KuhnPoker(), generalized_kuhn_poker.GeneralizedKuhnPoker(5)],
+)
+def test_KuhnPoker_encode_observation(game):
+    nodes = list(get_player_nodes(game))
+    encodings = {}
+    for node in nodes:
+        out = array.array("f", [-1.0] * (node.get_observation_size() + 2))
+        node.encode_observation(out, 1)
+        assert out[0] == out[-1] == -1.0
+        # One card and one value per action of the history.
+        history = node.get_state().partition("|")[2]
+        assert sum(out[1:-1]) == 1 + (history.count(", ") + 1 if history else 0)
+        encodings.setdefault(node.get_state(), tuple(out[1:-1]))
+        assert encodings[node.get_state()] == tuple(out[1:-1])
+
+    # Nine nodes per deal, all of which show one of the dealt cards.
+    deck = {card.name for card in game.get_chance_probabilities()}
+    assert len(nodes) == 9 * len(game.get_deal_table())
+    assert {state.partition("|")[0] for state in encodings} == deck
+    assert len(encodings) == 9 * len(deck)
+
+    # Different states have different encodings.
+    assert len(set(encodings.values())) == len(encodings)
+
+    batch = base_game.encode_observations(nodes)
+    size = game.get_observation_size()
+    assert len(batch) == len(nodes) * size
+    for i, node in enumerate(nodes):
+        start, end = i * size, (i + 1) * size
+        assert tuple(batch[start:end]) == encodings[node.get_state()]
+    assert base_game.encode_observations(nodes[::-1], batch) is batch
+    assert len(base_game.encode_observations([])) == 0
+
+
+def test_Game_encode_observation():
+    game = kuhn_poker.KuhnPoker()
+
+    with pytest.raises(NotImplementedError):
+        base_game.Game.get_observation_size(game)
+    with pytest.raises(NotImplementedError):
+        base_game.Game.encode_observation(game, array.array("f"))
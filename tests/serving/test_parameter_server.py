@@ -0,0 +1,137 @@
+"""Parameter Server Tests."""
+
+import asyncio
+import contextlib
+import multiprocessing
+import socket
+import threading
+import unittest
+
+from dd_cfr.algorithms import exploitability, policy
+from dd_cfr.games import kuhn_poker
+from dd_cfr.serving import parameter_server
+
+
+@contextlib.contextmanager
+def run_shard():
+    # Runs a shard in a thread of this process and yields its address.
+    connection, shard_connection = multiprocessing.Pipe()
+    thread = threading.Thread(
+        target=parameter_server.serve_shard,
+        args=(kuhn_poker.Action, shard_connection),
+    )
+    thread.start()
+    yield "127.0.0.1", connection.recv()
+    connection.send(None)
+    thread.join()
+
+
+def _close_next_connection(server):
+    # Accepts one connection and closes it after reading a request without a body,
+    # without a response.
+    connection, _ = server.accept()
+    with connection:
+        connection.recv(5)
+
+
+class TestParameterServer(unittest.TestCase):
+    """Parameter Server Tests."""
+
+    def test_exchange(self):
+        """Updates are applied before the queries of the same round trip."""
+
+        with run_shard() as address:
+            client = parameter_server.ParameterClient([address], kuhn_poker.Action)
+            actions = [kuhn_poker.Action.CHECK, kuhn_poker.Action.BET]
+            self.assertEqual(
+                client.exchange({}, [("KING", actions)]),
+                [{kuhn_poker.Action.CHECK: 0.5, kuhn_poker.Action.BET: 0.5}],
+            )
+
+            updates = {
+                "KING": {
+                    kuhn_poker.Action.CHECK: (-1.0, 0.25),
+                    kuhn_poker.Action.BET: (3.0, 0.75),
+                }
+            }
+            self.assertEqual(
+                client.exchange(updates, [("KING", actions), ("QUEEN", actions)]),
+                [
+                    {kuhn_poker.Action.CHECK: 0.0, kuhn_poker.Action.BET: 1.0},
+                    {kuhn_poker.Action.CHECK: 0.5, kuhn_poker.Action.BET: 0.5},
+                ],
+            )
+            client.exchange(updates, [], regret_matching_plus=True)
+
+            self.assertEqual(
+                client.get_policy(),
+                {"KING": {kuhn_poker.Action.CHECK: 0.25, kuhn_poker.Action.BET: 0.75}},
+            )
+            statistics = client.get_statistics()[0]
+            self.assertEqual(statistics.requests, 5)
+            self.assertEqual(statistics.entries, 10)
+            self.assertEqual(statistics.states, 2)
+            self.assertEqual(sum(statistics.latencies.get_counts().values()), 5)
+            client.close()
+
+    def test_connection_pool(self):
+        """Connections beyond the pool size are closed after use."""
+
+        with run_shard() as address:
+            client = parameter_server.ParameterClient(
+                [address], kuhn_poker.Action, pool_size=0
+            )
+            self.assertEqual(client.get_policy(), {})
+            self.assertEqual(client.get_statistics()[0].requests, 2)
+            client.close()
+
+    def test_stop_before_start(self):
+        """Stopping a shard that never started does nothing."""
+
+        server = parameter_server.ParameterServer(kuhn_poker.Action)
+        asyncio.run(server.stop())
+
+    def test_unknown_opcode(self):
+        """Shards close connections with unknown requests."""
+
+        with run_shard() as address:
+            with socket.create_connection(address) as connection:
+                connection.sendall(b"\0\0\0\0\x7f")
+                self.assertEqual(connection.recv(1), b"")
+
+    def test_closed_connection(self):
+        """Clients raise if a shard closes the connection."""
+
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            thread = threading.Thread(target=_close_next_connection, args=(server,))
+            thread.start()
+            client = parameter_server.ParameterClient(
+                [server.getsockname()], kuhn_poker.Action
+            )
+
+            with self.assertRaises(ConnectionError):
+                client.get_policy()
+            thread.join()
+
+    def test_sharded_solve(self):
+        """Workers solve Kuhn poker on shards running as subprocesses."""
+
+        with parameter_server.start_shards(2, kuhn_poker.Action) as addresses:
+            client = parameter_server.ParameterClient(addresses, kuhn_poker.Action)
+            worker = parameter_server.TraversalWorker(client)
+            worker.solve(kuhn_poker.KuhnPoker, 300)
+
+            computed_policy = client.get_policy()
+            statistics = client.get_statistics()
+            client.close()
+
+        self.assertEqual(len(computed_policy), 12)
+        self.assertLess(
+            exploitability.get_exploitability(
+                kuhn_poker.KuhnPoker, policy.TabularPolicy(computed_policy)
+            ),
+            0.05,
+        )
+        self.assertEqual(sum(shard.states for shard in statistics), 12)
+        self.assertTrue(all(shard.entries for shard in statistics))
+        self.assertTrue(all(shard.latencies.get_quantile(0.5) for shard in statistics))
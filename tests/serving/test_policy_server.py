@@ -0,0 +1,144 @@
+"""Policy Server Tests."""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from dd_cfr.algorithms import policy_io
+from dd_cfr.games import kuhn_poker
+from dd_cfr.serving import policy_server
+
+POLICY = {
+    "KING": {kuhn_poker.Action.CHECK: 0.0, kuhn_poker.Action.BET: 1.0},
+    "JACK|BET": {kuhn_poker.Action.CALL: 0.0, kuhn_poker.Action.FOLD: 1.0},
+}
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Latency Histogram Tests."""
+
+    def test_get_quantile(self):
+        """Quantiles are bounded by the bucket containing them."""
+
+        histogram = policy_server.LatencyHistogram()
+        self.assertEqual(histogram.get_quantile(0.5), 0.0)
+
+        for _ in range(9):
+            histogram.record(0.00001)
+        histogram.record(10.0)
+
+        self.assertEqual(histogram.get_quantile(0.5), policy_server.LATENCY_BUCKETS[0])
+        self.assertEqual(histogram.get_quantile(1.0), float("inf"))
+        self.assertEqual(sum(histogram.get_counts().values()), 10)
+
+
+class TestPolicyServer(unittest.IsolatedAsyncioTestCase):
+    """Policy Server Tests."""
+
+    async def asyncSetUp(self):
+        """Start a server for a small Kuhn poker policy."""
+
+        self.server = policy_server.PolicyServer(
+            POLICY, max_batch_size=8, max_batch_delay=0.01
+        )
+        self.port = await self.server.start()
+        self.client = policy_server.PolicyClient("127.0.0.1", self.port)
+
+    async def asyncTearDown(self):
+        """Stop the server."""
+
+        await self.server.stop()
+
+    async def test_query(self):
+        """Known states are answered, unknown states are not."""
+
+        self.assertEqual(
+            await self.client.query(["KING", "JACK|BET", "QUEEN"]),
+            [{"CHECK": 0.0, "BET": 1.0}, {"CALL": 0.0, "FOLD": 1.0}, None],
+        )
+
+    async def test_batching(self):
+        """Concurrent queries from many clients share lookups."""
+
+        results = await asyncio.gather(
+            *(self.client.query(["KING"] * 10) for _ in range(10))
+        )
+
+        self.assertEqual(results, [[{"CHECK": 0.0, "BET": 1.0}] * 10] * 10)
+
+        statistics = self.server.get_statistics()
+        self.assertEqual(statistics.queries, 100)
+        self.assertLess(statistics.batches, 100)
+        self.assertGreater(statistics.queries_per_second, 0)
+        self.assertEqual(sum(statistics.latencies.get_counts().values()), 100)
+
+    async def test_malformed_query(self):
+        """Malformed queries are answered with an error."""
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(b"not json\n" + json.dumps({"id": 1}).encode() + b"\n")
+        await writer.drain()
+
+        for _ in range(2):
+            self.assertIn("error", json.loads(await reader.readline()))
+        writer.close()
+
+    async def test_non_string_state(self):
+        """Queries of non-string states are malformed and keep their id."""
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(json.dumps({"id": 1, "state": ["x"]}).encode() + b"\n")
+        await writer.drain()
+
+        self.assertEqual(
+            json.loads(await reader.readline()), {"id": 1, "error": "malformed query"}
+        )
+        writer.close()
+        self.assertEqual(
+            await self.client.query(["KING"]), [{"CHECK": 0.0, "BET": 1.0}]
+        )
+
+    async def test_from_json(self):
+        """Checkpoints are loaded from JSON files."""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "policy.json")
+            with open(path, "w", encoding="utf-8") as checkpoint:
+                json.dump({"QUEEN": {"CHECK": 1.0, "BET": 0.0}}, checkpoint)
+
+            server = policy_server.PolicyServer.from_json(path)
+            client = policy_server.PolicyClient("127.0.0.1", await server.start())
+
+            self.assertEqual(
+                await client.query(["QUEEN"]), [{"CHECK": 1.0, "BET": 0.0}]
+            )
+            self.assertEqual(server.get_statistics().queries, 1)
+            await server.stop()
+
+    async def test_from_jsonl(self):
+        """Streamed exports are loaded from JSON lines files."""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "policy.jsonl")
+            with open(path, "w", encoding="utf-8") as checkpoint:
+                policy_io.write_jsonl(POLICY.items(), checkpoint)
+
+            server = policy_server.PolicyServer.from_jsonl(path)
+            client = policy_server.PolicyClient("127.0.0.1", await server.start())
+
+            self.assertEqual(
+                await client.query(["JACK|BET"]), [{"CALL": 0.0, "FOLD": 1.0}]
+            )
+            await server.stop()
+
+    async def test_not_started(self):
+        """A server that never started answered nothing."""
+
+        server = policy_server.PolicyServer(POLICY)
+        statistics = server.get_statistics()
+        await server.stop()
+
+        self.assertEqual(statistics.queries, 0)
+        self.assertEqual(statistics.queries_per_second, 0.0)
@@ -0,0 +1,55 @@
+"""RNG Tests."""
+
+import unittest
+
+from dd_cfr import rng
+from dd_cfr.games.schnapsen import card_collection
+
+
+class TestRNG(unittest.TestCase):
+    """RNG Tests."""
+
+    def test_seed_sequence(self):
+        """Substreams are reproducible and differ by run seed and path."""
+
+        seeds = rng.SeedSequence(42)
+
+        self.assertEqual(
+            seeds.spawn("worker", 1).get_seed(),
+            rng.SeedSequence(42, ["worker"]).spawn(1).get_seed(),
+        )
+        self.assertEqual(
+            len(
+                {
+                    seeds.get_seed(),
+                    seeds.spawn("worker", 1).get_seed(),
+                    seeds.spawn("worker", "1").get_seed(),
+                    seeds.spawn("worker", 2).get_seed(),
+                    rng.SeedSequence(43).spawn("worker", 1).get_seed(),
+                }
+            ),
+            5,
+        )
+
+        decks = [
+            card_collection.Deck(seeds.spawn("game", 7).get_random()) for _ in range(2)
+        ]
+        self.assertEqual(
+            [decks[0].deal_top_card() for _ in range(20)],
+            [decks[1].deal_top_card() for _ in range(20)],
+        )
+
+    def test_random_stream(self):
+        """Batched draws match single draws."""
+
+        seeds = rng.SeedSequence(0).spawn("stream")
+        streams = [seeds.get_stream(), seeds.get_stream()]
+
+        single = [streams[0].random() for _ in range(8)]
+        self.assertEqual(streams[1].get_batch(1) + streams[1].get_batch(7), single)
+        self.assertTrue(all(0 <= value < 1 for value in single))
+
+        for _ in range(20):
+            self.assertIn(streams[0].randrange(3), range(3))
+            self.assertEqual(streams[0].choose([0.0, 1.0, 0.0]), 1)
+            self.assertEqual(streams[0].choose_cumulative([0.0, 1.0, 1.0]), 1)